@@ -2,6 +2,7 @@ from ..engine.player import Item
 from typing import List, Optional
 from ..engine.generics import BaseUI
 from ..config.game_config import GameConfig
+from ..engine.core.event_bus import EventBus, EventType
 
 class CombatLogUI(BaseUI):
     def __init__(self, screen, font):
@@ -22,12 +23,9 @@ class CombatLogUI(BaseUI):
         self.fade_timers[len(self.messages) - 1] = self.fade_duration
 
     def add_loot_message(self, items: Optional[List[Item]], gold: int):
-        print("\n=== Adding Loot Message ===")
-        print(f"Items: {[item.name for item in items] if items else 'None'}")
-        print(f"Gold: {gold}")
-    
+        EventBus().publish(EventType.LOOT, gold=gold, items=tuple(item.name for item in items or ()))
+
         if not items and gold <= 0:
-            print("No loot to display")
             return
         
         parts = []
@@ -42,7 +40,6 @@ class CombatLogUI(BaseUI):
                 parts[-1] = f"{', '.join(item_names[:-1])} and {item_names[-1]}"
             
         loot_msg = f"Obtained: {' '.join(parts)}"
-        print(f"Final message: {loot_msg}")
         self.add_message(loot_msg)
 
     def update(self):
@@ -2,12 +2,13 @@ import pygame
 from ..combat.entity import Entity
 from ..engine.generics import BaseUI
 from ..config.game_config import GameConfig
+from ..engine.core.font_service import FontService
 
 class CombatUI(BaseUI):
     def __init__(self, screen):
         super().__init__(screen)
-        self.font = pygame.font.SysFont(None, 32)
-        self.large_font = pygame.font.SysFont(None, 48)
+        self.font = FontService().get(None, 32)
+        self.large_font = FontService().get(None, 48)
         self.selected_action = 0
         self.actions = ["Attack", "Magic", "Item", "Run"]
         self.combat_log = []
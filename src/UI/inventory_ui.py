@@ -2,7 +2,9 @@
 from typing import Optional, Tuple
 from ..engine.generics import RandomUtils
 from ..config.game_config import GameConfig
-from ..engine.player import Player, ItemType, Item
+from ..engine.player import Player, ItemType, Item, InventoryIndex
+from ..engine.core.font_service import FontService
+from ..engine.core.event_bus import EventBus, EventType
 
 class InventoryUI:
     def __init__(self, screen: pygame.Surface, combat_log=None):
@@ -17,20 +19,11 @@ class InventoryUI:
         self.drag_start_pos = None
         self._init_item_symbols()
         self._init_quality_colors()
+        self._init_view()
 
     def hide(self):
         self.visible = False
 
-    def sell_item(self, player: Player, item: Item) -> None:
-        sell_value = (item.quality + 1) * 10 + RandomUtils.int(5, 15)
-        player.inventory.gold += sell_value
-    
-        if item in player.inventory.items:
-            player.inventory.items.remove(item)
-        
-        if self.combat_log:
-            self.combat_log.add_message(f"Sold {item.name} for {sell_value} gold")
-
     def _init_item_symbols(self):
         self.item_symbols = {
             ItemType.WEAPON: "†",
@@ -53,9 +46,9 @@ class InventoryUI:
         ]
 
     def _init_fonts(self):
-        self.font = pygame.font.SysFont(None, 32)
-        self.large_font = pygame.font.SysFont(None, 48)
-        self.small_font = pygame.font.SysFont(None, 24)
+        self.font = FontService().get(None, 32)
+        self.large_font = FontService().get(None, 48)
+        self.small_font = FontService().get(None, 24)
 
     def _init_layout(self):
         self.slot_size = 60
@@ -72,9 +65,25 @@ class InventoryUI:
         self._init_ring_slots()
         self._init_inventory_grid()
 
+    def _init_view(self):
+        # Virtualized backpack view: only the visible rows are ever drawn
+        self.scroll_row = 0
+        self.sort_options = (None,) + InventoryIndex.SORT_KEYS
+        self.type_filters = (None,) + tuple(t for t in ItemType if t in self.item_symbols)
+        self.quality_filters = (None,) + tuple(range(len(self.quality_colors)))
+        self.stat_filters = (None,) + InventoryIndex.STAT_NAMES
+        self.sort_index = 0
+        self.type_filter_index = 0
+        self.quality_filter_index = 0
+        self.stat_filter_index = 0
+        self._view = []
+        self._view_key = None
+
     def _init_equipment_slots(self):
         equip_start_x = self.window_x + 460
         equip_start_y = self.window_y + 45
+        self.equip_pitch = 70
+        self.equip_origin = (equip_start_x - 140, equip_start_y)
         self.equipment_slots = {
             ItemType.WEAPON: pygame.Rect(equip_start_x - 140, equip_start_y + 70, self.slot_size, self.slot_size),
             ItemType.HELMET: pygame.Rect(equip_start_x, equip_start_y, self.slot_size, self.slot_size),
@@ -84,10 +93,18 @@ class InventoryUI:
             ItemType.LEGS: pygame.Rect(equip_start_x, equip_start_y + 140, self.slot_size, self.slot_size),
             ItemType.FEET: pygame.Rect(equip_start_x, equip_start_y + 210, self.slot_size, self.slot_size)
         }
+        # Every equipment slot sits on a 70px lattice, so hit-testing is a dict lookup
+        self.equipment_cells = {
+            ((rect.x - self.equip_origin[0]) // self.equip_pitch,
+             (rect.y - self.equip_origin[1]) // self.equip_pitch): slot_type
+            for slot_type, rect in self.equipment_slots.items()
+        }
 
     def _init_ring_slots(self):
         ring_start_x = self.window_x + 605
         ring_start_y = self.window_y + 5
+        self.ring_origin = (ring_start_x, ring_start_y)
+        self.ring_cols, self.ring_rows = 2, 5
         self.ring_slots = []
         for i in range(10):
             x = ring_start_x + (i % 2) * (self.slot_size + 5)
@@ -96,6 +113,8 @@ class InventoryUI:
 
     def _init_inventory_grid(self):
         cols, rows = 11, 4
+        self.grid_cols, self.grid_rows = cols, rows
+        self.grid_origin = (self.window_x + 20, self.window_y + 330)
         self.inventory_slots = []
         for row in range(rows):
             for col in range(cols):
@@ -109,6 +128,107 @@ class InventoryUI:
         self.hovered_item = None
         self.dragging = False
 
+    @staticmethod
+    def _cell_at(pos: Tuple[int, int], origin: Tuple[int, int], pitch: int, size: int,
+                 cols: int, rows: int) -> Optional[Tuple[int, int]]:
+        """Map a screen position to a (col, row) grid cell, or None if it lands in a gap."""
+        dx, dy = pos[0] - origin[0], pos[1] - origin[1]
+        if dx < 0 or dy < 0:
+            return None
+        col, off_x = divmod(dx, pitch)
+        row, off_y = divmod(dy, pitch)
+        if col >= cols or row >= rows or off_x >= size or off_y >= size:
+            return None
+        return col, row
+
+    def _equipment_slot_at(self, pos: Tuple[int, int]) -> Optional[ItemType]:
+        cell = self._cell_at(pos, self.equip_origin, self.equip_pitch, self.slot_size, 4, 4)
+        return self.equipment_cells.get(cell) if cell else None
+
+    def _ring_slot_at(self, pos: Tuple[int, int]) -> Optional[int]:
+        cell = self._cell_at(pos, self.ring_origin, self.slot_size + 5, self.slot_size,
+                             self.ring_cols, self.ring_rows)
+        return cell[1] * self.ring_cols + cell[0] if cell else None
+
+    def _grid_item_at(self, player: Player, pos: Tuple[int, int]) -> Optional[Item]:
+        cell = self._cell_at(pos, self.grid_origin, self.slot_size + 5, self.slot_size,
+                             self.grid_cols, self.grid_rows)
+        if not cell:
+            return None
+        view = self.get_view(player)
+        index = (self.scroll_row + cell[1]) * self.grid_cols + cell[0]
+        return view[index] if index < len(view) else None
+
+    def get_view(self, player: Player) -> list:
+        """Current sorted/filtered backpack, rebuilt only when inventory or view options change."""
+        inventory = player.inventory
+        key = (id(inventory), inventory.version, self.sort_index, self.type_filter_index,
+               self.quality_filter_index, self.stat_filter_index)
+        if key != self._view_key:
+            self._view = inventory.query(
+                item_type=self.type_filters[self.type_filter_index],
+                quality=self.quality_filters[self.quality_filter_index],
+                stat=self.stat_filters[self.stat_filter_index],
+                sort_by=self.sort_options[self.sort_index]
+            )
+            self._view_key = key
+            self._clamp_scroll()
+        return self._view
+
+    def _max_scroll_row(self) -> int:
+        total_rows = -(-len(self._view) // self.grid_cols)
+        return max(0, total_rows - self.grid_rows)
+
+    def _clamp_scroll(self):
+        self.scroll_row = max(0, min(self.scroll_row, self._max_scroll_row()))
+
+    def handle_scroll(self, player: Player, rows: int):
+        """Scroll the backpack grid by whole rows (positive scrolls towards the top)."""
+        if not self.visible:
+            return
+        self.get_view(player)
+        self.scroll_row -= rows
+        self._clamp_scroll()
+        self.hovered_item = None
+
+    def change_page(self, player: Player, pages: int):
+        self.handle_scroll(player, -pages * self.grid_rows)
+
+    def cycle_sort(self):
+        self.sort_index = (self.sort_index + 1) % len(self.sort_options)
+        self.scroll_row = 0
+
+    def cycle_type_filter(self):
+        self.type_filter_index = (self.type_filter_index + 1) % len(self.type_filters)
+        self.scroll_row = 0
+
+    def cycle_quality_filter(self):
+        self.quality_filter_index = (self.quality_filter_index + 1) % len(self.quality_filters)
+        self.scroll_row = 0
+
+    def cycle_stat_filter(self):
+        self.stat_filter_index = (self.stat_filter_index + 1) % len(self.stat_filters)
+        self.scroll_row = 0
+
+    def draw_view_info(self, player: Player):
+        view = self.get_view(player)
+        pages = max(1, -(-len(view) // (self.grid_cols * self.grid_rows)))
+        page = min(pages, self.scroll_row // self.grid_rows + 1)
+        sort_key = self.sort_options[self.sort_index]
+        item_type = self.type_filters[self.type_filter_index]
+        quality = self.quality_filters[self.quality_filter_index]
+        stat = self.stat_filters[self.stat_filter_index]
+
+        filters = [f.name.title() if isinstance(f, ItemType) else str(f)
+                   for f in (item_type, quality, stat) if f is not None]
+        lines = [
+            f"Page {page}/{pages}  ({len(view)} items)",
+            f"Sort: {(sort_key or 'none').replace('_', ' ')}  Filter: {', '.join(filters) or 'all'}"
+        ]
+        for i, line in enumerate(lines):
+            text = self.small_font.render(line, True, GameConfig.WHITE)
+            self.screen.blit(text, (self.window_x + 20, self.window_y + 8 + i * 18))
+
     def draw_item(self, item: Optional[Item], rect: pygame.Rect):
         color = (100, 100, 100) if item else (50, 50, 50)
         pygame.draw.rect(self.screen, color, rect)
@@ -206,7 +326,7 @@ class InventoryUI:
             f"Type: {self.hovered_item.item_type.name}"
         ]
         
-        for stat_name, value in self.hovered_item.stats.__dict__.items():
+        for stat_name, value in self.hovered_item.stats.items():
             if value > 0:
                 lines.append(f"{stat_name.replace('_', ' ').title()}: +{value}")
             
@@ -250,10 +370,14 @@ class InventoryUI:
                 item = player.inventory.rings[i] if i < len(player.inventory.rings) else None
                 self.draw_item(item, rect)
             
-            # Draw inventory grid
+            # Draw inventory grid (only the visible window of the view)
+            view = self.get_view(player)
+            first = self.scroll_row * self.grid_cols
             for i, rect in enumerate(self.inventory_slots):
-                item = player.inventory.items[i] if i < len(player.inventory.items) else None
+                index = first + i
+                item = view[index] if index < len(view) else None
                 self.draw_item(item, rect)
+            self.draw_view_info(player)
             
             if self.hovered_item:
                 self.draw_item_info()
@@ -272,59 +396,52 @@ class InventoryUI:
         if not self.visible:
             return False
 
-        print(f"\n=== Handling Inventory Click ===")
-        print(f"{'Mouse down' if is_down else 'Mouse up'} at {pos}")
-        print(f"Current state: dragging={self.dragging}, selected_item={self.selected_item.name if self.selected_item else None}")
-
         if is_down:
-            print("Processing mouse down...")
             if not self.dragging:  # Only select item if not already dragging
                 self.dragging = True
                 self.drag_start_pos = pos
                 # Check equipment slots first
-                for slot_type, rect in self.equipment_slots.items():
-                    if rect.collidepoint(pos):
-                        self.selected_item = player.inventory.equipped.get(slot_type)
-                        return True
+                slot_type = self._equipment_slot_at(pos)
+                if slot_type:
+                    self.selected_item = player.inventory.equipped.get(slot_type)
+                    if self.selected_item:
+                        EventBus().publish(EventType.ITEM_SELECTED, item=self.selected_item.name,
+                                           source=slot_type.name)
+                    return True
 
                 # Then check ring slots
-                for i, rect in enumerate(self.ring_slots):
-                    if rect.collidepoint(pos):
-                        self.selected_item = player.inventory.rings[i]
-                        return True
+                ring_slot = self._ring_slot_at(pos)
+                if ring_slot is not None:
+                    self.selected_item = player.inventory.rings[ring_slot]
+                    if self.selected_item:
+                        EventBus().publish(EventType.ITEM_SELECTED, item=self.selected_item.name,
+                                           source=f"ring slot {ring_slot}")
+                    return True
 
                 # Finally check inventory slots
-                for i, rect in enumerate(self.inventory_slots):
-                    if rect.collidepoint(pos) and i < len(player.inventory.items):
-                        self.selected_item = player.inventory.items[i]
-                        print(f"Selected inventory item: {self.selected_item.name}")
-                        return True
+                item = self._grid_item_at(player, pos)
+                if item:
+                    self.selected_item = item
+                    EventBus().publish(EventType.ITEM_SELECTED, item=item.name, source="inventory")
+                    return True
         else:  # Mouse up
-            print("Processing mouse up...")
             if self.dragging and self.selected_item:
-                print(f"Attempting to drop {self.selected_item.name}")
-            
                 # Check if dropping outside inventory window
                 if (pos[0] < self.window_x or pos[0] > self.window_x + self.window_width or
                     pos[1] < self.window_y or pos[1] > self.window_y + self.window_height):
-                    print("Dropping outside inventory - selling item")
                     self.sell_item(player, self.selected_item)
                 else:
                     # Check equipment slots
-                    for slot_type, rect in self.equipment_slots.items():
-                        if rect.collidepoint(pos):
-                            print(f"Dropping on equipment slot {slot_type.name}")
-                            if self.selected_item.item_type == slot_type:
-                                self.equip_item(player, slot_type)
-                                break
+                    slot_type = self._equipment_slot_at(pos)
+                    if slot_type:
+                        if self.selected_item.item_type == slot_type:
+                            self.equip_item(player, slot_type)
 
                     # Check ring slots
-                    for i, rect in enumerate(self.ring_slots):
-                        if rect.collidepoint(pos):
-                            print(f"Dropping on ring slot {i}")
-                            if self.selected_item.item_type == ItemType.RING:
-                                self.equip_ring(player, i)
-                                break
+                    ring_slot = self._ring_slot_at(pos)
+                    if ring_slot is not None:
+                        if self.selected_item.item_type == ItemType.RING:
+                            self.equip_ring(player, ring_slot)
 
             self.dragging = False
             self.selected_item = None
@@ -339,66 +456,76 @@ class InventoryUI:
         self.hovered_item = None
 
         # Check equipment slots
-        for slot_type, rect in self.equipment_slots.items():
-            if rect.collidepoint(pos):
-                self.hovered_item = player.inventory.equipped.get(slot_type)
-                return
+        slot_type = self._equipment_slot_at(pos)
+        if slot_type:
+            self.hovered_item = player.inventory.equipped.get(slot_type)
+            return
 
         # Check ring slots
-        for i, rect in enumerate(self.ring_slots):
-            if rect.collidepoint(pos) and i < len(player.inventory.rings):
-                self.hovered_item = player.inventory.rings[i]
-                return
+        ring_slot = self._ring_slot_at(pos)
+        if ring_slot is not None:
+            self.hovered_item = player.inventory.rings[ring_slot]
+            return
 
         # Check inventory slots
-        for i, rect in enumerate(self.inventory_slots):
-            if rect.collidepoint(pos) and i < len(player.inventory.items):
-                self.hovered_item = player.inventory.items[i]
-                return
+        self.hovered_item = self._grid_item_at(player, pos)
+
+    def _take_item(self, player: Player, item: Item) -> bool:
+        """Take item out of the backpack, or out of the slot it is equipped in."""
+        if player.inventory.remove_item(item):
+            return True
+        inventory = player.inventory
+        if item.item_type == ItemType.RING:
+            for slot, ring in enumerate(inventory.rings):
+                if ring is item:
+                    inventory.unequip(ItemType.RING, slot)
+                    return True
+        elif inventory.equipped.get(item.item_type) is item:
+            inventory.unequip(item.item_type)
+            return True
+        return False
 
     def equip_item(self, player: Player, slot_type: ItemType) -> None:
-        print(f"Attempting to equip {self.selected_item.name} to {slot_type.name}")
         if self.selected_item and self.selected_item.item_type == slot_type:
-            # Remove from current equipped slot if something is there
             old_item = player.inventory.equipped.get(slot_type)
+            if old_item is self.selected_item or not self._take_item(player, self.selected_item):
+                return
+
+            # Remove from current equipped slot if something is there
             if old_item:
-                print(f"Unequipping {old_item.name}")
-                player.inventory.items.append(old_item)
+                player.inventory.add_item(old_item)
+                EventBus().publish(EventType.ITEM_MOVED, item=old_item.name, target="inventory")
         
-            # Remove from inventory and equip
-            player.inventory.items.remove(self.selected_item)
-            player.inventory.equipped[slot_type] = self.selected_item
-            print(f"Equipped {self.selected_item.name}")
+            player.inventory.equip(self.selected_item)
+            EventBus().publish(EventType.ITEM_MOVED, item=self.selected_item.name, target=slot_type.name)
         
             if self.combat_log:
                 self.combat_log.add_message(f"Equipped {self.selected_item.name}")
 
     def equip_ring(self, player: Player, slot: int) -> None:
-        print(f"Attempting to equip ring {self.selected_item.name} to slot {slot}")
         if self.selected_item and self.selected_item.item_type == ItemType.RING:
+            # Take the ring out of the backpack or its old ring slot first
+            if player.inventory.rings[slot] is self.selected_item or not self._take_item(player, self.selected_item):
+                return
+
             # Remove from current ring slot if something is there
             old_item = player.inventory.rings[slot]
             if old_item:
-                print(f"Unequipping ring {old_item.name}")
-                player.inventory.items.append(old_item)
+                player.inventory.add_item(old_item)
+                EventBus().publish(EventType.ITEM_MOVED, item=old_item.name, target="inventory")
         
-            # Remove from inventory and equip
-            player.inventory.items.remove(self.selected_item)
-            player.inventory.rings[slot] = self.selected_item
-            print(f"Equipped ring {self.selected_item.name}")
+            player.inventory.equip(self.selected_item, slot)
+            EventBus().publish(EventType.ITEM_MOVED, item=self.selected_item.name, target=f"ring slot {slot}")
         
             if self.combat_log:
                 self.combat_log.add_message(f"Equipped {self.selected_item.name}")
 
     def sell_item(self, player: Player, item: Item) -> None:
-        print(f"Attempting to sell {item.name}")
+        if not self._take_item(player, item):
+            return
         sell_value = (item.quality + 1) * 10 + RandomUtils.int(5, 15)
         player.inventory.gold += sell_value
-    
-        # Remove from inventory
-        if item in player.inventory.items:
-            player.inventory.items.remove(item)
         
-        print(f"Sold {item.name} for {sell_value} gold")
+        EventBus().publish(EventType.ITEM_SOLD, item=item.name, gold=sell_value)
         if self.combat_log:
             self.combat_log.add_message(f"Sold {item.name} for {sell_value} gold")
\ No newline at end of file
@@ -1,4 +1,5 @@
 import pygame
+from .overlay_pool import OverlayPool
 from ..engine.generics import BaseUI
 from ..config.game_config import GameConfig
 
@@ -34,10 +35,8 @@ class LevelUpUI(BaseUI):
             return
 
         # Draw semi-transparent background
-        surface = pygame.Surface(self.screen.get_size())
-        surface.fill(GameConfig.BLACK)
-        surface.set_alpha(128)
-        self.screen.blit(surface, (0, 0))
+        overlay = OverlayPool().get(self.screen.get_size(), GameConfig.BLACK, 128)
+        self.screen.blit(overlay, (0, 0))
 
         # Draw level up menu
         title = self.font.render(
@@ -74,10 +73,8 @@ class LevelUpUI(BaseUI):
             return
 
         # Draw semi-transparent background
-        surface = pygame.Surface(self.screen.get_size())
-        surface.fill(GameConfig.BLACK)
-        surface.set_alpha(128)
-        self.screen.blit(surface, (0, 0))
+        overlay = OverlayPool().get(self.screen.get_size(), GameConfig.BLACK, 128)
+        self.screen.blit(overlay, (0, 0))
 
         # Draw level up menu
         title = self.font.render(f"Level Up!", True, GameConfig.WHITE)
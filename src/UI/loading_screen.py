@@ -1,10 +1,11 @@
 import pygame
 from ..config.game_config import GameConfig
+from ..engine.core.font_service import FontService
 
 class LoadingScreen:
     def __init__(self, screen):
         self.screen = screen
-        self.font = pygame.font.SysFont(None, 48)
+        self.font = FontService().get(None, 48)
         self._progress = 0
         self._message = ""
 
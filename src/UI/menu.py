@@ -1,21 +1,40 @@
+import time
 import pygame
 from ..engine.generics import BaseUI
 from ..config.game_config import GameConfig
 from ..engine.generics import save_game_data, load_game_data
+from ..engine.core.save_service import SaveMetadataService
+from ..engine.core.font_service import FontService
 
 class Menu(BaseUI):
     def __init__(self, screen):
         super().__init__(screen)
-        self.font = pygame.font.SysFont(None, 74)
-        self.small_font = pygame.font.SysFont(None, 54)
+        self.font = FontService().get(None, 74)
+        self.small_font = FontService().get(None, 54)
         self.title = self.font.render("Adventure!", True, GameConfig.WHITE)
         self.new_game = self.small_font.render("New Game", True, GameConfig.WHITE)
         self.continue_game = self.small_font.render("Continue Game", True, GameConfig.WHITE)
+        self.details_font = FontService().get(None, 32)
         self.selected = 0
         self.visible = True
+        self.save_metadata = SaveMetadataService()
+        self._details_key = None
+        self._details = None
 
     def has_save(self):
-        return load_game_data() is not None
+        return self.save_metadata.has_save()
+
+    def _save_details(self, info):
+        """Rendered 'Level N at (x, y)' line, re-rendered only when the save changes."""
+        if info is None or info.summary is None:
+            return None
+        if self._details_key != info:
+            summary = info.summary
+            saved_at = time.strftime("%Y-%m-%d %H:%M", time.localtime(info.mtime))
+            text = f"Level {summary['level']} at ({summary['x']}, {summary['y']}) - saved {saved_at}"
+            self._details = self.details_font.render(text, True, (150, 150, 150))
+            self._details_key = info
+        return self._details
 
     def save_game(self, player_x, player_y):
         save_game_data({'x': player_x, 'y': player_y})
@@ -42,10 +61,16 @@ class Menu(BaseUI):
         new_game_rect = new_game.get_rect(centerx=self.screen.get_width()//2, y=300)
         self.screen.blit(new_game, new_game_rect)
         
-        if self.has_save():
+        info = self.save_metadata.get()
+        if info is not None:
             continue_game = self.small_font.render("Continue Game", True, continue_color)
             continue_rect = continue_game.get_rect(centerx=self.screen.get_width()//2, y=400)
             self.screen.blit(continue_game, continue_rect)
+
+            details = self._save_details(info)
+            if details:
+                details_rect = details.get_rect(centerx=self.screen.get_width()//2, y=continue_rect.bottom + 10)
+                self.screen.blit(details, details_rect)
         
         pygame.display.flip()
 
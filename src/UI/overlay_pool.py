@@ -0,0 +1,65 @@
+import pygame
+from typing import Dict, Tuple
+
+class OverlayPool:
+    """
+    Shared pool of full-screen dimming layers for modal UIs.
+
+    Each (size, color, alpha) layer is allocated once and reused every frame.
+    Layers are only dropped and reallocated when the screen size changes.
+    """
+
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+        return cls._instance
+
+    def __init__(self):
+        if not hasattr(self, 'initialized'):
+            self.initialized = True
+            self._surfaces: Dict[Tuple, pygame.Surface] = {}
+            self.requests = 0
+            self.allocations = 0
+            self.bytes_requested = 0
+            self.bytes_allocated = 0
+
+    def get(self, size: Tuple[int, int], color: Tuple[int, int, int], alpha: int) -> pygame.Surface:
+        """Return a filled, alpha-blended layer of the given size."""
+        key = (tuple(size), tuple(color), alpha)
+        surface = self._surfaces.get(key)
+        if surface is None:
+            surface = pygame.Surface(key[0])
+            surface.fill(color)
+            surface.set_alpha(alpha)
+            self._surfaces[key] = surface
+            self.allocations += 1
+            self.bytes_allocated += self._size_of(surface)
+
+        self.requests += 1
+        self.bytes_requested += self._size_of(surface)
+        return surface
+
+    def resize(self, size: Tuple[int, int]) -> None:
+        """Drop layers that no longer match the screen size."""
+        size = tuple(size)
+        self._surfaces = {key: surface for key, surface in self._surfaces.items() if key[0] == size}
+
+    @staticmethod
+    def _size_of(surface: pygame.Surface) -> int:
+        return surface.get_pitch() * surface.get_height()
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "requests": self.requests,
+            "allocations": self.allocations,
+            "live_surfaces": len(self._surfaces),
+            "bytes_allocated": self.bytes_allocated,
+            "bytes_saved": self.bytes_requested - self.bytes_allocated,
+        }
+
+    def report(self) -> str:
+        stats = self.stats()
+        return (f"Overlay pool: {stats['allocations']} allocations for {stats['requests']} requests, "
+                f"{stats['bytes_saved'] / (1024 * 1024):.1f} MB of per-frame allocations avoided")
@@ -0,0 +1,56 @@
+import pygame
+from ..engine.generics import BaseUI
+from ..config.game_config import GameConfig
+from ..engine.core.font_service import FontService
+
+class ProfilerUI(BaseUI):
+    """Debug overlay with rolling stage timings and a frame-time graph."""
+
+    def __init__(self, screen):
+        super().__init__(screen)
+        self.font = FontService().get(None, 20)
+        self.width = 360
+        self.line_height = 16
+        self.graph_height = 60
+        self.budget_ms = 1000 / GameConfig.FPS if GameConfig.FPS else 1000 / 60
+
+    def render(self, profiler):
+        if not profiler.enabled:
+            return
+
+        summary = profiler.summary()
+        x = self.screen.get_width() - self.width - 10
+        y = 10
+        height = (len(summary) + 1) * self.line_height + self.graph_height + 20
+
+        panel = pygame.Rect(x, y, self.width, height)
+        pygame.draw.rect(self.screen, (0, 0, 0), panel)
+        pygame.draw.rect(self.screen, (80, 80, 80), panel, 1)
+
+        self._draw_row(("stage", "p50 ms", "p99 ms"), x, y + 6, (200, 200, 200))
+        for i, (name, stats) in enumerate(summary.items()):
+            color = (255, 80, 80) if stats["p99"] > self.budget_ms else GameConfig.WHITE
+            row = (name, f"{stats['p50']:.2f}", f"{stats['p99']:.2f}")
+            self._draw_row(row, x, y + 6 + (i + 1) * self.line_height, color)
+
+        self._draw_graph(profiler, x + 8, panel.bottom - self.graph_height - 6, self.width - 16)
+
+    def _draw_row(self, cells: tuple, x: int, y: int, color):
+        for cell, column_x in zip(cells, (8, 220, 290)):
+            text = self.font.render(cell, True, color)
+            self.screen.blit(text, (x + column_x, y))
+
+    def _draw_graph(self, profiler, x: int, y: int, width: int):
+        """One bar per recorded frame, scaled so the frame budget sits at half height."""
+        frames = profiler.frames.values()[-width:]
+        scale = (self.graph_height / 2) / self.budget_ms
+        bottom = y + self.graph_height
+
+        pygame.draw.rect(self.screen, (25, 25, 25), (x, y, width, self.graph_height))
+        for i, frame_ms in enumerate(frames):
+            bar = min(self.graph_height, int(frame_ms * scale))
+            color = (255, 80, 80) if frame_ms > self.budget_ms else (80, 200, 80)
+            pygame.draw.line(self.screen, color, (x + i, bottom), (x + i, bottom - bar))
+
+        budget_y = bottom - int(self.budget_ms * scale)
+        pygame.draw.line(self.screen, (200, 200, 0), (x, budget_y), (x + width, budget_y))
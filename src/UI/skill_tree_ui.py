@@ -1,16 +1,19 @@
 import pygame
-from typing import Optional, Tuple
+from typing import Dict, Optional, Tuple
+from .overlay_pool import OverlayPool
 from ..engine.generics import BaseUI
 from ..config.game_config import GameConfig
 from ..combat.skill_tree import SkillTree, SkillTreeNode, SkillBranch
+from ..engine.core.font_service import FontService
+from ..engine.core.event_bus import EventBus, EventType
 
 class SkillTreeUI(BaseUI):
     def __init__(self, screen):
         super().__init__(screen)
         self.selected_branch = SkillBranch.WARRIOR
         self.selected_node: Optional[SkillTreeNode] = None
-        self.font = pygame.font.SysFont(None, 32)
-        self.small_font = pygame.font.SysFont(None, 24)
+        self.font = FontService().get(None, 32)
+        self.small_font = FontService().get(None, 24)
 
         # Colors
         self.colors = {
@@ -43,12 +46,21 @@ class SkillTreeUI(BaseUI):
         self.viewport_x = (screen.get_width() - self.viewport_width) // 2
         self.viewport_y = 50   # Starting y position from top
 
+        # Each branch is drawn once to an off-screen canvas and blitted through the viewport
+        self.canvas_padding = 100  # Room around the outermost nodes for their labels
+        self._canvases: Dict[SkillBranch, pygame.Surface] = {}
+        self._canvas_keys: Dict[SkillBranch, tuple] = {}
+        self._lattice_origins: Dict[SkillBranch, Tuple[int, int]] = {}
+        self._node_index: Dict[SkillBranch, Dict[Tuple[int, int], SkillTreeNode]] = {}
+        self._layout_version: Optional[int] = None  # SkillTree.layout_version the two caches above match
+
         self._init_branch_buttons()
 
     def toggle(self):
         """Toggle visibility of the skill tree UI"""
         self.visible = not self.visible
-        print(f"Toggling skill tree UI from {not self.visible} to {self.visible}")
+        EventBus().publish(EventType.PANEL_TOGGLED, panel="Skill tree",
+                           state="opened" if self.visible else "closed")
 
     def _is_in_viewport(self, x: int, y: int) -> bool:
         """Check if a point is within the viewable area"""
@@ -130,30 +142,23 @@ class SkillTreeUI(BaseUI):
         return pygame.Rect(x - self.node_radius, y - self.node_radius, 
                          self.node_radius * 2, self.node_radius * 2)
 
-    def _draw_node_connections(self, node: SkillTreeNode, skill_tree: SkillTree):
-        """Draw connections between nodes with scroll offset"""
-        base_x = self.viewport_x + self.scroll_x
-        base_y = self.viewport_y + self.scroll_y
-
-        x = base_x + node.position[0] * self.node_spacing
-        y = base_y + node.position[1] * self.node_spacing
+    def _draw_node_connections(self, canvas: pygame.Surface, node: SkillTreeNode, skill_tree: SkillTree):
+        """Draw connections from a node to its children onto the branch canvas"""
+        x, y = self._canvas_pos(node)
 
         for child in node.children:
-            child_x = base_x + child.position[0] * self.node_spacing
-            child_y = base_y + child.position[1] * self.node_spacing
-
-            # Only draw if either endpoint is in viewport
-            if self._is_in_viewport(x, y) or self._is_in_viewport(child_x, child_y):
-                if child.exclusive_group:
-                    if (child.exclusive_group in skill_tree.exclusive_groups and
-                            skill_tree.exclusive_groups[child.exclusive_group] != child):
-                        color = self.colors["exclusive_locked"]
-                    else:
-                        color = self.colors["line"]
+            child_x, child_y = self._canvas_pos(child)
+
+            if child.exclusive_group:
+                if (child.exclusive_group in skill_tree.exclusive_groups and
+                        skill_tree.exclusive_groups[child.exclusive_group] != child):
+                    color = self.colors["exclusive_locked"]
                 else:
                     color = self.colors["line"]
+            else:
+                color = self.colors["line"]
 
-                pygame.draw.line(self.screen, color, (x, y), (child_x, child_y), 2)
+            pygame.draw.line(canvas, color, (x, y), (child_x, child_y), 2)
 
     def _draw_skill_info(self, node: SkillTreeNode, skill_tree: SkillTree, player):
         """Draw detailed information about selected skill"""
@@ -182,14 +187,15 @@ class SkillTreeUI(BaseUI):
         info_y += line_height * 2
 
         # Draw requirements
-        reqs = node.skill.requirements.__dict__
+        reqs = node.skill.requirements
         req_text = self.small_font.render("Requirements:", True, self.colors["text"])
         self.screen.blit(req_text, (info_x, info_y))
         info_y += line_height
 
-        for stat, value in reqs.items():
+        checks = [("level", reqs.level, player.level)]
+        checks += [(stat, value, getattr(player.current_stats, stat)) for stat, value in reqs.items()]
+        for stat, value, current in checks:
             if value > 0:
-                current = getattr(player.current_stats, stat, 0)
                 color = (0, 255, 0) if current >= value else (255, 0, 0)
                 text = self.small_font.render(
                     f"{stat.capitalize()}: {value}", True, color
@@ -259,13 +265,9 @@ class SkillTreeUI(BaseUI):
             text_rect = unlock_text.get_rect(center=button_rect.center)
             self.screen.blit(unlock_text, text_rect)
 
-    def _draw_node_visuals(self, node: SkillTreeNode, skill_tree: SkillTree, player):
-        """Draw node with scroll offset"""
-        x = self.viewport_x + self.scroll_x + node.position[0] * self.node_spacing
-        y = self.viewport_y + self.scroll_y + node.position[1] * self.node_spacing
-
-        if not self._is_in_viewport(x, y):
-            return
+    def _draw_node_visuals(self, canvas: pygame.Surface, node: SkillTreeNode, skill_tree: SkillTree, player):
+        """Draw a node and its label onto the branch canvas"""
+        x, y = self._canvas_pos(node)
 
         # Determine node color
         if node.skill.unlocked:
@@ -275,21 +277,111 @@ class SkillTreeUI(BaseUI):
         else:
             color = self.colors["node_locked"]
 
-        if node == self.selected_node:
-            color = self.colors["node_selected"]
-
         # Draw node
-        pygame.draw.circle(self.screen, color, (x, y), self.node_radius)
+        pygame.draw.circle(canvas, color, (x, y), self.node_radius)
 
         # Draw skill name
         text = self.small_font.render(node.skill.name, True, self.colors["text"])
         text_rect = text.get_rect(center=(x, y + self.node_radius + 10))
-        self.screen.blit(text, text_rect)
+        canvas.blit(text, text_rect)
+
+    def _sync_layout(self, skill_tree: SkillTree) -> None:
+        """Forget cached node positions and the selection once a reload has replaced the nodes"""
+        if self._layout_version != skill_tree.layout_version:
+            self._node_index.clear()
+            self._lattice_origins.clear()
+            self.selected_node = None
+            self._layout_version = skill_tree.layout_version
+
+    def _get_node_index(self, skill_tree: SkillTree) -> Dict[Tuple[int, int], SkillTreeNode]:
+        """Lattice position -> node lookup for the selected branch"""
+        branch = self.selected_branch
+        if branch not in self._node_index:
+            nodes = skill_tree.branches[branch]
+            self._node_index[branch] = {tuple(node.position): node for node in nodes}
+            xs = [node.position[0] for node in nodes] or [0]
+            ys = [node.position[1] for node in nodes] or [0]
+            self._lattice_origins[branch] = (min(xs), min(ys))
+        return self._node_index[branch]
+
+    def _canvas_pos(self, node: SkillTreeNode) -> Tuple[int, int]:
+        """Position of a node on its branch canvas"""
+        min_x, min_y = self._lattice_origins[self.selected_branch]
+        return ((node.position[0] - min_x) * self.node_spacing + self.canvas_padding,
+                (node.position[1] - min_y) * self.node_spacing + self.canvas_padding)
+
+    def _screen_pos(self, node: SkillTreeNode) -> Tuple[int, int]:
+        """Position of a node on screen for the current scroll offset"""
+        return (self.viewport_x + self.scroll_x + node.position[0] * self.node_spacing,
+                self.viewport_y + self.scroll_y + node.position[1] * self.node_spacing)
+
+    def _get_canvas(self, skill_tree: SkillTree, player) -> pygame.Surface:
+        """Return the selected branch canvas, redrawing it only after an unlock, point or stat change"""
+        branch = self.selected_branch
+        key = (skill_tree.version, player.level, player.current_stats.values.tobytes())
+        if self._canvas_keys.get(branch) == key:
+            return self._canvases[branch]
+
+        nodes = skill_tree.branches[branch]
+        index = self._get_node_index(skill_tree)
+        min_x, min_y = self._lattice_origins[branch]
+        max_x = max((pos[0] for pos in index), default=0)
+        max_y = max((pos[1] for pos in index), default=0)
+        canvas = pygame.Surface((
+            (max_x - min_x) * self.node_spacing + self.canvas_padding * 2,
+            (max_y - min_y) * self.node_spacing + self.canvas_padding * 2
+        ), pygame.SRCALPHA)
+
+        for node in nodes:
+            self._draw_node_connections(canvas, node, skill_tree)
+        for node in nodes:
+            self._draw_node_visuals(canvas, node, skill_tree, player)
+
+        self._canvases[branch] = canvas
+        self._canvas_keys[branch] = key
+        return canvas
+
+    def _viewport_rect(self) -> pygame.Rect:
+        return pygame.Rect(self.viewport_x, self.viewport_y, self.viewport_width, self.viewport_height)
+
+    def _node_at(self, pos: Tuple[int, int], skill_tree: SkillTree) -> Optional[SkillTreeNode]:
+        """Find the node under a screen position via the lattice index"""
+        if not self._viewport_rect().collidepoint(pos):
+            return None
+        lattice_x = (pos[0] - self.viewport_x - self.scroll_x) / self.node_spacing
+        lattice_y = (pos[1] - self.viewport_y - self.scroll_y) / self.node_spacing
+        cell = (round(lattice_x), round(lattice_y))
+        node = self._get_node_index(skill_tree).get(cell)
+        if node is None:
+            return None
+        dx = (lattice_x - cell[0]) * self.node_spacing
+        dy = (lattice_y - cell[1]) * self.node_spacing
+        return node if dx * dx + dy * dy <= self.node_radius * self.node_radius else None
+
+    def _draw_tree(self, skill_tree: SkillTree, player):
+        """Blit the visible part of the branch canvas into the viewport"""
+        canvas = self._get_canvas(skill_tree, player)
+        min_x, min_y = self._lattice_origins[self.selected_branch]
+        origin = (self.viewport_x + self.scroll_x + min_x * self.node_spacing - self.canvas_padding,
+                  self.viewport_y + self.scroll_y + min_y * self.node_spacing - self.canvas_padding)
+
+        # Nodes near the edge keep their full circle and label, as before culling by centre
+        viewport = self._viewport_rect().inflate(self.canvas_padding * 2, self.canvas_padding * 2)
+        dest = canvas.get_rect(topleft=origin).clip(viewport)
+        if dest.width and dest.height:
+            self.screen.blit(canvas, dest.topleft, dest.move(-origin[0], -origin[1]))
+
+        if self.selected_node:
+            x, y = self._screen_pos(self.selected_node)
+            self.screen.set_clip(viewport)
+            pygame.draw.circle(self.screen, self.colors["node_selected"], (x, y), self.node_radius)
+            self.screen.set_clip(None)
 
     def handle_click(self, pos: Tuple[int, int], skill_tree: SkillTree, player) -> bool:
         """Handle mouse clicks"""
         if not self.visible:
             return False
+        self._sync_layout(skill_tree)
 
         # Check branch buttons
         for branch, rect in self.branch_buttons.items():
@@ -299,21 +391,10 @@ class SkillTreeUI(BaseUI):
                 return True
 
         # Check skill nodes
-        nodes = skill_tree.branches[self.selected_branch]
-        for node in nodes:
-            node_pos = (
-                self.tree_start_x + node.position[0] * self.node_spacing + self.margin,
-                node.position[1] * self.node_spacing + self.margin
-            )
-            node_rect = pygame.Rect(
-                node_pos[0] - self.node_radius,
-                node_pos[1] - self.node_radius,
-                self.node_radius * 2,
-                self.node_radius * 2
-            )
-            if node_rect.collidepoint(pos):
-                self.selected_node = node
-                return True
+        node = self._node_at(pos, skill_tree)
+        if node:
+            self.selected_node = node
+            return True
 
         # Check unlock button
         if self.selected_node and not self.selected_node.skill.unlocked:
@@ -328,17 +409,11 @@ class SkillTreeUI(BaseUI):
     def render(self, skill_tree: SkillTree, player):
         if not self.visible:
             return
-
-        print("\nRendering skill tree UI")
-        print(f"Current branch: {self.selected_branch}")
-        print(f"Available branches: {skill_tree.branches.keys()}")
-        print(f"Nodes in current branch: {len(skill_tree.branches[self.selected_branch])}")
+        self._sync_layout(skill_tree)
 
         # Draw semi-transparent background
-        background = pygame.Surface(self.screen.get_size())
-        background.fill(self.colors["background"])
-        background.set_alpha(230)
-        self.screen.blit(background, (0, 0))
+        overlay = OverlayPool().get(self.screen.get_size(), self.colors["background"], 230)
+        self.screen.blit(overlay, (0, 0))
 
         # Draw skill points available
         points_text = self.font.render(f"Skill Points: {skill_tree.available_points}", True, self.colors["text"])
@@ -354,12 +429,4 @@ class SkillTreeUI(BaseUI):
             self.screen.blit(text, text_rect)
 
         if self.selected_branch in skill_tree.branches:
-            nodes = skill_tree.branches[self.selected_branch]
-
-            # First pass - draw connections
-            for node in nodes:
-                self._draw_node_connections(node, skill_tree)
-
-            # Second pass - draw nodes
-            for node in nodes:
-                self._draw_node_visuals(node, skill_tree, player)
\ No newline at end of file
+            self._draw_tree(skill_tree, player)
\ No newline at end of file
@@ -1,7 +1,10 @@
-from .monster_ai import MonsterAI
+from .monster_ai import MonsterAI, MonsterPolicy
 from .entity import Entity, EntityType
 from .loot_generator import LootGenerator
+from .skills import Buff
+from .status_effects import StatusEffectEngine, parse_effect
 from ..engine.generics import RandomUtils, load_json_config
+from ..engine.core.event_bus import EventBus, EventType
 
 class CombatManager:
     def __init__(self):
@@ -9,21 +12,42 @@ class CombatManager:
         self.turn_order = []
         self.loot_generator = LootGenerator()
         self.monster_data = load_json_config("monsters.json")["monsters"]
+        self.policies = MonsterPolicy.compile_all(self.monster_data)
+        self.action_effects = self._compile_action_effects()
+        self.effects = StatusEffectEngine()
         self.monster_ai = None
 
+    def reload(self):
+        """Pick up edited monster and loot config. A fight in progress keeps its monster."""
+        self.monster_data = load_json_config("monsters.json")["monsters"]
+        self.policies = MonsterPolicy.compile_all(self.monster_data)
+        self.action_effects = self._compile_action_effects()
+        self.loot_generator.reload()
+
+    def _compile_action_effects(self) -> dict:
+        """(monster, action) -> the Buff/Debuff that action applies, for actions with an "effect"."""
+        return {
+            (monster_name, action_name): parse_effect(action["effect"], action_name)
+            for monster_name, monster in self.monster_data.items()
+            for action_name, action in monster["actions"].items() if "effect" in action
+        }
+
     def start_combat(self, player: Entity, enemy: Entity):
-        print("\n=== Starting Combat ===")
-        print(f"Player - HP: {player.current_hp}/{player.max_hp}")
-        print(f"Enemy - HP: {enemy.current_hp}/{enemy.max_hp}")
-        try:
-            self.current_encounter = (player, enemy)
-            self.determine_turn_order()
-            monster_config = self.monster_data[enemy.name]
-            self.monster_ai = MonsterAI(enemy, monster_config["behavior"], monster_config["actions"])
-            print(f"Turn order: {[e.name for e in self.turn_order]}")
-        except Exception as e:
-            print(f"ERROR starting combat: {str(e)}")
-            raise
+        self.current_encounter = (player, enemy)
+        self.effects.clear()
+        self.determine_turn_order()
+        self.monster_ai = MonsterAI(enemy, self.policies[enemy.name])
+        EventBus().publish(
+            EventType.COMBAT_STARTED,
+            player=player.name, player_hp=player.current_hp, player_max_hp=player.max_hp,
+            enemy=enemy.name, level=enemy.level, enemy_hp=enemy.current_hp, enemy_max_hp=enemy.max_hp,
+            turn_order=tuple(entity.name for entity in self.turn_order),
+        )
+
+    def end_combat(self):
+        """Drop the fight's status effects so they stop counting toward anyone's stats."""
+        self.effects.clear()
+        self.current_encounter = None
 
     def process_turn(self, attacker: Entity, defender: Entity, action: str) -> dict:
         result = {
@@ -34,29 +58,66 @@ class CombatManager:
             "loot": None
         }
 
-        if attacker.entity_type == EntityType.PLAYER:
-            self._process_player_action(attacker, defender, action, result)
-        else:
-            self._process_monster_action(attacker, defender, result)
+        if self._start_turn(attacker, result):
+            if attacker.entity_type == EntityType.PLAYER:
+                self._process_player_action(attacker, defender, action, result)
+            else:
+                self._process_monster_action(attacker, defender, result)
 
-        if defender.current_hp <= 0 and defender.entity_type == EntityType.MONSTER:
-            items, gold = self.loot_generator.generate_loot(defender.level, defender.meta_level)
+        # Damage over time can kill the monster on its own turn
+        monster = attacker if attacker.entity_type == EntityType.MONSTER else defender
+        if monster.current_hp <= 0 and monster.entity_type == EntityType.MONSTER:
+            items, gold = self.loot_generator.generate_loot(monster.level, monster.meta_level)
             result["loot"] = {"items": items, "gold": gold}
 
         return result
 
+    def _start_turn(self, entity: Entity, result: dict) -> bool:
+        """Expire and tick entity's effects. False when it cannot act this turn."""
+        start = self.effects.begin_turn(entity)
+        notes = []
+        for effect in start.expired:
+            notes.append(f"{entity.name}'s {effect.type.name.lower().replace('_', ' ')} wears off.")
+            EventBus().publish(EventType.EFFECT_EXPIRED, effect=effect.type.name, target=entity.name)
+        if start.hp_change < 0:
+            notes.append(f"{entity.name} takes {-start.hp_change} damage from effects!")
+        elif start.hp_change > 0:
+            notes.append(f"{entity.name} regenerates {start.hp_change} HP.")
+        can_act = entity.current_hp > 0 and not start.skip
+        if start.skip and entity.current_hp > 0:
+            notes.append(f"{entity.name} cannot act!")
+        result["status_effects"].extend(notes)
+        result["message"] = " ".join(notes)
+        return can_act
+
+    def _apply_action_effect(self, monster: Entity, player: Entity, action_name: str) -> str:
+        """Apply the effect of a monster action; buffs land on the monster, debuffs on the player."""
+        effect = self.action_effects.get((monster.name, action_name))
+        if effect is None:
+            return ""
+        target = monster if isinstance(effect, Buff) else player
+        self.effects.apply_effect(target, effect)
+        EventBus().publish(EventType.EFFECT_APPLIED, effect=effect.type.name, target=target.name,
+                           source=monster.name, duration=effect.duration)
+        verb = "gains" if target is monster else "suffers"
+        return f" {target.name} {verb} {effect.type.name.lower().replace('_', ' ')} for {effect.duration} turns!"
+
     def _process_player_action(self, player: Entity, monster: Entity, action: str, result: dict):
         if action == "attack":
             damage = self.calculate_damage(player, monster)
             monster.current_hp -= damage
             result["damage_dealt"] = damage
-            result["message"] = f"You attack for {damage} damage!"
+            result["message"] = self._join(result["message"], f"You attack for {damage} damage!")
+            EventBus().publish(EventType.DAMAGE_DEALT, attacker=player.name, defender=monster.name,
+                               damage=damage, defender_hp=monster.current_hp)
 
     def _process_monster_action(self, monster: Entity, player: Entity, result: dict):
         # Get AI decision
         action_choice = self.monster_ai.choose_action(player)
         action_type = action_choice["action"]["type"]
-        
+        EventBus().publish(EventType.MONSTER_ACTION, monster=monster.name,
+                           action=action_choice["name"], action_type=action_type)
+
         match action_type:
             case "physical" | "magic":
                 damage = self.calculate_damage(
@@ -65,7 +126,9 @@ class CombatManager:
                 )
                 player.current_hp -= damage
                 result["damage_dealt"] = damage
-                result["message"] = action_choice["message"] + f" Deals {damage} damage!"
+                EventBus().publish(EventType.DAMAGE_DEALT, attacker=monster.name, defender=player.name,
+                                   damage=damage, defender_hp=player.current_hp)
+                message = action_choice["message"] + f" Deals {damage} damage!"
                 
             case "heal":
                 heal_amount = max(5, monster.current_stats.health)
@@ -73,38 +136,40 @@ class CombatManager:
                     monster.max_hp,
                     monster.current_hp + heal_amount
                 )
-                result["message"] = action_choice["message"] + f" Heals for {heal_amount}!"
-                
-            case "buff":
-                # For now, just use the message
-                result["message"] = action_choice["message"]
+                message = action_choice["message"] + f" Heals for {heal_amount}!"
                 
-            case "debuff":
-                # For now, just use the message
-                result["message"] = action_choice["message"]
-                
-            case "special":
-                # Handle special cases with message for now
-                result["message"] = action_choice["message"]
+            case _:
+                # Buffs, debuffs and specials apply the action's status effect, if it has one
+                message = action_choice["message"] + self._apply_action_effect(
+                    monster, player, action_choice["name"]
+                )
+
+        result["message"] = self._join(result["message"], message)
+
+    @staticmethod
+    def _join(*messages: str) -> str:
+        return " ".join(message for message in messages if message)
 
     def determine_turn_order(self):
         player, monster = self.current_encounter
         self.turn_order = sorted(
             [player, monster], 
-            key=lambda x: x.current_stats.speed, 
+            key=lambda x: self.effects.stats(x).speed, 
             reverse=True
         )
 
     def calculate_damage(self, attacker: Entity, defender: Entity, is_magical: bool = False) -> int:
+        attacker_stats = self.effects.stats(attacker)
+        defender_stats = self.effects.stats(defender)
         if is_magical:
-            attack = attacker.current_stats.magic_power
-            defence = defender.current_stats.magic_defence
+            attack = attacker_stats.magic_power
+            defence = defender_stats.magic_defence
         else:
-            attack = attacker.current_stats.strength
-            defence = defender.current_stats.defence
+            attack = attacker_stats.strength
+            defence = defender_stats.defence
 
         base_damage = max(1, attack - defence // 2)
-        crit_chance = attacker.current_stats.dexterity * 0.05
+        crit_chance = attacker_stats.dexterity * 0.05
         is_crit = RandomUtils.chance(crit_chance)
 
         if is_crit:
@@ -0,0 +1,212 @@
+"""
+Batch combat simulator for balance work.
+
+Runs thousands of player-versus-monster fights at once with NumPy, one row
+per fight, following the live rules:
+- monster stats: EncounterManager's stat generation plus Entity.initialize_stats
+- damage and dexterity crits: CombatManager.calculate_damage
+- turn order: speed, with the player first on ties
+- monster turns: the MonsterPolicy tables MonsterAI uses, and heal logic
+  from CombatManager (status effects from buff, debuff and special actions
+  are not modelled)
+"""
+
+from dataclasses import dataclass
+from typing import Dict, Iterable, Optional, Tuple
+
+import numpy as np
+
+from .entity import Entity, STAT_INDEX as _STAT, Stats
+from .monster_ai import ActionType, MonsterPolicy, NO_ACTION, buff_bucket, hp_bucket
+from ..engine.generics import load_json_config
+
+# Stats EncounterManager rolls; the rest keep their Stats defaults
+_ROLLED_STATS = ("strength", "defence", "health", "speed", "stamina",
+                 "magic_power", "magic_defence", "wisdom", "intelligence")
+
+
+@dataclass
+class SimulationResult:
+    """Outcome of many fights against one monster type, with per-fight arrays."""
+    monster: str
+    level: int
+    fights: int
+    wins: np.ndarray       # bool, the monster died first
+    losses: np.ndarray     # bool, the player died first
+    rounds: np.ndarray     # Rounds fought (both sides act once per round)
+    player_hp: np.ndarray  # Player HP left, as a fraction of max
+    monster_hp: np.ndarray  # Monster HP left, as a fraction of max
+
+    @property
+    def win_rate(self) -> float:
+        return float(self.wins.mean())
+
+    def summary(self) -> Dict[str, float]:
+        """Win rate plus p10/p50/p90 of rounds-to-kill and player HP left over won fights."""
+        summary = {"win_rate": self.win_rate, "loss_rate": float(self.losses.mean())}
+        if self.wins.any():
+            p10, p50, p90 = np.percentile(self.rounds[self.wins], (10, 50, 90))
+            summary.update(turns_p10=float(p10), turns_p50=float(p50), turns_p90=float(p90))
+            p10, p50, p90 = np.percentile(self.player_hp[self.wins], (10, 50, 90))
+            summary.update(hp_left_p10=float(p10), hp_left_p50=float(p50), hp_left_p90=float(p90))
+        return summary
+
+
+class BatchCombatSimulator:
+    """Vectorized Monte Carlo fights between a fixed player and generated monsters."""
+
+    def __init__(self, monster_data=None, max_rounds: int = 100, seed: Optional[int] = None):
+        self.monster_data = monster_data or load_json_config("monsters.json")["monsters"]
+        self.policies = MonsterPolicy.compile_all(self.monster_data)
+        self.max_rounds = max_rounds
+        self.rng = np.random.default_rng(seed)
+
+    def roll_monsters(self, name: str, levels: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Stats (fights x stats) and max HP for freshly generated monsters, one per level entry."""
+        rng = self.rng
+        focus = self.monster_data[name]["stat_focus"]
+        n = len(levels)
+        stats = np.tile(np.array(Stats.DEFAULTS, dtype=float), (n, 1))
+        for stat_name in _ROLLED_STATS:
+            if stat_name in focus["primary"]:
+                low, high = 8, 12
+            elif stat_name in focus["secondary"]:
+                low, high = 5, 8
+            elif stat_name in focus["weak"]:
+                low, high = 2, 4
+            else:
+                low, high = 4, 6
+            stats[:, _STAT[stat_name]] = rng.integers(low, high + 1, n)
+        stats[:, _STAT["health"]] *= 1.01
+
+        rolled = [_STAT[stat_name] for stat_name in _ROLLED_STATS]
+        stats[:, rolled] = np.trunc(stats[:, rolled] * (1 + levels * 0.15)[:, None])
+
+        # Entity.initialize_stats
+        meta = np.maximum(1, np.round(stats.sum(axis=1) / 10 * (1 + levels / 20)))
+        scale = 1 + (levels * 0.15 + meta * 0.1) / 10
+        stats = np.maximum(1, np.trunc(stats * scale[:, None]))
+        max_hp = stats[:, _STAT["health"]] * 2 + np.trunc(levels * 1.5) + meta * 2
+        return stats, max_hp
+
+    def _damage(self, attack: np.ndarray, defence: np.ndarray, dexterity: np.ndarray) -> np.ndarray:
+        damage = np.maximum(1, attack - defence // 2)
+        crits = self.rng.random(len(damage)) < dexterity * 0.05
+        return np.where(crits, damage * 2, damage)
+
+    def _choose_actions(self, policy: MonsterPolicy, hp_pct: np.ndarray, last_type: np.ndarray,
+                        turns_since_buff: np.ndarray) -> np.ndarray:
+        """Index of the action each fight's monster picks, from the shared policy rows."""
+        rows = policy.cumulative[hp_bucket(hp_pct), last_type, buff_bucket(turns_since_buff)]
+        draws = self.rng.random(len(hp_pct)) * rows[:, -1]
+        return np.minimum((rows <= draws[:, None]).sum(axis=1), rows.shape[1] - 1)
+
+    def simulate(self, player: Entity, name: str, levels, fights: int = 1000) -> SimulationResult:
+        """
+        Fight `fights` fresh monsters of one type. levels is one level for
+        all fights or an array with one level per fight.
+        """
+        levels = np.broadcast_to(np.asarray(levels, dtype=float), (fights,)).copy()
+        monster, monster_max_hp = self.roll_monsters(name, levels)
+        monster_hp = monster_max_hp.copy()
+        p = player.current_stats.as_dict()
+        player_hp = np.full(fights, float(player.max_hp))
+
+        policy = self.policies[name]
+        types = policy.types
+        last_type = np.full(fights, NO_ACTION)
+        turns_since_buff = np.zeros(fights, dtype=int)
+        monster_heal = np.maximum(5, monster[:, _STAT["health"]])
+
+        player_first = p["speed"] >= monster[:, _STAT["speed"]]
+        rounds = np.zeros(fights, dtype=int)
+        active = np.ones(fights, dtype=bool)
+
+        def player_turn(rows):
+            damage = self._damage(np.full(len(rows), p["strength"]),
+                                  monster[rows, _STAT["defence"]], np.full(len(rows), p["dexterity"]))
+            monster_hp[rows] -= damage
+
+        def monster_turn(rows):
+            hp_pct = monster_hp[rows] / monster_max_hp[rows]
+            chosen = self._choose_actions(policy, hp_pct, last_type[rows], turns_since_buff[rows])
+            kind = types[chosen]
+            last_type[rows] = kind
+            turns_since_buff[rows] = np.where((kind == ActionType.BUFF) | (kind == ActionType.HEAL), 0, turns_since_buff[rows] + 1)
+
+            magic = kind == ActionType.MAGIC
+            attacking = (kind == ActionType.PHYSICAL) | magic
+            attack = np.where(magic, monster[rows, _STAT["magic_power"]], monster[rows, _STAT["strength"]])
+            defence = np.where(magic, p["magic_defence"], p["defence"])
+            damage = self._damage(attack, defence, monster[rows, _STAT["dexterity"]])
+            player_hp[rows] -= np.where(attacking, damage, 0)
+
+            healing = kind == ActionType.HEAL
+            monster_hp[rows] = np.where(
+                healing, np.minimum(monster_max_hp[rows], monster_hp[rows] + monster_heal[rows]), monster_hp[rows]
+            )
+
+        for _ in range(self.max_rounds):
+            rows = np.flatnonzero(active)
+            if not len(rows):
+                break
+            rounds[rows] += 1
+            first, second = rows[player_first[rows]], rows[~player_first[rows]]
+            # Faster side acts first; a side that dies before its turn does not act
+            player_turn(first)
+            monster_turn(second)
+            alive = (monster_hp > 0) & (player_hp > 0)
+            monster_turn(first[alive[first]])
+            player_turn(second[alive[second]])
+            active &= (monster_hp > 0) & (player_hp > 0)
+
+        return SimulationResult(
+            monster=name,
+            level=int(levels[0]) if np.all(levels == levels[0]) else -1,
+            fights=fights,
+            wins=monster_hp <= 0,
+            losses=player_hp <= 0,
+            rounds=rounds,
+            player_hp=np.clip(player_hp, 0, None) / player.max_hp,
+            monster_hp=np.clip(monster_hp, 0, None) / monster_max_hp,
+        )
+
+    def sweep(self, player: Entity, levels: Iterable[int], monsters: Iterable[str] = None,
+              fights: int = 1000) -> Dict[Tuple[str, int], SimulationResult]:
+        """
+        Every monster type at every level. Each monster type runs all of its
+        levels as one batch, then the rows are split back out per level.
+        """
+        levels = list(levels)
+        results = {}
+        for name in (monsters or self.monster_data):
+            batch = self.simulate(player, name, np.repeat(levels, fights), fights * len(levels))
+            for index, level in enumerate(levels):
+                rows = slice(index * fights, (index + 1) * fights)
+                results[(name, level)] = SimulationResult(
+                    name, level, fights, batch.wins[rows], batch.losses[rows], batch.rounds[rows],
+                    batch.player_hp[rows], batch.monster_hp[rows],
+                )
+        return results
+
+
+def main(argv=None):
+    """Print a win rate table for every monster at levels 1-10 against a new player."""
+    import argparse
+    from ..engine.player import Player
+
+    parser = argparse.ArgumentParser(description="Batch combat balance sweep")
+    parser.add_argument("--fights", type=int, default=1000, help="Fights per monster and level")
+    parser.add_argument("--levels", type=int, default=10, help="Sweep levels 1..N")
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args(argv)
+
+    levels = range(1, args.levels + 1)
+    results = BatchCombatSimulator(seed=args.seed).sweep(Player(), levels, fights=args.fights)
+    print(f"{'monster':<16}" + "".join(f"{level:>7}" for level in levels))
+    for name in dict.fromkeys(name for name, _ in results):
+        print(f"{name:<16}" + "".join(f"{results[(name, level)].win_rate:>7.0%}" for level in levels))
+
+
+if __name__ == "__main__":
+    main()
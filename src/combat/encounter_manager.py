@@ -1,11 +1,111 @@
+from bisect import bisect_right
+from typing import Dict, List, Optional, Sequence, Tuple
+
 from .entity import Entity, EntityType, Stats
 from ..engine.generics import calculate_distance, RandomUtils, load_json_config
 
+ENCOUNTER_RATE_SCALE = 0.1  # Applied to every monster's base_rate
+MIN_ENCOUNTER_SPACING = 150  # Minimum tiles between encounters
+
+
+def _alias_table(probabilities: Sequence[float]) -> Tuple[Tuple[float, ...], Tuple[int, ...]]:
+    """Vose's alias method: per column, the chance to keep it and the outcome used otherwise."""
+    n = len(probabilities)
+    scaled = [p * n for p in probabilities]
+    keep, alias = [1.0] * n, list(range(n))
+    small = [i for i, p in enumerate(scaled) if p < 1.0]
+    large = [i for i, p in enumerate(scaled) if p >= 1.0]
+    while small and large:
+        low, high = small.pop(), large.pop()
+        keep[low], alias[low] = scaled[low], high
+        scaled[high] -= 1.0 - scaled[low]
+        (small if scaled[high] < 1.0 else large).append(high)
+    return tuple(keep), tuple(alias)
+
+
+class SpawnTable:
+    """
+    Encounter outcomes for one biome and distance band: every monster that
+    can spawn there, plus no encounter. Probabilities match rolling each
+    monster's chance in config order until one hits, and sampling uses the
+    alias method, so a step costs one random draw whatever the monster count.
+    """
+
+    __slots__ = ('names', 'probabilities', 'cumulative', 'encounter_chance', '_keep', '_alias')
+
+    def __init__(self, candidates: Sequence[Tuple[str, float]]):
+        names, probabilities, missed = [], [], 1.0
+        for name, chance in candidates:
+            names.append(name)
+            probabilities.append(missed * chance)
+            missed *= 1.0 - chance
+        self.encounter_chance = 1.0 - missed
+        self.cumulative: List[float] = []  # Running totals over the monsters only
+        total = 0.0
+        for probability in probabilities:
+            total += probability
+            self.cumulative.append(total)
+        self.names: Tuple[Optional[str], ...] = (*names, None)
+        self.probabilities: Tuple[float, ...] = (*probabilities, missed)
+        self._keep, self._alias = _alias_table(self.probabilities)
+
+    def sample(self, draw: float) -> Optional[str]:
+        """The monster that spawns, or None, for a uniform draw in [0, 1)."""
+        scaled = draw * len(self.names)
+        column = int(scaled)
+        if scaled - column >= self._keep[column]:
+            column = self._alias[column]
+        return self.names[column]
+
+    def choose_monster(self, draw: float) -> str:
+        """A monster in proportion to its spawn chance, given that an encounter happens."""
+        index = bisect_right(self.cumulative, draw * self.encounter_chance)
+        return self.names[min(index, len(self.cumulative) - 1)]
+
+
 class EncounterManager:
     def __init__(self):
         self.monster_data = self._load_monsters()
         self.base_difficulty_radius = 100
         self.last_encounter_coords = None
+        self._build_spawn_tables()
+
+    def reload(self):
+        """Pick up edited monster definitions (spawn biomes, stats, levels)."""
+        self.monster_data = self._load_monsters()
+        self._build_spawn_tables()
+
+    def _build_spawn_tables(self) -> None:
+        """
+        One SpawnTable per biome and distance band. Bands start at each
+        distinct min_distance, kept squared so steps never take a square root.
+        """
+        distances = sorted({data["rarity"]["min_distance"] for data in self.monster_data.values()})
+        self._band_starts_sq = [distance * distance for distance in distances]
+        self.biome_monsters: Dict[str, Tuple[str, ...]] = {}
+        for name, data in self.monster_data.items():
+            for biome in data["biomes"]:
+                self.biome_monsters[biome] = self.biome_monsters.get(biome, ()) + (name,)
+
+        self.spawn_tables: Dict[str, List[Optional[SpawnTable]]] = {}
+        for biome, names in self.biome_monsters.items():
+            bands = []
+            for band_start in distances:
+                candidates = [
+                    (name, self.monster_data[name]["rarity"]["base_rate"] * ENCOUNTER_RATE_SCALE)
+                    for name in names if self.monster_data[name]["rarity"]["min_distance"] <= band_start
+                ]
+                bands.append(SpawnTable(candidates) if candidates else None)
+            self.spawn_tables[biome] = bands
+
+    def spawn_table(self, world_coords: tuple[int, int], biome: str) -> Optional[SpawnTable]:
+        """The table for a position, or None if nothing spawns there."""
+        bands = self.spawn_tables.get(biome)
+        if bands is None:
+            return None
+        x, y = world_coords
+        band = bisect_right(self._band_starts_sq, x * x + y * y) - 1
+        return bands[band] if band >= 0 else None
 
     @staticmethod
     def _load_monsters():
@@ -40,45 +140,37 @@ class EncounterManager:
 
     def should_encounter(self, world_coords: tuple[int, int], biome: str) -> tuple[bool, str]:
         # Check if we're too close to the last encounter
-        if self.last_encounter_coords:
-            distance_from_last = calculate_distance(
-                world_coords[0], world_coords[1],
-                self.last_encounter_coords[0], self.last_encounter_coords[1]
-            )
-            if distance_from_last < 150:  # Minimum tiles between encounters
+        last = self.last_encounter_coords
+        if last:
+            dx, dy = world_coords[0] - last[0], world_coords[1] - last[1]
+            if dx * dx + dy * dy < MIN_ENCOUNTER_SPACING * MIN_ENCOUNTER_SPACING:
                 return False, None
 
-        # Check distance from origin
-        distance_from_origin = calculate_distance(world_coords[0], world_coords[1], 0, 0)
-    
-        valid_monsters = []
-        for name, data in self.monster_data.items():
-            if (biome in data["biomes"] and 
-                distance_from_origin >= data["rarity"]["min_distance"]):
-                valid_monsters.append(name)
-
-        if not valid_monsters:
+        table = self.spawn_table(world_coords, biome)
+        if table is None:
             return False, None
 
-        for name in valid_monsters:
-            monster = self.monster_data[name]
-            if RandomUtils.chance(monster["rarity"]["base_rate"] * 0.1):  # Reduced chance
-                self.last_encounter_coords = world_coords
-                return True, name
-
-        return False, None
-
-    def generate_encounter(self, world_coords: tuple[int, int], biome: str) -> Entity:
+        name = table.sample(RandomUtils.float())
+        if name is None:
+            return False, None
+        self.last_encounter_coords = world_coords
+        return True, name
+
+    def generate_encounter(self, world_coords: tuple[int, int], biome: str, name: Optional[str] = None) -> Entity:
+        """
+        A new monster, normally the one should_encounter picked. Without a
+        name one is drawn from the position's spawn table, or from the
+        whole biome where nothing is in range.
+        """
         try:
-            valid_monsters = [m for _, m in self.monster_data.items() if biome in m["biomes"]]
-            monster_data = RandomUtils.choice(valid_monsters)
+            if name is None:
+                table = self.spawn_table(world_coords, biome)
+                name = (table.choose_monster(RandomUtils.float()) if table
+                        else RandomUtils.choice(self.biome_monsters[biome]))
+            monster_data = self.monster_data[name]
             level = self.get_encounter_level(world_coords)
 
-            monster = Entity(
-                list(self.monster_data.keys())[list(self.monster_data.values()).index(monster_data)],
-                EntityType.MONSTER,
-                level
-            )
+            monster = Entity(name, EntityType.MONSTER, level)
 
             monster.base_stats = self._generate_base_stats(monster_data, level)
             monster.initialize_stats()
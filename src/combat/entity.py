@@ -1,29 +1,239 @@
+from array import array
 from enum import Enum, auto
-from dataclasses import dataclass
+from itertools import chain
+from operator import add, ge, le, sub
+from typing import Dict, Iterable, Iterator, List, Mapping, Optional, Tuple
+
+import numpy as np
 
 class EntityType(Enum):
     PLAYER = auto()
     MONSTER = auto()
 
-@dataclass
+STAT_NAMES = ("strength", "defence", "health", "speed", "stamina",
+              "dexterity", "magic_power", "magic_defence", "wisdom", "intelligence")
+STAT_INDEX = {name: index for index, name in enumerate(STAT_NAMES)}
+
+
+def _stat(index: int) -> property:
+    def get(self) -> int:
+        return self.values[index]
+
+    def set(self, value: int) -> None:
+        self.values[index] = value
+    return property(get, set)
+
+
 class Stats:
-    strength: int = 1
-    defence: int = 1
-    health: int = 10
-    speed: int = 1
-    stamina: int = 10
-    dexterity: int = 1
-    magic_power: int = 1
-    magic_defence: int = 1
-    wisdom: int = 1
-    intelligence: int = 1
-
-    def level_scale(self, level: int, meta_level: int):
-        scale_factor = (level * 0.15 + meta_level * 0.1) / 10
-        for attr in self.__dict__:
-            current_value = getattr(self, attr)
-            scaled_value = max(1, int(current_value * (1 + scale_factor)))
-            setattr(self, attr, scaled_value)
+    """
+    The stats in STAT_NAMES order, held in one array('i').
+
+    Reads and writes like the dataclass it replaced (stats.strength,
+    Stats(**values), ==) and adds whole-vector arithmetic: + and -,
+    scaled(), clamped(), and >= / <= meaning every stat is at least / at
+    most the other's. stack() turns many stats into one NumPy matrix for
+    bulk work such as simulation.
+    """
+
+    __slots__ = ('values',)
+    DEFAULTS: Tuple[int, ...] = (1, 1, 10, 1, 10, 1, 1, 1, 1, 1)
+
+    strength = _stat(0)
+    defence = _stat(1)
+    health = _stat(2)
+    speed = _stat(3)
+    stamina = _stat(4)
+    dexterity = _stat(5)
+    magic_power = _stat(6)
+    magic_defence = _stat(7)
+    wisdom = _stat(8)
+    intelligence = _stat(9)
+
+    def __init__(self, *values: int, **named: int):
+        if len(values) > len(STAT_NAMES):
+            raise TypeError(f"{type(self).__name__}() takes at most {len(STAT_NAMES)} stats")
+        data = array('i', self.DEFAULTS)
+        data[:len(values)] = array('i', values)
+        for name, value in named.items():
+            if name not in STAT_INDEX:
+                raise TypeError(f"{type(self).__name__}() got an unexpected keyword argument {name!r}")
+            data[STAT_INDEX[name]] = value
+        self.values = data
+
+    @classmethod
+    def _wrap(cls, values: array) -> "Stats":
+        stats = cls.__new__(cls)
+        stats.values = values
+        return stats
+
+    @classmethod
+    def zero(cls) -> "Stats":
+        return cls._wrap(array('i', (0,)) * len(STAT_NAMES))
+
+    @classmethod
+    def sum(cls, stats: Iterable["Stats"]) -> "Stats":
+        rows = [each.values for each in stats]
+        return cls._wrap(array('i', list(map(sum, zip(*rows))))) if rows else cls.zero()
+
+    @staticmethod
+    def stack(stats: Iterable["Stats"]) -> np.ndarray:
+        """An (n, stats) int matrix, one row per Stats."""
+        flat = array('i', chain.from_iterable(each.values for each in stats))
+        return np.frombuffer(flat, dtype=np.intc).reshape(-1, len(STAT_NAMES))
+
+    @classmethod
+    def from_rows(cls, matrix: np.ndarray) -> List["Stats"]:
+        """The inverse of stack(); fractional values are truncated."""
+        rows = np.ascontiguousarray(matrix, dtype=np.intc).reshape(-1, len(STAT_NAMES))
+        return [cls._wrap(array('i', row.tobytes())) for row in rows]
+
+    def copy(self) -> "Stats":
+        return self._wrap(array('i', self.values))
+
+    def replace(self, **changes: int) -> "Stats":
+        """A copy with some stats changed, like dataclasses.replace."""
+        stats = self.copy()
+        for name, value in changes.items():
+            stats.values[STAT_INDEX[name]] = value
+        return stats
+
+    def items(self) -> Iterator[Tuple[str, int]]:
+        return zip(STAT_NAMES, self.values)
+
+    def as_dict(self) -> Dict[str, int]:
+        return dict(self.items())
+
+    def __add__(self, other: "Stats") -> "Stats":
+        return self._wrap(array('i', list(map(add, self.values, other.values))))
+
+    def __sub__(self, other: "Stats") -> "Stats":
+        return self._wrap(array('i', list(map(sub, self.values, other.values))))
+
+    def scaled(self, factor: float) -> "Stats":
+        """Every stat multiplied by factor and truncated."""
+        return self._wrap(array('i', [int(value * factor) for value in self.values]))
+
+    def clamped(self, low: Optional[int] = None, high: Optional[int] = None) -> "Stats":
+        values = self.values
+        if low is not None:
+            values = [max(low, value) for value in values]
+        if high is not None:
+            values = [min(high, value) for value in values]
+        return self._wrap(array('i', values))
+
+    def __ge__(self, other: "Stats") -> bool:
+        return all(map(ge, self.values, other.values))
+
+    def __le__(self, other: "Stats") -> bool:
+        return all(map(le, self.values, other.values))
+
+    def __eq__(self, other) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return self.values == other.values
+
+    __hash__ = None  # Mutable, like the dataclass was
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({', '.join(f'{name}={value}' for name, value in self.items())})"
+
+    def level_scaled(self, level: int, meta_level: int) -> "Stats":
+        """A scaled copy; the stats themselves are left alone so scaling never compounds."""
+        scale = 1 + (level * 0.15 + meta_level * 0.1) / 10
+        return self._wrap(array('i', [max(1, int(value * scale)) for value in self.values]))
+
+
+class StatPipeline:
+    """
+    An entity's derived stats, built in layers:
+    base -> level scaling -> equipment -> skill-tree buffs -> active effects.
+
+    Each layer's output is cached next to the version stamp it was built
+    from. A read compares the stamps and rebuilds only from the lowest layer
+    that changed, so combat and UI reads between changes cost a few integer
+    compares.
+    """
+
+    LAYERS = ("base", "level", "equipment", "skills", "effects")
+
+    def __init__(self, entity: "Entity"):
+        self.entity = entity
+        self.base_version = 0  # Bumped whenever base stats or level change
+        self.equipment = None  # Anything with equipment_version and get_total_stats(), e.g. an Inventory
+        self.skill_bonus = Stats.zero()
+        self.skill_version = 0
+        self.effects = None  # The entity's EffectStack while it is in a fight
+        self._stamps: Optional[tuple] = None
+        self._stages = [None] * len(self.LAYERS)
+
+    def invalidate(self) -> None:
+        self.base_version += 1
+
+    def add_skill_bonus(self, buffs: Mapping[str, int]) -> None:
+        self.set_skill_bonus(self.skill_bonus + Stats.zero().replace(**buffs))
+
+    def set_skill_bonus(self, bonus: Stats) -> None:
+        self.skill_bonus = bonus
+        self.skill_version += 1
+
+    def _current_stamps(self) -> tuple:
+        entity, equipment, effects = self.entity, self.equipment, self.effects
+        return (
+            self.base_version,
+            entity.level, entity.meta_level,
+            equipment.equipment_version if equipment is not None else None,
+            self.skill_version,
+            (id(effects), effects.version) if effects is not None else None,
+        )
+
+    def _rebuild(self, stamps: tuple) -> None:
+        old = self._stamps or (None,) * len(stamps)
+        changed = next(i for i, (new, previous) in enumerate(zip(stamps, old)) if new != previous)
+        first = _STAMP_LAYER[changed]
+        stages, entity = self._stages, self.entity
+        for layer in range(first, len(stages)):
+            if layer == 0:
+                stats = entity.base_stats
+            elif layer == 1:
+                stats = stages[0].level_scaled(entity.level, entity.meta_level)
+            elif layer == 2:
+                stats = stages[1] + self.equipment.get_total_stats() if self.equipment is not None else stages[1]
+            elif layer == 3:
+                stats = stages[2] + self.skill_bonus
+            else:
+                stats = _apply_modifiers(stages[3], self.effects.modifiers()) if self.effects is not None else stages[3]
+            stages[layer] = stats
+        self._stamps = stamps
+
+    def stage(self, layer: str) -> Stats:
+        """Stats after the named layer and everything below it."""
+        stamps = self._current_stamps()
+        if stamps != self._stamps:
+            self._rebuild(stamps)
+        return self._stages[self.LAYERS.index(layer)]
+
+    @property
+    def total(self) -> Stats:
+        stamps = self._current_stamps()
+        if stamps != self._stamps:
+            self._rebuild(stamps)
+        return self._stages[-1]
+
+
+# Layer each _current_stamps entry belongs to (level and meta level both stamp the level layer)
+_STAMP_LAYER = (0, 1, 1, 2, 3, 4)
+
+
+def _apply_modifiers(stats: Stats, modifiers: Dict[str, float]) -> Stats:
+    if not modifiers:
+        return stats
+    modified = stats.copy()
+    values = modified.values
+    for stat, value in modifiers.items():
+        index = STAT_INDEX[stat]
+        values[index] = max(1, int(values[index] * (1 + value)))
+    return modified
+
 
 class Entity:
     def __init__(self, name: str, entity_type: EntityType, level: int = 1):
@@ -32,25 +242,32 @@ class Entity:
         self.level = level
         self.meta_level = 0
         self.base_stats = Stats()
-        self.current_stats = Stats()
+        self.stat_pipeline = StatPipeline(self)
         self.max_hp = 0
         self.current_hp = 0
 
+    @property
+    def current_stats(self) -> Stats:
+        """Base stats with every layer applied, cached until one of them changes."""
+        return self.stat_pipeline.total
+
     def initialize_stats(self):
+        """Rederive stats after base stats or level change, and refill HP."""
         self.meta_level = self.calculate_meta_level()
-        self.base_stats.level_scale(self.level, self.meta_level)
-        self.current_stats = self.base_stats
+        self.stat_pipeline.invalidate()
         self.max_hp = self.calculate_max_hp()
         self.current_hp = self.max_hp
 
     def calculate_meta_level(self) -> int:
-        stat_sum = sum(getattr(self.base_stats, stat) for stat in self.base_stats.__dict__)
+        stat_sum = sum(self.base_stats.values)
         base_meta = stat_sum / 10
         level_factor = self.level / 20
         return max(1, round(base_meta * (1 + level_factor)))
 
     def calculate_max_hp(self) -> int:
-        base_hp = self.base_stats.health * 2
+        # Equipment and effects never raise max HP
+        health = self.stat_pipeline.stage("level").health + self.stat_pipeline.skill_bonus.health
+        base_hp = health * 2
         level_bonus = int(self.level * 1.5)
         meta_bonus = self.meta_level * 2
-        return base_hp + level_bonus + meta_bonus
\ No newline at end of file
+        return base_hp + level_bonus + meta_bonus
@@ -1,6 +1,6 @@
 from .name_generator import NameGenerator
 from typing import Optional, Dict, List, Tuple
-from ..engine.player import Item, ItemType, ItemStats
+from ..engine.player import Item, ItemStats, ItemTemplate, ItemType
 from ..engine.generics import load_json_config, RandomUtils
 
 class LootGenerator:
@@ -10,8 +10,43 @@ class LootGenerator:
 
     def __init__(self):
         self.items_data = load_json_config("items.json")
+        self.templates = self._build_templates(self.items_data)
         self.name_generator = NameGenerator()
 
+    def reload(self):
+        """Pick up edited item, prefix and description config."""
+        self.items_data = load_json_config("items.json")
+        self.templates = self._build_templates(self.items_data)
+        self.name_generator = NameGenerator()
+
+    @staticmethod
+    def _build_templates(items_data: Dict) -> Dict[str, List[List[ItemTemplate]]]:
+        """
+        Shared item templates per loot category, in the groups items are
+        picked from: one group per armor set, one group for everything else.
+        Entries without a slot (e.g. "elemental" rings) hold more entries.
+        """
+        def template(name: str, data: Dict) -> ItemTemplate:
+            return ItemTemplate(name.replace("_", " "), ItemType[data['slot']], data['base_stats'])
+
+        def flatten(entries: Dict) -> List[ItemTemplate]:
+            templates = []
+            for name, data in entries.items():
+                if 'slot' in data:
+                    templates.append(template(name, data))
+                else:
+                    templates.extend(template(child, child_data) for child, child_data in data.items())
+            return templates
+
+        return {
+            'weapons': [flatten(items_data['weapons'])],
+            'armor': [
+                [template(f"{armor_type} {piece}", data) for piece, data in pieces.items()]
+                for armor_type, pieces in items_data['armor'].items()
+            ],
+            'rings': [flatten(items_data['rings'])],
+        }
+
     def calculate_quality(self, monster_level: int, meta_level: int) -> int:
         quality_chance = (monster_level + meta_level) / 100
         weights = self.QUALITY_WEIGHTS[:]
@@ -27,43 +62,24 @@ class LootGenerator:
         )[0]
 
         try:
-            if category == 'weapons':
-                item_name, item_data = RandomUtils.choice(list(self.items_data['weapons'].items()))
-                item_type = getattr(ItemType, item_data['slot'])
-                base_name = item_name
-                stats = item_data['base_stats']
-            elif category == 'rings':
-                item_name, item_data = RandomUtils.choice(list(self.items_data['rings'].items()))
-                item_type = getattr(ItemType, item_data['slot'])
-                base_name = item_name
-                stats = item_data['base_stats']
-            else:
-                armor_type = RandomUtils.choice(list(self.items_data['armor'].keys()))
-                piece_name, piece_data = RandomUtils.choice(list(self.items_data['armor'][armor_type].items()))
-                item_type = getattr(ItemType, piece_data['slot'])
-                base_name = f"{armor_type} {piece_name}"
-                stats = piece_data['base_stats']
-
+            template = RandomUtils.choice(RandomUtils.choice(self.templates[category]))
             quality = self.calculate_quality(monster_level, meta_level)
-            item_stats = self._calculate_stats(stats, quality, monster_level)
-            name = self.name_generator.generate_name(base_name, quality)
+            item_stats = self._calculate_stats(template, quality, monster_level)
+            name_parts = self.name_generator.generate_name_parts(template.base_name, quality)
         
-            return Item(name, item_type, quality, item_stats)
+            return Item.rolled(template, quality, item_stats, name_parts)
         
         except Exception as e:
             print(f"Error generating item: {str(e)}")
             return None
 
     def _calculate_stats(
-        self, base_stats: Dict, quality: int, monster_level: int
+        self, template: ItemTemplate, quality: int, monster_level: int
     ) -> ItemStats:
         stat_multiplier = 1 + (quality * 0.2) + (monster_level * 0.1)
 
-        item_stats = ItemStats()
-        for stat, value in base_stats.items():
-            setattr(item_stats, stat, int(value * stat_multiplier))
-
-        return item_stats
+        base = template.base_stats
+        return base.replace(**{stat: int(getattr(base, stat) * stat_multiplier) for stat in template.stat_names})
 
     def generate_loot(self, monster_level: int, meta_level: int) -> Tuple[List[Item], int]:
         items = []
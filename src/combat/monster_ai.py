@@ -1,7 +1,11 @@
 # combat/monster_ai.py
 
-from enum import Enum, auto
-from typing import Dict, List
+from bisect import bisect
+from enum import Enum, IntEnum, auto
+from typing import Dict, Mapping, Tuple
+
+import numpy as np
+
 from ..engine.generics import RandomUtils
 
 class BehaviorType(Enum):
@@ -12,117 +16,174 @@ class BehaviorType(Enum):
     AMBUSHER = auto()    # Builds up for strong attacks
     BOSS = auto()        # Uses all abilities strategically
 
+class ActionType(IntEnum):
+    PHYSICAL = 0
+    MAGIC = 1
+    HEAL = 2
+    BUFF = 3
+    DEBUFF = 4
+    SPECIAL = 5
+
+NO_ACTION = len(ActionType)  # "Last action" before the monster has acted
+ATTACKS = (ActionType.PHYSICAL, ActionType.MAGIC)
+
+# Every rule below only compares HP% and turns since the last buff/heal
+# against these thresholds, so a policy needs one row per bucket
+HP_BUCKETS = 6      # <0.3, <0.4, <0.5, <=0.8, <=0.9, >0.9
+BUFF_BUCKETS = 3    # <3, 3-4, >4
+_HP_SAMPLES = (0.0, 0.3, 0.4, 0.5, 0.85, 1.0)
+_BUFF_SAMPLES = (0, 3, 5)
+
+
+# Both take a number or a NumPy array (the batch simulator buckets every fight at once)
+def hp_bucket(hp_percent: float) -> int:
+    return (1 * (hp_percent >= 0.3) + (hp_percent >= 0.4) + (hp_percent >= 0.5)
+            + (hp_percent > 0.8) + (hp_percent > 0.9))
+
+
+def buff_bucket(turns_since_buff: int) -> int:
+    return 1 * (turns_since_buff >= 3) + (turns_since_buff > 4)
+
+
+def _situational_weight(behavior: BehaviorType, action_type: ActionType, hp_percent: float,
+                        last_type: int, turns_since_buff: int) -> float:
+    """Weight multiplier for an action in one situation"""
+    weight_mult = 1.0
+
+    match behavior:
+        case BehaviorType.AGGRESSIVE:
+            if action_type in ATTACKS:
+                weight_mult = 1.5
+            elif hp_percent < 0.3 and action_type == ActionType.HEAL:
+                weight_mult = 2.0
+
+        case BehaviorType.DEFENSIVE:
+            if hp_percent < 0.5 and action_type in (ActionType.HEAL, ActionType.BUFF):
+                weight_mult = 2.0
+            elif hp_percent > 0.8 and action_type in ATTACKS:
+                weight_mult = 1.3
+
+        case BehaviorType.RANGED:
+            if action_type == ActionType.MAGIC:
+                weight_mult = 1.5
+            elif hp_percent < 0.4:
+                weight_mult = 0.7
+
+        case BehaviorType.TRICKSTER:
+            # Prefer alternating between attacks and debuffs
+            if last_type == ActionType.DEBUFF and action_type in ATTACKS:
+                weight_mult = 1.5
+            elif last_type in ATTACKS and action_type == ActionType.DEBUFF:
+                weight_mult = 1.5
+
+        case BehaviorType.AMBUSHER:
+            if last_type == NO_ACTION:
+                # First turn, prefer buffs/preparation
+                if action_type in (ActionType.BUFF, ActionType.SPECIAL):
+                    weight_mult = 2.0
+            elif last_type in (ActionType.BUFF, ActionType.SPECIAL):
+                # Follow up with strong attack
+                if action_type in ATTACKS:
+                    weight_mult = 2.0
+
+        case BehaviorType.BOSS:
+            if hp_percent < 0.3:
+                # Desperate times
+                if action_type in (ActionType.SPECIAL, ActionType.MAGIC):
+                    weight_mult = 2.0
+            elif turns_since_buff > 4:
+                # Haven't buffed in a while
+                if action_type == ActionType.BUFF:
+                    weight_mult = 1.5
+
+    return weight_mult
+
+
+def _behavior_matrix(behavior: BehaviorType) -> np.ndarray:
+    """Multipliers indexed by (hp bucket, last action type, buff bucket, action type)."""
+    matrix = np.ones((HP_BUCKETS, NO_ACTION + 1, BUFF_BUCKETS, len(ActionType)))
+    for h, hp_percent in enumerate(_HP_SAMPLES):
+        for last_type in range(NO_ACTION + 1):
+            for b, turns in enumerate(_BUFF_SAMPLES):
+                for action_type in ActionType:
+                    matrix[h, last_type, b, action_type] = _situational_weight(
+                        behavior, action_type, hp_percent, last_type, turns)
+    return matrix
+
+
+BEHAVIOR_MATRICES: Dict[BehaviorType, np.ndarray] = {
+    behavior: _behavior_matrix(behavior) for behavior in BehaviorType
+}
+
+
+class MonsterPolicy:
+    """
+    A monster type's action choice compiled into cumulative weight rows, one
+    per (hp bucket, last action type, buff bucket). Built once per monster
+    type and shared by every MonsterAI of that type.
+    """
+
+    def __init__(self, behavior: str, actions: Mapping):
+        self.behavior = BehaviorType[behavior.upper()]
+        self.names: Tuple[str, ...] = tuple(actions)
+        self.actions = tuple(actions[name] for name in self.names)
+        self.types = np.array([ActionType[action["type"].upper()] for action in self.actions])
+        self.weights = np.array([action["weight"] for action in self.actions], dtype=float)
+
+        # Skip healing near full health and buffing right after a buff/heal;
+        # if that rules out everything, every action stays viable
+        hp_full = np.array([h == HP_BUCKETS - 1 for h in range(HP_BUCKETS)])[:, None, None]
+        buffed = np.array([b == 0 for b in range(BUFF_BUCKETS)])[None, :, None]
+        skipped = (((self.types == ActionType.HEAL) & hp_full)
+                   | ((self.types == ActionType.BUFF) & buffed))
+        viable = ~skipped
+        viable[~viable.any(axis=2)] = True
+
+        multipliers = BEHAVIOR_MATRICES[self.behavior][..., self.types]
+        weights = self.weights * viable[:, None, :, :] * multipliers
+        self.cumulative = np.cumsum(weights, axis=-1)  # (hp, last type, buff, action)
+        self._rows = self.cumulative.tolist()
+
+    def choose(self, hp_percent: float, last_type: int, turns_since_buff: int) -> int:
+        """Index of the chosen action"""
+        row = self._rows[hp_bucket(hp_percent)][last_type][buff_bucket(turns_since_buff)]
+        return min(bisect(row, RandomUtils.float(0, row[-1])), len(row) - 1)
+
+    @classmethod
+    def compile_all(cls, monster_data: Mapping) -> Dict[str, "MonsterPolicy"]:
+        return {name: cls(data["behavior"], data["actions"]) for name, data in monster_data.items()}
+
+
 class MonsterAI:
-    def __init__(self, monster, behavior: str, actions: Dict):
+    def __init__(self, monster, policy: MonsterPolicy):
         self.monster = monster
-        self.behavior = BehaviorType[behavior.upper()]
-        self.actions = actions
+        self.policy = policy
+        self.behavior = policy.behavior
         self.last_action = None
+        self.last_type = NO_ACTION
         self.turns_since_buff = 0
 
     def choose_action(self, player) -> dict:
         """Choose the next action based on behavior type and current state"""
-        
-        # Get viable actions based on behavior and state
-        viable_actions = self._get_viable_actions(player)
-        
-        # Calculate weights based on current situation
-        weights = []
-        for action_name in viable_actions:
-            base_weight = self.actions[action_name]["weight"]
-            situational_weight = self._calculate_situational_weight(action_name, player)
-            weights.append(base_weight * situational_weight)
-
-        # Choose action based on weights
-        chosen_action_name = RandomUtils.choices(viable_actions, weights=weights)[0]
-        chosen_action = self.actions[chosen_action_name]
-        
+        policy = self.policy
+        hp_percent = self.monster.current_hp / self.monster.max_hp
+        index = policy.choose(hp_percent, self.last_type, self.turns_since_buff)
+        chosen_action_name = policy.names[index]
+        chosen_action = policy.actions[index]
+
         # Update state
         self.last_action = chosen_action_name
-        if chosen_action["type"] in ["buff", "heal"]:
+        self.last_type = int(policy.types[index])
+        if self.last_type in (ActionType.BUFF, ActionType.HEAL):
             self.turns_since_buff = 0
         else:
             self.turns_since_buff += 1
 
         # Get random message for the action
         message = RandomUtils.choice(chosen_action["messages"])
-        
+
         return {
             "name": chosen_action_name,
             "action": chosen_action,
             "message": message.format(name=self.monster.name, target=player.name)
         }
-
-    def _get_viable_actions(self, player) -> List[str]:
-        """Get list of viable actions based on current state"""
-        viable = []
-        hp_percent = self.monster.current_hp / self.monster.max_hp
-
-        for name, action in self.actions.items():
-            # Skip healing if at full health
-            if action["type"] == "heal" and hp_percent > 0.9:
-                continue
-                
-            # Skip buffs if recently buffed
-            if action["type"] == "buff" and self.turns_since_buff < 3:
-                continue
-
-            viable.append(name)
-
-        return viable if viable else list(self.actions.keys())
-
-    def _calculate_situational_weight(self, action_name: str, player) -> float:
-        """Calculate situational weight multiplier for an action"""
-        action = self.actions[action_name]
-        action_type = action["type"]
-        hp_percent = self.monster.current_hp / self.monster.max_hp
-        weight_mult = 1.0
-
-        match self.behavior:
-            case BehaviorType.AGGRESSIVE:
-                if action_type in ["physical", "magic"]:
-                    weight_mult = 1.5
-                elif hp_percent < 0.3 and action_type == "heal":
-                    weight_mult = 2.0
-
-            case BehaviorType.DEFENSIVE:
-                if hp_percent < 0.5 and action_type in ["heal", "buff"]:
-                    weight_mult = 2.0
-                elif hp_percent > 0.8 and action_type in ["physical", "magic"]:
-                    weight_mult = 1.3
-
-            case BehaviorType.RANGED:
-                if action_type == "magic":
-                    weight_mult = 1.5
-                elif hp_percent < 0.4:
-                    weight_mult = 0.7
-
-            case BehaviorType.TRICKSTER:
-                if self.last_action:
-                    # Prefer alternating between attacks and debuffs
-                    if self.last_action["type"] == "debuff" and action_type in ["physical", "magic"]:
-                        weight_mult = 1.5
-                    elif self.last_action["type"] in ["physical", "magic"] and action_type == "debuff":
-                        weight_mult = 1.5
-
-            case BehaviorType.AMBUSHER:
-                if not self.last_action:
-                    # First turn, prefer buffs/preparation
-                    if action_type in ["buff", "special"]:
-                        weight_mult = 2.0
-                elif self.last_action["type"] in ["buff", "special"]:
-                    # Follow up with strong attack
-                    if action_type in ["physical", "magic"]:
-                        weight_mult = 2.0
-
-            case BehaviorType.BOSS:
-                if hp_percent < 0.3:
-                    # Desperate times
-                    if action_type in ["special", "magic"]:
-                        weight_mult = 2.0
-                elif self.turns_since_buff > 4:
-                    # Haven't buffed in a while
-                    if action_type == "buff":
-                        weight_mult = 1.5
-
-        return weight_mult
\ No newline at end of file
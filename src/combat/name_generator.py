@@ -1,3 +1,5 @@
+from typing import Tuple
+
 from ..engine.generics import load_json_config, RandomUtils
 
 class NameGenerator:
@@ -7,6 +9,10 @@ class NameGenerator:
         self.the_categories = ["creatures", "planes", "locations", "materials"]
 
     def generate_name(self, base_name: str, quality: int) -> str:
+        return " ".join(self.generate_name_parts(base_name, quality))
+
+    def generate_name_parts(self, base_name: str, quality: int) -> Tuple[str, ...]:
+        """Name as words taken from the config lists, so items share the strings."""
         prefix = RandomUtils.choice(self.prefixes[str(quality)])
         
         if RandomUtils.chance(0.5):
@@ -14,8 +20,8 @@ class NameGenerator:
             description = RandomUtils.choice(self.descriptions[category])
             
             if category in self.the_categories:
-                description = f"the {description}"
+                return (prefix, base_name, "of", "the", description)
             
-            return f"{prefix} {base_name} of {description}"
+            return (prefix, base_name, "of", description)
         
-        return f"{prefix} {base_name}"
\ No newline at end of file
+        return (prefix, base_name)
@@ -1,7 +1,9 @@
 from enum import Enum
 from typing import Dict, List, Optional
+from .entity import Stats
 from .skills import Skill, SkillRequirement
 from ..engine.generics import load_json_config
+from ..engine.core.event_bus import EventBus, EventType
 
 class SkillTreeNode:
     def __init__(self, skill: Skill, position: tuple[int, int], exclusive_group: Optional[str] = None):
@@ -33,23 +35,55 @@ class SkillTree:
         }
         self.available_points = 0
         self.exclusive_groups: Dict[str, SkillTreeNode] = {}
+        self.version = 0  # Bumped whenever unlock state or points change
+        self.layout_version = 0  # Bumped whenever reload() replaces the nodes
         self._load_skill_trees()
 
+    def reload(self):
+        """
+        Rebuild every branch from skill_trees.json, keeping unlocks for skills
+        that still exist (matched by branch and name). Points are untouched;
+        callers refresh the player's skill bonus from unlocked_bonus().
+        """
+        unlocked = {(branch, node.skill.name)
+                    for branch, nodes in self.branches.items()
+                    for node in nodes if node.skill.unlocked}
+        self.branches = {branch: [] for branch in SkillBranch}
+        self.exclusive_groups = {}
+        self._load_skill_trees()
+
+        for branch, nodes in self.branches.items():
+            for node in nodes:
+                if (branch, node.skill.name) in unlocked:
+                    node.skill.unlocked = True
+                    if node.exclusive_group:
+                        self.exclusive_groups[node.exclusive_group] = node
+        self.version += 1
+        self.layout_version += 1
+
+    def reset(self):
+        """Lock every skill and drop unspent points, for a new game."""
+        for nodes in self.branches.values():
+            for node in nodes:
+                node.skill.unlocked = False
+        self.exclusive_groups = {}
+        self.available_points = 0
+        self.version += 1
+
     def _load_skill_trees(self):
         """Load skill trees from JSON file"""
         try:
-            print("Loading skill trees from JSON...")
             skill_trees = load_json_config("skill_trees.json")
-            print(f"Loaded skill trees data: {list(skill_trees.keys())}")
             for branch_name, branch_data in skill_trees.items():
-                print(f"Building branch: {branch_name}")
                 branch = SkillBranch[branch_name]
                 self._build_branch(branch, branch_data)
-                print(f"Built branch {branch_name} with {len(self.branches[branch])} nodes")
+            EventBus().publish(EventType.SKILL_TREE_LOADED, branches={
+                branch.name: len(nodes) for branch, nodes in self.branches.items()
+            })
         except Exception as e:
-            print(f"Error loading skill trees: {str(e)}")
             import traceback
-            print(traceback.format_exc())
+            from ..engine.core.services import ConfigService
+            ConfigService().logger.error("Error loading skill trees: %s\n%s", e, traceback.format_exc())
 
     def can_unlock_skill(self, node: SkillTreeNode, player) -> bool:
         """Check if a skill can be unlocked"""
@@ -81,22 +115,33 @@ class SkillTree:
 
         self.available_points -= node.skill_points_required
         node.skill.unlocked = True
+        self.version += 1
+        branch = next(branch for branch, nodes in self.branches.items() if node in nodes)
+        EventBus().publish(EventType.SKILL_UNLOCKED, skill=node.skill.name, branch=branch.name)
 
         # Handle exclusive group
         if node.exclusive_group:
             self.exclusive_groups[node.exclusive_group] = node
 
         # Apply stat buffs
-        for stat, value in node.stats_buff.items():
-            current = getattr(player.base_stats, stat)
-            setattr(player.base_stats, stat, current + value)
+        player.stat_pipeline.add_skill_bonus(node.stats_buff)
         player.initialize_stats()
 
         return True
 
+    def unlocked_bonus(self) -> Stats:
+        """Summed stat buffs of every unlocked skill, as in the current config."""
+        bonus = Stats.zero()
+        for nodes in self.branches.values():
+            for node in nodes:
+                if node.skill.unlocked and node.stats_buff:
+                    bonus += Stats.zero().replace(**node.stats_buff)
+        return bonus
+
     def add_skill_points(self, points: int):
         """Add skill points to be spent"""
         self.available_points += points
+        self.version += 1
 
     def get_available_skills(self, player) -> Dict[SkillBranch, List[SkillTreeNode]]:
         """Get all skills that can currently be unlocked"""
@@ -2,6 +2,8 @@ from enum import Enum, auto
 from dataclasses import dataclass
 from typing import Dict, List, Optional
 
+from .entity import Stats
+
 class SkillType(Enum):
     PHYSICAL = auto()
     MAGICAL = auto()
@@ -28,17 +30,33 @@ class DebuffType(Enum):
     FROZEN = auto()      # Can't move
     STUNNED = auto()     # Skip turn
 
-@dataclass
-class SkillRequirement:
-    strength: int = 0
-    defence: int = 0
-    magic_power: int = 0
-    magic_defence: int = 0
-    speed: int = 0
-    dexterity: int = 0
-    wisdom: int = 0
-    intelligence: int = 0
-    level: int = 1
+class SkillRequirement(Stats):
+    """Minimum stats (0 where a stat is not required) plus a minimum level."""
+
+    __slots__ = ('level',)
+    DEFAULTS = (0,) * 10
+
+    def __init__(self, *values: int, level: int = 1, **named: int):
+        super().__init__(*values, **named)
+        self.level = level
+
+    @classmethod
+    def _wrap(cls, values) -> "SkillRequirement":
+        requirement = super()._wrap(values)
+        requirement.level = 1
+        return requirement
+
+    def copy(self) -> "SkillRequirement":
+        requirement = super().copy()
+        requirement.level = self.level
+        return requirement
+
+    def __eq__(self, other) -> bool:
+        result = super().__eq__(other)
+        return result if result is NotImplemented else result and self.level == other.level
+
+    def __repr__(self) -> str:
+        return f"{super().__repr__()[:-1]}, level={self.level})"
 
 @dataclass
 class Buff:
@@ -77,14 +95,7 @@ class Skill:
 
     def meets_requirements(self, player) -> bool:
         """Check if player meets skill requirements"""
-        if player.level < self.requirements.level:
-            return False
-            
-        for stat, required in self.requirements.__dict__.items():
-            if getattr(player.current_stats, stat, 0) < required:
-                return False
-                
-        return True
+        return player.level >= self.requirements.level and player.current_stats >= self.requirements
 
     def is_available(self) -> bool:
         """Check if skill is ready to use"""
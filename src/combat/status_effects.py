@@ -0,0 +1,164 @@
+"""
+Status effects in combat.
+
+Buffs and debuffs from skills.py attach to an entity's EffectStack for the
+rest of a fight. Each stack counts its entity's own turns: an effect lasts
+`duration` of the affected entity's turns, and expirations sit in a
+min-heap keyed by the turn they run out on. Starting a turn pops only what
+expires and ticks only the damage/regen effects, so the cost does not grow
+with the number of stat effects in play. Stat modifiers are summed into a
+cached dict that is rebuilt only when effects change; the stack is the
+effects layer of its entity's StatPipeline while the fight lasts.
+"""
+
+import heapq
+from itertools import count
+from typing import Dict, List, Optional, Tuple, Union
+
+from .entity import Entity, Stats
+from .skills import Buff, BuffType, Debuff, DebuffType
+
+Effect = Union[Buff, Debuff]
+
+# Effect type -> (stat, sign); magnitude is a fraction of the stat
+STAT_EFFECTS: Dict[object, Tuple[str, int]] = {
+    BuffType.STRENGTH: ("strength", 1),
+    BuffType.DEFENCE: ("defence", 1),
+    BuffType.MAGIC_POWER: ("magic_power", 1),
+    BuffType.MAGIC_DEFENCE: ("magic_defence", 1),
+    BuffType.SPEED: ("speed", 1),
+    BuffType.DEXTERITY: ("dexterity", 1),
+    DebuffType.WEAKNESS: ("strength", -1),
+    DebuffType.VULNERABLE: ("defence", -1),
+    DebuffType.SLOW: ("speed", -1),
+    DebuffType.CONFUSION: ("dexterity", -1),
+}
+# Effect type -> HP change per magnitude point, applied at the start of each turn
+TICK_EFFECTS: Dict[object, int] = {
+    BuffType.HEALTH_REGEN: 1,
+    DebuffType.BURNING: -1,
+    DebuffType.POISONED: -1,
+}
+SKIP_TURN_EFFECTS = frozenset({DebuffType.FROZEN, DebuffType.STUNNED})
+MIN_MODIFIER = -0.9  # Stacked debuffs never take a stat below a tenth
+
+
+def parse_effect(data: dict, source: str) -> Effect:
+    """An effect from a config entry such as {"type": "BURNING", "magnitude": 3, "duration": 3}."""
+    name = data["type"].upper()
+    if name in BuffType.__members__:
+        return Buff(BuffType[name], data.get("magnitude", 0.0), data["duration"], source)
+    return Debuff(DebuffType[name], data.get("magnitude", 0.0), data["duration"], source)
+
+
+class TurnStart:
+    """What an entity's effects did at the start of its turn."""
+
+    __slots__ = ('hp_change', 'skip', 'expired')
+
+    def __init__(self):
+        self.hp_change = 0
+        self.skip = False
+        self.expired: List[Effect] = []
+
+
+class EffectStack:
+    """Active effects on one entity."""
+
+    def __init__(self):
+        self.turn = 0
+        # Reapplying the same effect from the same source refreshes it
+        self.active: Dict[tuple, Tuple[Effect, int]] = {}  # (type, source) -> (effect, expires on turn)
+        self._expiry: List[tuple] = []  # Min-heap of (turn, seq, key); stale entries are skipped
+        self._seq = count()
+        self._ticking: Dict[tuple, Effect] = {}
+        self._skipping: Dict[tuple, Effect] = {}
+        self._modifiers: Optional[Dict[str, float]] = None
+        self.version = 0  # Bumped whenever the stat modifiers change
+
+    def add(self, effect: Effect) -> None:
+        key = (effect.type, effect.source)
+        expires = self.turn + effect.duration + 1  # Active for the next `duration` turns
+        self.active[key] = (effect, expires)
+        heapq.heappush(self._expiry, (expires, next(self._seq), key))
+        if effect.type in TICK_EFFECTS:
+            self._ticking[key] = effect
+        if effect.type in SKIP_TURN_EFFECTS:
+            self._skipping[key] = effect
+        if effect.type in STAT_EFFECTS:
+            self._invalidate()
+
+    def _invalidate(self) -> None:
+        self._modifiers = None
+        self.version += 1
+
+    def begin_turn(self) -> TurnStart:
+        """Advance to this entity's next turn: expire, then tick, then check for a skipped turn."""
+        self.turn += 1
+        start = TurnStart()
+        heap = self._expiry
+        while heap and heap[0][0] <= self.turn:
+            expires, _, key = heapq.heappop(heap)
+            entry = self.active.get(key)
+            if entry is None or entry[1] != expires:
+                continue  # Refreshed since this entry was pushed
+            effect = entry[0]
+            del self.active[key]
+            self._ticking.pop(key, None)
+            self._skipping.pop(key, None)
+            if effect.type in STAT_EFFECTS:
+                self._invalidate()
+            start.expired.append(effect)
+
+        for effect in self._ticking.values():
+            start.hp_change += int(effect.magnitude) * TICK_EFFECTS[effect.type]
+        start.skip = bool(self._skipping)
+        return start
+
+    def modifiers(self) -> Dict[str, float]:
+        """Summed fractional modifier per stat, rebuilt only after effects change."""
+        if self._modifiers is None:
+            modifiers: Dict[str, float] = {}
+            for effect, _ in self.active.values():
+                stat_effect = STAT_EFFECTS.get(effect.type)
+                if stat_effect:
+                    stat, sign = stat_effect
+                    modifiers[stat] = modifiers.get(stat, 0.0) + sign * effect.magnitude
+            self._modifiers = {stat: max(MIN_MODIFIER, value) for stat, value in modifiers.items()}
+        return self._modifiers
+
+
+class StatusEffectEngine:
+    """Effect stacks for everyone in the current fight."""
+
+    def __init__(self):
+        self.stacks: Dict[int, EffectStack] = {}
+        self._entities: Dict[int, Entity] = {}
+
+    def clear(self) -> None:
+        for entity in self._entities.values():
+            entity.stat_pipeline.effects = None
+        self.stacks.clear()
+        self._entities.clear()
+
+    def stack(self, entity: Entity) -> EffectStack:
+        stack = self.stacks.get(id(entity))
+        if stack is None:
+            stack = self.stacks[id(entity)] = EffectStack()
+            self._entities[id(entity)] = entity
+            entity.stat_pipeline.effects = stack
+        return stack
+
+    def apply_effect(self, entity: Entity, effect: Effect) -> None:
+        self.stack(entity).add(effect)
+
+    def begin_turn(self, entity: Entity) -> TurnStart:
+        """Start entity's turn, applying damage over time and regeneration to its HP."""
+        start = self.stack(entity).begin_turn()
+        if start.hp_change:
+            entity.current_hp = min(entity.max_hp, entity.current_hp + start.hp_change)
+        return start
+
+    def stats(self, entity: Entity) -> Stats:
+        """Entity's current stats with its effects applied."""
+        return entity.current_stats
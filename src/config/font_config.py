@@ -1,22 +1,73 @@
-from typing import Dict, Set
+from typing import Dict, List, Sequence, Set, Tuple
 from ..engine.generics import load_json_config
+from ..engine.core.font_service import FontService
 
 class FontConfig:
+    """
+    Which loaded fonts can draw which characters.
+
+    Every character maps to a bitmask with one bit per font (in
+    font_support.json order), so "fonts that have all of these characters" is
+    a bitwise AND. Support declared in font_support.json is narrowed to the
+    glyphs actually present when the named font resolves to a real file.
+    """
+
     def __init__(self, fonts):
         self.fonts = fonts
+        self.version = 0  # Bumped on reload; tables derived from coverage key on it
+        self.reload()
+
+    def reload(self):
         self.glyph_support = self.load_glyph_support()
+        self.font_names: Tuple[str, ...] = tuple(
+            name for name in self.glyph_support if name in self.fonts
+        ) or tuple(self.fonts) or tuple(self.glyph_support)
+        self.char_masks: Dict[str, int] = {}
+        for bit, font_name in enumerate(self.font_names):
+            for char in self.glyph_support.get(font_name, ()):
+                self.char_masks[char] = self.char_masks.get(char, 0) | (1 << bit)
+        self.version += 1
 
     def load_glyph_support(self) -> Dict[str, Set[str]]:
         font_data = load_json_config("font_support.json")
-        return {k: set(v) for k, v in font_data.items()}
+        font_service = FontService()
+        support = {}
+        for font_name, chars in font_data.items():
+            support[font_name] = set(chars)
+            if font_service.resolve(font_name) is not None:
+                support[font_name] = font_service.coverage(font_name, chars)
+        return support
+
+    def mask_for(self, chars: Sequence[str]) -> int:
+        """Bitmask of the fonts that can draw every one of chars."""
+        mask = (1 << len(self.font_names)) - 1
+        for char in chars:
+            mask &= self.char_masks.get(char, 0)
+        return mask
+
+    def fonts_in(self, mask: int) -> List[str]:
+        return [name for bit, name in enumerate(self.font_names) if mask >> bit & 1]
 
     def get_supported_chars(self, font_name: str, chars: list[str]) -> list[str]:
-        if font_name not in self.glyph_support:
+        if font_name not in self.font_names:
             return []
-        return [char for char in chars if char in self.glyph_support[font_name]]
+        bit = 1 << self.font_names.index(font_name)
+        return [char for char in chars if self.char_masks.get(char, 0) & bit]
 
     def get_valid_font_for_chars(self, chars: list[str]) -> str:
-        for font_name, supported_chars in self.glyph_support.items():
-            if all(char in supported_chars for char in chars):
-                return font_name
-        return next(iter(self.glyph_support.keys()))
\ No newline at end of file
+        fonts = self.fonts_in(self.mask_for(chars))
+        return fonts[0] if fonts else self.font_names[0]
+
+    def resolve_glyphs(self, chars: Sequence[str]) -> List[Tuple[str, Tuple[str, ...]]]:
+        """
+        Each drawable character with the fonts that have it. Repeated
+        characters stay repeated, since they weight the pick. Characters no
+        loaded font can draw are dropped; if none are left, "." in the first
+        font stands in.
+        """
+        resolved = []
+        for char in chars:
+            fonts = self.fonts_in(self.char_masks.get(char, 0))
+            if fonts:
+                resolved.append((char, tuple(fonts)))
+        return resolved or [(".", (self.font_names[0],))]
@@ -4,7 +4,13 @@ class GameConfig:
     SCREEN_WIDTH = 1920
     SCREEN_HEIGHT = 1080
     GRID_SIZE = 20
-    FPS = 60
+    FPS = 60  # Render cap, 0 renders as fast as possible
+    TICK_RATE = 20  # Fixed simulation ticks per second
+    MAX_FRAME_TIME = 0.25  # Longest frame fed to the simulation, in seconds
+    AUTOSAVE_INTERVAL = 10.0  # Seconds between autosaves while the game state is dirty
+    JOURNAL_COMPACT_BYTES = 64 * 1024  # Journal size that triggers folding it into the snapshot
+    CONFIG_POLL_INTERVAL = 1.0  # Seconds between config file checks when hot-reload is on
+    LOG_QUEUE_SIZE = 10_000  # Log records waiting for the writer thread before new ones are dropped
 
     BIOME_SCALE = 150.0
     ELEVATION_SCALE = 100.0
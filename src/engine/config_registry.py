@@ -0,0 +1,182 @@
+"""
+Parse-once registry for the JSON files in src/config.
+
+Every file is parsed at most once per process and served as a read-only view
+(dicts become mappingproxies, lists become tuples) shared by every caller.
+Parsed data is also kept in a marshal cache in the user data directory,
+keyed by each file's mtime, size and content hash, so cold starts skip JSON
+parsing for unchanged files. The cache is written once per batch of parses
+(a preload, a reload check or a single first-use load), under the registry lock. reload_changed() re-checks loaded files for
+hot-reloading; nothing is polled unless it is called.
+"""
+
+import os
+import json
+import time
+import marshal
+import hashlib
+import threading
+from types import MappingProxyType
+from typing import Any, Dict, Tuple
+
+from .generics import get_project_root, get_data_dir
+
+CACHE_VERSION = 1
+
+
+def freeze(value: Any) -> Any:
+    """Read-only view of parsed JSON."""
+    if isinstance(value, dict):
+        return MappingProxyType({key: freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(freeze(item) for item in value)
+    return value
+
+
+class ConfigRegistry:
+    """Shared, immutable configuration data with per-file load timings."""
+
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+        return cls._instance
+
+    def __init__(self):
+        if not hasattr(self, 'initialized'):
+            self.initialized = True
+            self.cache_path = os.path.join(get_data_dir(), 'cache', 'config.marshal')
+            self._views: Dict[str, Any] = {}
+            self._timings: Dict[str, Tuple[str, float]] = {}
+            self._paths: Dict[str, str] = {}
+            self._stamps: Dict[str, Tuple[int, int]] = {}
+            self.versions: Dict[str, int] = {}  # Bumped each time a file is reloaded with new content
+            self._lock = threading.RLock()
+            self._disk_cache = None
+            self._cache_dirty = False  # Parsed since the cache file was last written
+
+    def get(self, filename: str, subdirectory: str = "config") -> Any:
+        """Read-only view of one config file, parsed on first use."""
+        key = f"{subdirectory}/{filename}"
+        view = self._views.get(key)
+        if view is None:
+            with self._lock:
+                view = self._views.get(key)
+                if view is None:
+                    view = self._load(key, os.path.join(get_project_root(), "src", subdirectory, filename))
+                    self._write_disk_cache()
+        return view
+
+    def preload(self, subdirectory: str = "config") -> int:
+        """Load every JSON file in a directory up front; returns how many."""
+        directory = os.path.join(get_project_root(), "src", subdirectory)
+        names = sorted(name for name in os.listdir(directory) if name.endswith(".json"))
+        with self._lock:
+            for name in names:
+                key = f"{subdirectory}/{name}"
+                if key not in self._views:
+                    self._load(key, os.path.join(directory, name))
+            self._write_disk_cache()
+        return len(names)
+
+    def _load(self, key: str, path: str) -> Any:
+        start = time.perf_counter()
+        stat = os.stat(path)
+        cache = self._read_disk_cache()
+        entry = cache.get(key)
+
+        if entry and entry[0] == stat.st_mtime_ns and entry[1] == stat.st_size:
+            source, data = "binary cache", entry[3]
+        else:
+            source, data = self._parse(key, path, stat, entry)
+
+        view = freeze(data)
+        self._views[key] = view
+        self._paths[key] = path
+        self._stamps[key] = (stat.st_mtime_ns, stat.st_size)
+        self.versions.setdefault(key, 0)
+        self._timings[key] = (source, (time.perf_counter() - start) * 1000)
+        return view
+
+    def _parse(self, key: str, path: str, stat: os.stat_result, entry) -> Tuple[str, Any]:
+        """Read the file, reusing the cached data if its content hash still matches."""
+        with open(path, "rb") as f:
+            raw = f.read()
+        digest = hashlib.blake2b(raw, digest_size=16).digest()
+        if entry and entry[2] == digest:
+            # Touched but unchanged, e.g. after a checkout
+            source, data = "binary cache", entry[3]
+        else:
+            source, data = "json", json.loads(raw.decode("utf-8"))
+        cache = self._read_disk_cache()
+        cache[key] = (stat.st_mtime_ns, stat.st_size, digest, data)
+        self._cache_dirty = True
+        return source, data
+
+    def reload_changed(self) -> Dict[str, Tuple[Any, Any]]:
+        """
+        Re-read loaded files whose mtime or size changed.
+
+        Returns {"config/name.json": (old view, new view)} for files whose
+        content really changed. Files that fail to parse keep their current
+        view, so a half-saved edit never reaches the game.
+        """
+        changed = {}
+        with self._lock:
+            for key, path in self._paths.items():
+                try:
+                    stat = os.stat(path)
+                    if (stat.st_mtime_ns, stat.st_size) == self._stamps[key]:
+                        continue
+                    self._stamps[key] = (stat.st_mtime_ns, stat.st_size)
+                    entry = self._read_disk_cache().get(key)
+                    source, data = self._parse(key, path, stat, entry)
+                except (OSError, ValueError):
+                    continue
+                if source == "binary cache":
+                    continue
+                old_view = self._views[key]
+                self._views[key] = freeze(data)
+                self.versions[key] += 1
+                changed[key] = (old_view, self._views[key])
+            self._write_disk_cache()
+        return changed
+
+    def _read_disk_cache(self) -> Dict[str, tuple]:
+        if self._disk_cache is None:
+            self._disk_cache = {}
+            try:
+                with open(self.cache_path, "rb") as f:
+                    version, entries = marshal.loads(f.read())
+                if version == CACHE_VERSION:
+                    self._disk_cache = entries
+            except (OSError, EOFError, ValueError, TypeError):
+                pass
+        return self._disk_cache
+
+    def _write_disk_cache(self) -> None:
+        """Write the cache file if anything was parsed since the last write."""
+        with self._lock:
+            if not self._cache_dirty:
+                return
+            self._cache_dirty = False
+            # Per-writer temp name, so another process starting up never shares it
+            temp_path = f"{self.cache_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            try:
+                os.makedirs(os.path.dirname(self.cache_path), exist_ok=True)
+                with open(temp_path, "wb") as f:
+                    f.write(marshal.dumps((CACHE_VERSION, self._disk_cache)))
+                os.replace(temp_path, self.cache_path)
+            except OSError:
+                pass  # The cache is only an optimisation
+
+    def timings(self) -> Dict[str, Tuple[str, float]]:
+        """{file: (source, milliseconds)} for every file loaded so far."""
+        return dict(self._timings)
+
+    def report(self) -> str:
+        lines = [f"  {key}: {ms:.2f} ms from {source}"
+                 for key, (source, ms) in sorted(self._timings.items())]
+        total = sum(ms for _, ms in self._timings.values())
+        return "\n".join([f"Config: {len(lines)} files in {total:.2f} ms"] + lines)
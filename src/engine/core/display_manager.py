@@ -1,25 +1,48 @@
+import os
+import math
 import random
 import pygame
-import numpy as np
 from typing import Dict
+from concurrent.futures import Future
 from ...config.game_config import GameConfig
 from ...config.font_config import FontConfig
+from ...UI.overlay_pool import OverlayPool
+from .profiler import FrameProfiler
+from .font_service import FontService
 
 class DisplayManager:
-    def __init__(self):
+    def __init__(self, headless: bool = False, font_names: Future = None):
+        """
+        Args:
+            headless: Render to an off-screen surface
+            font_names: Font name resolution already running on a worker (see
+                resolve_fonts), waited for once the window is open
+        """
+        if headless:
+            # Off-screen SDL surface: the full UI still renders, nothing is shown
+            os.environ["SDL_VIDEODRIVER"] = "dummy"
+            os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
         pygame.init()
+        self.headless = headless
         self.show_noise_map = False
         self.show_cell_borders = False
         self.clock = pygame.time.Clock()
-        self.fonts = self._initialize_fonts()
+        self.profiler = FrameProfiler()
         pygame.display.set_caption("Adventure")
+        if headless:
+            self.screen = pygame.display.set_mode((GameConfig.SCREEN_WIDTH, GameConfig.SCREEN_HEIGHT))
+        else:
+            self.screen = pygame.display.set_mode((0, 0), pygame.FULLSCREEN)
+        if font_names is not None:
+            font_names.result()
+        self.fonts = self.load_fonts()
         self.font_config = FontConfig(self.fonts)
-        self.screen = pygame.display.set_mode((0, 0), pygame.FULLSCREEN)
 
     def render_debug_maps(self, debug_maps):
         """Renders debug visualization of noise maps"""
         if not debug_maps:
             return
+        import numpy as np
         
         if hasattr(self, 'show_noise_map') and self.show_noise_map:
             # Convert noise map to pygame surface
@@ -55,15 +78,33 @@ class DisplayManager:
         self.show_cell_borders = not self.show_cell_borders
         self.show_noise_map = False
 
-    def _initialize_fonts(self) -> Dict[str, pygame.font.Font]:
+    @staticmethod
+    def resolve_fonts() -> None:
+        """
+        Resolve the configured font names to files (a system font scan on a
+        cold cache). Pure Python, so it can run on a worker thread.
+        """
+        font_service = FontService()
+        for font_name in GameConfig.FONTS:
+            font_service.resolve(font_name)
+        font_service.save()
+
+    @staticmethod
+    def load_fonts() -> Dict[str, pygame.font.Font]:
+        """Create the Font objects; SDL_ttf is not thread-safe, so main thread only."""
+        pygame.font.init()
         fonts = {}
+        font_service = FontService()
         for font_name in GameConfig.FONTS:
-            fonts[font_name] = pygame.font.SysFont(font_name, GameConfig.GRID_SIZE)
+            fonts[font_name] = font_service.get(font_name, GameConfig.GRID_SIZE)
         if not fonts:
-            fonts["default"] = pygame.font.SysFont(None, GameConfig.GRID_SIZE)
+            fonts["default"] = font_service.get(None, GameConfig.GRID_SIZE)
+        font_service.save()
         return fonts
 
     def toggle_fullscreen(self):
+        if self.headless:
+            return
         is_fullscreen = bool(self.screen.get_flags() & pygame.FULLSCREEN)
         if is_fullscreen:
             self.screen = pygame.display.set_mode(
@@ -71,42 +112,57 @@ class DisplayManager:
             )
         else:
             self.screen = pygame.display.set_mode((0, 0), pygame.FULLSCREEN)
+        OverlayPool().resize(self.screen.get_size())
 
     def render(self, game_state, world, player, ui_manager):
+        profiler = self.profiler
         self.screen.fill(GameConfig.BLACK)
 
         if game_state.current_state == "menu":
-            ui_manager.menu.render()
+            with profiler.stage("ui:menu"):
+                ui_manager.menu.render()
         elif game_state.current_state == "combat":
-            ui_manager.combat_ui.render(player, game_state.current_enemy)
+            with profiler.stage("ui:combat"):
+                ui_manager.combat_ui.render(player, game_state.current_enemy)
         else:
-            self._render_game_world(world, player)
-            ui_manager.inventory_ui.render(player)
-            ui_manager.combat_log.render()
-            ui_manager.skill_tree_ui.render(game_state.skill_tree, player)  # Add this line
+            with profiler.stage("terrain"):
+                self._render_game_world(world, player, game_state.interpolation)
+            with profiler.stage("ui:inventory"):
+                ui_manager.inventory_ui.render(player)
+            with profiler.stage("ui:combat_log"):
+                ui_manager.combat_log.render()
+            with profiler.stage("ui:skill_tree"):
+                ui_manager.skill_tree_ui.render(game_state.skill_tree, player)
 
             if game_state.current_state == "level_up":
-                ui_manager.level_up_ui.render(player.current_stats)
+                with profiler.stage("ui:level_up"):
+                    ui_manager.level_up_ui.render(player.current_stats)
+
+        ui_manager.profiler_ui.render(profiler)
 
-        pygame.display.flip()
+        with profiler.stage("present"):
+            pygame.display.flip()
 
-    def _render_game_world(self, world, player):
+    def _render_game_world(self, world, player, alpha: float = 1.0):
         screen_width, screen_height = self.screen.get_size()
         half_width = screen_width // (2 * GameConfig.GRID_SIZE)
         half_height = screen_height // (2 * GameConfig.GRID_SIZE)
         
-        self._render_terrain(world, player, half_width, half_height)
+        self._render_terrain(world, player, half_width, half_height, alpha)
         self._render_player(screen_width, screen_height)
 
-    def _render_terrain(self, world, player, half_width: int, half_height: int):
-        px, py = player.x, player.y
-        for y in range(-half_height, half_height + 1):
-            for x in range(-half_width, half_width + 1):
+    def _render_terrain(self, world, player, half_width: int, half_height: int, alpha: float = 1.0):
+        # The camera follows the player's interpolated position, so the map
+        # scrolls smoothly between simulation ticks
+        cam_x, cam_y = player.interpolated_position(alpha)
+        px, py = math.floor(cam_x), math.floor(cam_y)
+        offset_x = int((cam_x - px) * GameConfig.GRID_SIZE)
+        offset_y = int((cam_y - py) * GameConfig.GRID_SIZE)
+        for y in range(-half_height, half_height + 2):
+            for x in range(-half_width, half_width + 2):
                 wx, wy = px + x, py + y
-                chunk = world.get_chunk(
-                    wx // world.chunk_size,
-                    wy // world.chunk_size
-                )
+                chunk_key = (wx // world.chunk_size, wy // world.chunk_size)
+                chunk = world.get_chunk(*chunk_key)
                 local_x, local_y = (
                     wx % world.chunk_size,
                     wy % world.chunk_size,
@@ -114,10 +170,17 @@ class DisplayManager:
                 
                 char, color = chunk.terrain[local_y][local_x]
                 font_name = chunk.fonts[local_y][local_x]
+
+                # Player edits override the generated tile
+                edits = world.overlay.chunk_edits(chunk_key)
+                if edits and (local_x, local_y) in edits:
+                    (char, color), edit_font, _ = edits[(local_x, local_y)]
+                    font_name = edit_font or font_name
+
                 text = self.fonts[font_name].render(char, True, color)
                 
-                screen_x = (x + half_width) * GameConfig.GRID_SIZE
-                screen_y = (y + half_height) * GameConfig.GRID_SIZE
+                screen_x = (x + half_width) * GameConfig.GRID_SIZE - offset_x
+                screen_y = (y + half_height) * GameConfig.GRID_SIZE - offset_y
                 self.screen.blit(text, (screen_x, screen_y))
 
     def _render_player(self, screen_width: int, screen_height: int):
@@ -141,4 +204,33 @@ class DisplayManager:
         return ".", next(iter(self.fonts.keys()))
 
     def cleanup(self):
-        pygame.quit()
\ No newline at end of file
+        pygame.quit()
+
+
+class NullDisplayManager(DisplayManager):
+    """
+    Display backend for headless runs without a UI layer.
+    Opens no window and loads no fonts; only font names are kept for world generation.
+    """
+
+    def __init__(self):
+        self.headless = True
+        self.show_noise_map = False
+        self.show_cell_borders = False
+        self.clock = pygame.time.Clock()
+        self.profiler = FrameProfiler()
+        self.fonts = {font_name: None for font_name in GameConfig.FONTS}
+        self.font_config = FontConfig(self.fonts)
+        self.screen = None
+
+    def render(self, game_state, world, player, ui_manager):
+        pass
+
+    def toggle_fullscreen(self):
+        pass
+
+    def get_screen_dimensions(self):
+        return GameConfig.SCREEN_WIDTH, GameConfig.SCREEN_HEIGHT
+
+    def cleanup(self):
+        pass
\ No newline at end of file
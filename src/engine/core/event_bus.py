@@ -0,0 +1,123 @@
+"""
+Structured game events.
+
+Gameplay and UI code publish typed events (combat started, damage dealt,
+loot, item moved, skill unlocked, ...) instead of printing. The most recent
+events stay in a bounded ring buffer; logs, UI panels and metrics subscribe
+to the types they care about. An event's text is only formatted when a
+consumer asks for it, so publishing costs a small object and a deque append.
+"""
+
+import time
+from collections import Counter, deque
+from enum import Enum
+from typing import Callable, Dict, List, Optional, Tuple
+
+
+class EventType(Enum):
+    COMBAT_STARTED = "combat_started"
+    DAMAGE_DEALT = "damage_dealt"
+    MONSTER_ACTION = "monster_action"
+    EFFECT_APPLIED = "effect_applied"
+    EFFECT_EXPIRED = "effect_expired"
+    LOOT = "loot"
+    ITEM_SELECTED = "item_selected"
+    ITEM_MOVED = "item_moved"
+    ITEM_SOLD = "item_sold"
+    SKILL_TREE_LOADED = "skill_tree_loaded"
+    SKILL_UNLOCKED = "skill_unlocked"
+    PANEL_TOGGLED = "panel_toggled"
+
+
+_FORMATS: Dict[EventType, str] = {
+    EventType.COMBAT_STARTED: "Combat started: {player} {player_hp}/{player_max_hp} HP vs "
+                              "{enemy} (level {level}) {enemy_hp}/{enemy_max_hp} HP, turn order {turn_order}",
+    EventType.DAMAGE_DEALT: "{attacker} hit {defender} for {damage} damage ({defender_hp} HP left)",
+    EventType.MONSTER_ACTION: "{monster} used {action} ({action_type})",
+    EventType.EFFECT_APPLIED: "{target} is affected by {effect} from {source} for {duration} turns",
+    EventType.EFFECT_EXPIRED: "{effect} wore off {target}",
+    EventType.LOOT: "Loot: {gold} gold, items {items}",
+    EventType.ITEM_SELECTED: "Picked up {item} from {source}",
+    EventType.ITEM_MOVED: "Moved {item} to {target}",
+    EventType.ITEM_SOLD: "Sold {item} for {gold} gold",
+    EventType.SKILL_TREE_LOADED: "Loaded skill trees: {branches}",
+    EventType.SKILL_UNLOCKED: "Unlocked {skill} ({branch})",
+    EventType.PANEL_TOGGLED: "{panel} {state}",
+}
+
+
+class GameEvent:
+    """One published event. Fields are plain values (names, numbers), not live objects."""
+
+    __slots__ = ('type', 'time', 'data')
+
+    def __init__(self, event_type: EventType, data: dict):
+        self.type = event_type
+        self.time = time.perf_counter()
+        self.data = data
+
+    @property
+    def message(self) -> str:
+        return _FORMATS[self.type].format(**self.data)
+
+    def __str__(self) -> str:
+        return self.message
+
+    def __repr__(self) -> str:
+        return f"GameEvent({self.type.name}, {self.data!r})"
+
+
+Subscriber = Callable[[GameEvent], None]
+
+
+class EventBus:
+    """Publishes events to subscribers and keeps the most recent ones."""
+
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+        return cls._instance
+
+    def __init__(self, capacity: int = 512):
+        if not hasattr(self, 'initialized'):
+            self.initialized = True
+            self.history: deque = deque(maxlen=capacity)
+            self.counts: Counter = Counter()  # Events published per type this run
+            # Subscriber tuples are replaced, never mutated, so publishing needs no lock
+            self._subscribers: Dict[Optional[EventType], Tuple[Subscriber, ...]] = {}
+
+    def subscribe(self, callback: Subscriber, *types: EventType) -> Callable[[], None]:
+        """
+        Call callback with every event of the given types (every event if
+        none are given). Returns a function that unsubscribes it again.
+        """
+        keys = types or (None,)
+        for key in keys:
+            self._subscribers[key] = self._subscribers.get(key, ()) + (callback,)
+
+        def unsubscribe():
+            for key in keys:
+                self._subscribers[key] = tuple(
+                    subscriber for subscriber in self._subscribers.get(key, ()) if subscriber is not callback
+                )
+        return unsubscribe
+
+    def listening(self, event_type: EventType) -> bool:
+        return bool(self._subscribers.get(event_type) or self._subscribers.get(None))
+
+    def publish(self, event_type: EventType, **data) -> GameEvent:
+        event = GameEvent(event_type, data)
+        self.history.append(event)
+        self.counts[event_type] += 1
+        for callback in self._subscribers.get(event_type, ()):
+            callback(event)
+        for callback in self._subscribers.get(None, ()):
+            callback(event)
+        return event
+
+    def recent(self, *types: EventType, limit: Optional[int] = None) -> List[GameEvent]:
+        """Buffered events, oldest first, optionally of the given types only."""
+        events = [event for event in self.history if not types or event.type in types]
+        return events[-limit:] if limit else events
@@ -0,0 +1,163 @@
+"""
+Font lookup shared by the display and every UI panel.
+
+Resolving a system font name means scanning the installed fonts (fc-list on
+Linux), so resolved paths and per-file glyph coverage are persisted in
+Adventure/cache/fonts.json and reused across runs. The resolved names are
+dropped when a system font directory changes; coverage is keyed by each
+font file's mtime and size. Font objects are shared by (path, size).
+"""
+
+import os
+import sys
+import json
+import threading
+from typing import Dict, Iterable, Optional, Set, Tuple
+
+import pygame
+
+from .services import ConfigService
+from ..generics import get_data_dir
+
+CACHE_VERSION = 1
+
+
+def _font_dirs() -> Tuple[str, ...]:
+    """Directories whose changes can alter how font names resolve."""
+    home = os.path.expanduser('~')
+    if sys.platform == 'win32':
+        dirs = [os.path.join(os.getenv('WINDIR', 'C:\\Windows'), 'Fonts'),
+                os.path.join(os.getenv('LOCALAPPDATA', ''), 'Microsoft', 'Windows', 'Fonts')]
+    elif sys.platform == 'darwin':
+        dirs = ['/Library/Fonts', '/System/Library/Fonts', os.path.join(home, 'Library', 'Fonts')]
+    else:
+        dirs = ['/usr/share/fonts', '/usr/local/share/fonts',
+                os.path.join(home, '.fonts'), os.path.join(home, '.local', 'share', 'fonts')]
+    return tuple(dirs)
+
+
+class FontService:
+    """Cached font name resolution, shared Font objects and glyph coverage."""
+
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+        return cls._instance
+
+    def __init__(self):
+        if not hasattr(self, 'initialized'):
+            self.initialized = True
+            self.logger = ConfigService().logger
+            self.cache_path = os.path.join(get_data_dir(), 'cache', 'fonts.json')
+            self.resolutions = 0  # Names resolved by scanning system fonts this run
+            self.probes = 0       # Coverage probes (batches of new chars) run this run
+            self._lock = threading.RLock()
+            self._fonts: Dict[Tuple[Optional[str], int], pygame.font.Font] = {}
+            self._paths: Dict[str, Optional[str]] = {}
+            self._coverage: Dict[str, dict] = {}
+            self._dirty = False
+            self._load_cache()
+
+    def _dirs_stamp(self) -> list:
+        stamp = []
+        for directory in _font_dirs():
+            try:
+                stamp.append([directory, os.stat(directory).st_mtime_ns])
+            except OSError:
+                pass
+        return stamp
+
+    @staticmethod
+    def _file_stamp(path: str) -> Optional[list]:
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        return [stat.st_mtime_ns, stat.st_size]
+
+    def _load_cache(self) -> None:
+        try:
+            with open(self.cache_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if data.get('version') != CACHE_VERSION:
+            return
+        if data.get('dirs') == self._dirs_stamp():
+            self._paths = data.get('paths', {})
+        self._coverage = data.get('coverage', {})
+
+    def save(self) -> None:
+        """Persist anything resolved or probed since the last save."""
+        with self._lock:
+            if not self._dirty:
+                return
+            data = {'version': CACHE_VERSION, 'dirs': self._dirs_stamp(),
+                    'paths': self._paths, 'coverage': self._coverage}
+            self._dirty = False
+        try:
+            os.makedirs(os.path.dirname(self.cache_path), exist_ok=True)
+            temp_path = self.cache_path + '.tmp'
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f)
+            os.replace(temp_path, self.cache_path)
+        except OSError as e:
+            self.logger.warning("Could not write font cache: %s", e)
+
+    def resolve(self, name: Optional[str]) -> Optional[str]:
+        """Path of a system font, or None for pygame's default font."""
+        if name is None:
+            return None
+        with self._lock:
+            if name in self._paths:
+                path = self._paths[name]
+                if path is None or os.path.exists(path):
+                    return path
+            path = pygame.font.match_font(name)
+            self._paths[name] = path
+            self.resolutions += 1
+            self._dirty = True
+            return path
+
+    def get(self, name: Optional[str], size: int) -> pygame.font.Font:
+        """Shared Font for a system font name (None for the default font)."""
+        path = self.resolve(name)
+        key = (path, size)
+        font = self._fonts.get(key)
+        if font is None:
+            with self._lock:
+                font = self._fonts.get(key)
+                if font is None:
+                    pygame.font.init()
+                    font = pygame.font.Font(path, size)
+                    self._fonts[key] = font
+        return font
+
+    def coverage(self, name: Optional[str], chars: Iterable[str]) -> Set[str]:
+        """
+        The subset of chars the font has glyphs for. Each font file is probed
+        once per character and the answers are kept in the cache file.
+        """
+        path = self.resolve(name)
+        key = path or '<default>'
+        with self._lock:
+            entry = self._coverage.get(key)
+            stamp = self._file_stamp(path) if path else [pygame.version.ver]
+            if entry is None or entry['stamp'] != stamp:
+                entry = {'stamp': stamp, 'probed': '', 'supported': ''}
+                self._coverage[key] = entry
+
+            wanted = set(chars)
+            missing = wanted.difference(entry['probed'])
+            if missing:
+                font = self.get(name, 20)
+                probe = sorted(missing)
+                found = [char for char, metrics in zip(probe, font.metrics(''.join(probe)))
+                         if metrics is not None]
+                entry['probed'] += ''.join(probe)
+                entry['supported'] += ''.join(found)
+                self.probes += 1
+                self._dirty = True
+            return wanted.intersection(entry['supported'])
@@ -1,6 +1,8 @@
 from typing import Optional
 from ...engine.player import Player
-from ...engine.generics import load_game_data, RandomUtils
+from ...engine.generics import RandomUtils
+from .save_format import restore_player, restore_skill_tree
+from .save_journal import load_save
 
 class GameState:
     def __init__(self, display_manager, ui_manager, systems):
@@ -9,6 +11,7 @@ class GameState:
         self.systems = systems
         self.current_enemy = None
         self.current_state = "menu"
+        self.interpolation = 1.0  # Fraction of a simulation tick elapsed since the last one
         self.ui_manager = ui_manager
         self.player: Optional[Player] = None 
         self.display_manager = display_manager
@@ -17,6 +20,10 @@ class GameState:
     def set_world(self, world):
         self.world = world
 
+    def begin_tick(self):
+        if self.player:
+            self.player.begin_tick()
+
     def transition_to(self, new_state: str):
         self.current_state = new_state
         if new_state == "combat":
@@ -30,16 +37,26 @@ class GameState:
 
     def new_game(self):
         self.player = Player()
+        self.skill_tree.reset()
+        self.world.set_seed(RandomUtils.int(0, 1_000_000))
+        self.world.load_edits({})
+        self.systems.save_system.attach(self)
         self.transition_to("game")
 
     def continue_game(self):
-        save_data = load_game_data()
+        save_data = load_save()
         if save_data:
-            x, y = save_data.get('x', 0), save_data.get('y', 0)
-            self.player = Player(x, y)
+            loot_generator = self.systems.combat_system.combat_manager.loot_generator
+            self.player = restore_player(save_data, loot_generator.templates)
+            restore_skill_tree(save_data, self.skill_tree, self.player)
+            if save_data["world"]["seed"] is not None:
+                self.world.set_seed(save_data["world"]["seed"])
+            self.world.load_edits(save_data["world"]["edits"])
+            self.systems.save_system.attach(self, save_data)
             self.transition_to("game")
 
     def end_combat(self, message: str):
+        self.systems.combat_system.combat_manager.end_combat()
         self.ui_manager.combat_ui.add_to_log(message)
         self.transition_to("game")
 
@@ -58,12 +75,14 @@ class GameState:
             self.handle_enemy_defeat(result)
             return True
         elif self.player.current_hp <= 0:
+            self.systems.combat_system.combat_manager.end_combat()
             self.ui_manager.combat_ui.add_to_log("You were defeated!")
             self.transition_to("menu")
             
         return True
 
     def handle_enemy_defeat(self, combat_result: dict):
+        self.systems.combat_system.combat_manager.end_combat()
         exp_gain = self._calculate_exp_gain()
         self.ui_manager.combat_ui.add_to_log(f"Gained {exp_gain} experience!")
         self.ui_manager.combat_log.add_message(
@@ -79,6 +98,7 @@ class GameState:
             self.ui_manager.combat_log.add_message(f"Level Up! Gained {skill_points_gained} skill points!")
             self.skill_tree.add_skill_points(skill_points_gained)
             self.player.skill_points = 0  # Reset after adding to skill tree
+            self.systems.save_system.mark_significant("level_up")
 
             self.ui_manager.level_up_ui.show(5)
             self.transition_to("level_up")
@@ -94,6 +114,7 @@ class GameState:
     def _handle_loot(self, loot: dict):
         if loot["items"]:
             for item in loot["items"]:
-                self.player.inventory.items.append(item)
+                self.player.inventory.add_item(item)
         self.player.inventory.gold += loot["gold"]
+        self.systems.save_system.mark_significant("loot")
         self.ui_manager.combat_log.add_loot_message(loot["items"], loot["gold"])
\ No newline at end of file
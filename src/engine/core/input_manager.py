@@ -1,6 +1,7 @@
+import random
 import pygame
 from typing import Dict
-from ...engine.generics import save_game_data
+from .profiler import FrameProfiler
 from ...engine.player import Item, ItemType, ItemStats
 
 class InputProcessor:
@@ -17,6 +18,7 @@ class GameInputProcessor(InputProcessor):
             pygame.MOUSEBUTTONDOWN: self._handle_mouse_down,
             pygame.MOUSEBUTTONUP: self._handle_mouse_up,
             pygame.MOUSEMOTION: self._handle_mouse_motion,
+            pygame.MOUSEWHEEL: self._handle_mouse_wheel,
             pygame.KEYDOWN: self._handle_keydown,
             pygame.KEYUP: self._handle_keyup
         }
@@ -32,6 +34,8 @@ class GameInputProcessor(InputProcessor):
 
     def _handle_mouse_down(self, game_state, event) -> bool:
         """Handle mouse button press events"""
+        if event.button > 3:  # Wheel clicks arrive as MOUSEWHEEL too
+            return True
         pos = pygame.mouse.get_pos()
         
         if game_state.ui_manager.inventory_ui.visible:
@@ -46,6 +50,8 @@ class GameInputProcessor(InputProcessor):
 
     def _handle_mouse_up(self, game_state, event) -> bool:
         """Handle mouse button release events"""
+        if event.button > 3:
+            return True
         if game_state.ui_manager.inventory_ui.visible:
             game_state.ui_manager.inventory_ui.handle_click(
                 game_state.player, 
@@ -63,6 +69,14 @@ class GameInputProcessor(InputProcessor):
                 game_state.ui_manager.inventory_ui.handle_hover(game_state.player, pos)
         return True
 
+    def _handle_mouse_wheel(self, game_state, event) -> bool:
+        """Scroll the inventory grid or skill tree"""
+        if game_state.ui_manager.inventory_ui.visible:
+            game_state.ui_manager.inventory_ui.handle_scroll(game_state.player, event.y)
+        elif game_state.ui_manager.skill_tree_ui.visible:
+            game_state.ui_manager.skill_tree_ui.handle_scroll(event, game_state.skill_tree)
+        return True
+
     def _handle_keydown(self, game_state, event: pygame.event.Event) -> bool:
         KEY_MAP = {
             pygame.K_1: ItemType.HELMET,
@@ -87,7 +101,7 @@ class GameInputProcessor(InputProcessor):
                     item_stats = ItemStats(strength=5, defence=5, health=10, speed=5, stamina=10,
                                            magic_power=5, magic_defence=5, wisdom=5, intelligence=5)
                     new_item = Item(f"Debug {KEY_MAP[event.key].name}", KEY_MAP[event.key], 0, item_stats)
-                    game_state.player.inventory.items.append(new_item)
+                    game_state.player.inventory.add_item(new_item)
                     print(f"DEBUG: Spawned {new_item.name}")
                 return True
 
@@ -101,6 +115,20 @@ class GameInputProcessor(InputProcessor):
             pygame.K_F4: GameInputProcessor._handle_cell_borders
         }
 
+        if game_state.ui_manager.skill_tree_ui.visible and event.key in (pygame.K_LEFT, pygame.K_RIGHT):
+            game_state.ui_manager.skill_tree_ui.handle_scroll(event, game_state.skill_tree)
+            return True
+
+        if game_state.ui_manager.inventory_ui.visible:
+            key_handlers.update({
+                pygame.K_PAGEUP: GameInputProcessor._handle_inventory_page_up,
+                pygame.K_PAGEDOWN: GameInputProcessor._handle_inventory_page_down,
+                pygame.K_TAB: GameInputProcessor._handle_inventory_sort,
+                pygame.K_f: GameInputProcessor._handle_inventory_type_filter,
+                pygame.K_q: GameInputProcessor._handle_inventory_quality_filter,
+                pygame.K_g: GameInputProcessor._handle_inventory_stat_filter
+            })
+
         handler = key_handlers.get(event.key)
         if handler:
             handler(game_state)
@@ -119,7 +147,9 @@ class GameInputProcessor(InputProcessor):
         elif game_state.ui_manager.inventory_ui.visible:
             game_state.ui_manager.inventory_ui.hide()
         else:
-            save_game_data({'x': game_state.player.x, 'y': game_state.player.y})
+            save_system = game_state.systems.save_system
+            save_system.save_now(game_state, "menu")
+            save_system.autosave.flush()
             game_state.transition_to("menu")
         return True
 
@@ -134,6 +164,36 @@ class GameInputProcessor(InputProcessor):
             return
         game_state.ui_manager.inventory_ui.toggle()
 
+    @staticmethod
+    def _handle_inventory_page_up(game_state):
+        """Show the previous page of the inventory grid"""
+        game_state.ui_manager.inventory_ui.change_page(game_state.player, -1)
+
+    @staticmethod
+    def _handle_inventory_page_down(game_state):
+        """Show the next page of the inventory grid"""
+        game_state.ui_manager.inventory_ui.change_page(game_state.player, 1)
+
+    @staticmethod
+    def _handle_inventory_sort(game_state):
+        """Cycle the inventory sort order"""
+        game_state.ui_manager.inventory_ui.cycle_sort()
+
+    @staticmethod
+    def _handle_inventory_type_filter(game_state):
+        """Cycle the inventory item type filter"""
+        game_state.ui_manager.inventory_ui.cycle_type_filter()
+
+    @staticmethod
+    def _handle_inventory_quality_filter(game_state):
+        """Cycle the inventory quality filter"""
+        game_state.ui_manager.inventory_ui.cycle_quality_filter()
+
+    @staticmethod
+    def _handle_inventory_stat_filter(game_state):
+        """Cycle the inventory stat filter"""
+        game_state.ui_manager.inventory_ui.cycle_stat_filter()
+
     @staticmethod
     def _handle_skill_tree(game_state):
         """Toggle skill tree visibility"""
@@ -342,21 +402,23 @@ class InputManager:
         """
         # Handle all pending events
         for event in pygame.event.get():
+            if event.type == pygame.KEYDOWN and event.key == pygame.K_F9:
+                FrameProfiler().toggle()
+                continue
             if not self.processors[game_state.current_state].process(game_state, event):
                 return False
 
-        # Handle continuous movement input in game state
+        return True
+
+    def update(self, game_state) -> None:
+        """
+        Apply held-key input for one simulation tick.
+        Runs at the fixed tick rate, so movement speed is independent of FPS.
+        """
         if game_state.current_state == "game":
             if self._handle_movement(game_state):
                 game_state.systems.encounter_system.check_encounters(game_state)
 
-        if game_state.ui_manager.skill_tree_ui.visible:
-            for event in pygame.event.get():
-                if event.type in (pygame.MOUSEWHEEL, pygame.KEYDOWN):
-                    game_state.ui_manager.skill_tree_ui.handle_scroll(event, game_state.skill_tree)
-
-        return True
-
     @staticmethod
     def _handle_movement(game_state) -> bool:
         """
@@ -373,4 +435,55 @@ class InputManager:
         if keys[pygame.K_d]: game_state.player.move(1, 0)
 
         # Return whether position changed
-        return old_x != game_state.player.x or old_y != game_state.player.y
\ No newline at end of file
+        return old_x != game_state.player.x or old_y != game_state.player.y
+
+class ScriptedInput:
+    """
+    Drop-in replacement for InputManager used by headless runs.
+    Replays one (dx, dy) step per simulation tick and plays through
+    combat and level-ups automatically. The run ends when the script does.
+    """
+
+    def __init__(self, moves):
+        self._moves = iter(moves)
+        self.finished = False
+
+    @classmethod
+    def random_walk(cls, ticks: int, seed: int = None, turn_every: int = 20) -> 'ScriptedInput':
+        """Wander in a random direction, picking a new one every few ticks."""
+        rng = random.Random(seed)
+        directions = [(0, -1), (0, 1), (-1, 0), (1, 0)]
+
+        def steps():
+            direction = rng.choice(directions)
+            for tick in range(ticks):
+                if tick % turn_every == 0:
+                    direction = rng.choice(directions)
+                yield direction
+
+        return cls(steps())
+
+    def handle_input(self, game_state) -> bool:
+        # Keep the event queue drained so SDL never stalls
+        if pygame.display.get_init():
+            pygame.event.pump()
+        return not self.finished
+
+    def update(self, game_state) -> None:
+        state = game_state.current_state
+        if state == "menu":
+            game_state.new_game()
+        elif state == "combat":
+            game_state.process_combat_action("attack")
+        elif state == "level_up":
+            game_state.ui_manager.level_up_ui.hide()
+            game_state.transition_to("game")
+        elif state == "game":
+            step = next(self._moves, None)
+            if step is None:
+                self.finished = True
+                return
+            old_x, old_y = game_state.player.x, game_state.player.y
+            game_state.player.move(*step)
+            if (old_x, old_y) != (game_state.player.x, game_state.player.y):
+                game_state.systems.encounter_system.check_encounters(game_state)
@@ -0,0 +1,175 @@
+"""
+Lightweight per-frame profiler.
+Records stage timings into fixed-size ring buffers and costs a single
+attribute check per stage while disabled. StartupProfiler times the
+one-off stages before the first frame.
+"""
+
+import time
+import threading
+from array import array
+from contextlib import contextmanager
+from typing import Callable, Dict, List, Optional
+
+
+class RingBuffer:
+    """Fixed-size buffer of the most recent float samples."""
+
+    def __init__(self, size: int):
+        self.size = size
+        self._data = array('d', bytes(8 * size))
+        self._index = 0
+        self.count = 0
+
+    def append(self, value: float) -> None:
+        self._data[self._index] = value
+        self._index = (self._index + 1) % self.size
+        if self.count < self.size:
+            self.count += 1
+
+    def values(self) -> List[float]:
+        """Samples in chronological order."""
+        if self.count < self.size:
+            return self._data[:self.count].tolist()
+        return (self._data[self._index:] + self._data[:self._index]).tolist()
+
+    def last(self) -> float:
+        return self._data[self._index - 1] if self.count else 0.0
+
+    def percentile(self, pct: float) -> float:
+        if not self.count:
+            return 0.0
+        ordered = sorted(self._data[:self.count])
+        return ordered[min(self.count - 1, int(self.count * pct / 100))]
+
+
+class _NullStage:
+    """Shared no-op context used while profiling is disabled."""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_STAGE = _NullStage()
+
+
+class _StageTimer:
+    __slots__ = ('profiler', 'name', 'start')
+
+    def __init__(self, profiler: 'FrameProfiler', name: str):
+        self.profiler = profiler
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.profiler.record(self.name, (time.perf_counter() - self.start) * 1000)
+        return False
+
+
+class FrameProfiler:
+    """Collects per-stage and whole-frame timings in milliseconds."""
+
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+        return cls._instance
+
+    def __init__(self, history: int = 240):
+        if not hasattr(self, 'initialized'):
+            self.initialized = True
+            self.enabled = False
+            self.history = history
+            self.frames = RingBuffer(history)
+            self.stages: Dict[str, RingBuffer] = {}
+            self._pending: Dict[str, float] = {}
+            self._frame_start: Optional[float] = None
+
+    def toggle(self) -> bool:
+        self.enabled = not self.enabled
+        self._frame_start = None
+        self._pending.clear()
+        return self.enabled
+
+    def stage(self, name: str):
+        """Context manager timing one stage of the current frame."""
+        if not self.enabled:
+            return _NULL_STAGE
+        return _StageTimer(self, name)
+
+    def record(self, name: str, elapsed_ms: float) -> None:
+        # Stages that run several times per frame (e.g. simulation ticks) accumulate
+        self._pending[name] = self._pending.get(name, 0.0) + elapsed_ms
+
+    def begin_frame(self) -> None:
+        if self.enabled:
+            self._frame_start = time.perf_counter()
+
+    def end_frame(self) -> None:
+        if not self.enabled or self._frame_start is None:
+            return
+        self.frames.append((time.perf_counter() - self._frame_start) * 1000)
+        for name, elapsed in self._pending.items():
+            if name not in self.stages:
+                self.stages[name] = RingBuffer(self.history)
+            self.stages[name].append(elapsed)
+        self._pending.clear()
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        """Rolling p50/p99 for the frame and every stage."""
+        rows = {"frame": self.frames}
+        rows.update(self.stages)
+        return {
+            name: {"p50": buffer.percentile(50), "p99": buffer.percentile(99)}
+            for name, buffer in rows.items()
+        }
+
+
+class StartupProfiler:
+    """
+    Wall-clock timings of startup stages, including ones run on worker
+    threads, measured from a common origin (process start when known).
+    """
+
+    def __init__(self, origin: Optional[float] = None):
+        self.origin = origin if origin is not None else time.perf_counter()
+        self.stages: List[tuple] = []  # (name, thread, start_ms, duration_ms)
+        self.marks: Dict[str, float] = {}
+
+    def _now_ms(self) -> float:
+        return (time.perf_counter() - self.origin) * 1000
+
+    def record(self, name: str, start_ms: float, duration_ms: float) -> None:
+        self.stages.append((name, threading.current_thread().name, start_ms, duration_ms))
+
+    @contextmanager
+    def stage(self, name: str):
+        start = self._now_ms()
+        try:
+            yield
+        finally:
+            self.record(name, start, self._now_ms() - start)
+
+    def timed(self, name: str, func: Callable, *args, **kwargs):
+        """Callable for an executor that records func as a stage on whichever thread runs it."""
+        def run():
+            with self.stage(name):
+                return func(*args, **kwargs)
+        return run
+
+    def mark(self, name: str) -> float:
+        """Record a milestone (e.g. the first menu frame) once; returns ms since origin."""
+        return self.marks.setdefault(name, self._now_ms())
+
+    def report(self) -> str:
+        lines = [f"  {name:<16} {start:8.1f} ms +{duration:7.1f} ms  [{thread}]"
+                 for name, thread, start, duration in sorted(self.stages, key=lambda s: s[2])]
+        lines += [f"  {name}: {at:.1f} ms" for name, at in self.marks.items()]
+        return "\n".join(["Startup:"] + lines)
@@ -0,0 +1,503 @@
+"""
+Versioned binary save format.
+
+Layout (little-endian):
+    header   magic b"ADVS", format version (H), payload length (I), CRC32 of payload (I)
+    payload  player summary, string table, stats, item table, backpack, equipment,
+             skill tree, world seed, world tile edits
+
+The fixed-size player summary comes first so menus can read level and position
+from the first few dozen bytes without decoding the rest of the file.
+
+Every string (item name words, skill ids) is interned once in the string table and
+referenced by index. Items carry a stable save id so journal records
+(see save_journal.py) can refer to them across snapshots, and the base name of
+its items.json template so loading shares templates with newly dropped loot.
+Item names are kept as their words (Item.name_parts), so loaded items share
+each word instead of holding their own joined name.
+Item columns and stats are stored as packed arrays, so a
+large backpack costs a handful of array copies rather than one object per field.
+
+Saves are decoded into a plain state dict. Each binary version has its own
+reader in _DECODERS; older states, starting with the legacy position-only JSON
+save (version 0), are upgraded one version at a time through MIGRATIONS.
+"""
+
+import os
+import sys
+import struct
+import zlib
+from array import array
+from itertools import chain
+from typing import Any, Callable, Dict, List, Optional
+
+from ..player import Player, Item, ItemTemplate, ItemType, ItemStats
+from ..generics import get_data_dir, load_game_data
+from ...combat.entity import STAT_NAMES, Stats
+
+MAGIC = b"ADVS"
+FORMAT_VERSION = 1
+SAVE_FILENAME = "save.dat"
+LEGACY_FILENAME = "save.json"  # Version 0: plain JSON with only the position
+
+SUMMARY_FIELDS = ("x", "y", "level", "meta_level", "experience", "next_level_exp",
+                  "skill_points", "points_available", "max_hp", "current_hp")
+RING_SLOTS = 10
+
+_HEADER = struct.Struct("<4sHII")
+_PLAYER = struct.Struct("<iiHHIIHHii")
+_COUNT = struct.Struct("<I")
+_GOLD = struct.Struct("<q")
+_SEED = struct.Struct("<I")
+_STRING_LENGTH = struct.Struct("<H")
+
+_BIG_ENDIAN = sys.byteorder == "big"
+
+
+class SaveFormatError(Exception):
+    """Raised for saves that are truncated, corrupted or from an unknown version."""
+
+
+MIGRATIONS: Dict[int, Callable[[Dict[str, Any]], Dict[str, Any]]] = {}
+
+
+def migration(from_version: int):
+    """Register a function upgrading a decoded state from from_version to from_version + 1."""
+    def decorator(func):
+        MIGRATIONS[from_version] = func
+        return func
+    return decorator
+
+
+def _packed(typecode: str, values) -> bytes:
+    data = array(typecode, values)
+    if _BIG_ENDIAN:
+        data.byteswap()
+    return data.tobytes()
+
+
+class _Writer:
+    def __init__(self):
+        self.parts: List[bytes] = []
+
+    def pack(self, fmt: struct.Struct, *values) -> None:
+        self.parts.append(fmt.pack(*values))
+
+    def array(self, typecode: str, values) -> None:
+        data = _packed(typecode, values)
+        self.parts.append(_COUNT.pack(len(data) // array(typecode).itemsize))
+        self.parts.append(data)
+
+    def getvalue(self) -> bytes:
+        return b"".join(self.parts)
+
+
+class _Reader:
+    def __init__(self, data: bytes):
+        self.data = memoryview(data)
+        self.offset = 0
+
+    def unpack(self, fmt: struct.Struct) -> tuple:
+        if self.offset + fmt.size > len(self.data):
+            raise SaveFormatError("Save file is truncated")
+        values = fmt.unpack_from(self.data, self.offset)
+        self.offset += fmt.size
+        return values
+
+    def array(self, typecode: str) -> array:
+        count, = self.unpack(_COUNT)
+        result = array(typecode)
+        end = self.offset + count * result.itemsize
+        if end > len(self.data):
+            raise SaveFormatError("Save file is truncated")
+        result.frombytes(self.data[self.offset:end])
+        if _BIG_ENDIAN:
+            result.byteswap()
+        self.offset = end
+        return result
+
+    def string(self) -> str:
+        length, = self.unpack(_STRING_LENGTH)
+        end = self.offset + length
+        if end > len(self.data):
+            raise SaveFormatError("Save file is truncated")
+        value = bytes(self.data[self.offset:end]).decode("utf-8")
+        self.offset = end
+        return value
+
+
+class _StringTable:
+    """Interns strings so each distinct name is stored once."""
+
+    def __init__(self):
+        self.index: Dict[str, int] = {}
+        self.strings: List[str] = []
+
+    def ref(self, value: str) -> int:
+        ref = self.index.get(value)
+        if ref is None:
+            ref = self.index[value] = len(self.strings)
+            self.strings.append(value)
+        return ref
+
+
+def _skill_id(branch, node) -> str:
+    return f"{branch.name}/{node.skill.name}"
+
+
+def player_summary_values(player) -> tuple:
+    """SUMMARY_FIELDS of a Player or a state's player dict."""
+    if isinstance(player, dict):
+        return tuple(player.get(name, 0) for name in SUMMARY_FIELDS)
+    return tuple(getattr(player, name, 0) for name in SUMMARY_FIELDS)
+
+
+def unlocked_skill_ids(skill_tree) -> List[str]:
+    return [
+        _skill_id(branch, node)
+        for branch, nodes in skill_tree.branches.items()
+        for node in nodes if node.skill.unlocked
+    ]
+
+
+def capture(player: Player, skill_tree, seed: int, next_item_id: int = 0,
+            overlay=None) -> Dict[str, Any]:
+    """
+    Columnar state of the live game. Items without a save id get one here;
+    the state's next_item_id is where the caller should continue numbering.
+    """
+    inventory = player.inventory
+
+    # Backpack items first, then equipped items and rings that are not in it
+    items = list(inventory.items)
+    seen = set(map(id, items))
+    for item in chain(inventory.equipped.values(), inventory.rings):
+        if item is not None and id(item) not in seen:
+            seen.add(id(item))
+            items.append(item)
+    for item in items:
+        if item.save_id is None:
+            item.save_id = next_item_id
+            next_item_id += 1
+
+    def item_id(item: Optional[Item]) -> int:
+        return -1 if item is None else item.save_id
+
+    name_parts = [item.name_parts for item in items]
+
+    return {
+        "player": dict(
+            zip(SUMMARY_FIELDS, player_summary_values(player)),
+            base_stats=player.base_stats.as_dict(),
+        ),
+        "inventory": {
+            "gold": inventory.gold,
+            "next_item_id": next_item_id,
+            "backpack": [item.save_id for item in inventory.items],
+            "items": {
+                "ids": [item.save_id for item in items],
+                "name_parts": name_parts,
+                "templates": [item.template.base_name for item in items],
+                "types": [item.item_type.value for item in items],
+                "qualities": [item.quality for item in items],
+                "stats": array("i", chain.from_iterable(item.stats.values for item in items)),
+                "stat_names": STAT_NAMES,
+            },
+            "equipped": {slot.value: item_id(item) for slot, item in inventory.equipped.items()},
+            "rings": [item_id(ring) for ring in inventory.rings],
+        },
+        "skills": {"available_points": skill_tree.available_points,
+                   "unlocked": unlocked_skill_ids(skill_tree)},
+        "world": {"seed": seed, "edits": dict(overlay.items()) if overlay is not None else {}},
+    }
+
+
+def encode_state(state: Dict[str, Any]) -> bytes:
+    """Serialize a current-version state dict."""
+    strings = _StringTable()
+    player = state["player"]
+    inventory = state["inventory"]
+    items = inventory["items"]
+    if tuple(items["stat_names"]) != STAT_NAMES:
+        raise SaveFormatError("Item stats must be migrated before encoding")
+
+    body = _Writer()
+    body.array("i", (player["base_stats"][name] for name in STAT_NAMES))
+    body.pack(_GOLD, inventory["gold"])
+    body.pack(_COUNT, inventory["next_item_id"])
+    body.array("I", items["ids"])
+    body.array("B", map(len, items["name_parts"]))
+    body.array("I", map(strings.ref, chain.from_iterable(items["name_parts"])))
+    body.array("I", map(strings.ref, items["templates"]))
+    body.array("B", items["types"])
+    body.array("B", items["qualities"])
+    body.array("i", items["stats"])
+    body.array("I", inventory["backpack"])
+    body.array("i", chain.from_iterable(inventory["equipped"].items()))
+    body.array("i", inventory["rings"])
+    body.pack(_COUNT, state["skills"]["available_points"])
+    body.array("I", map(strings.ref, state["skills"]["unlocked"]))
+    body.pack(_SEED, state["world"]["seed"])
+
+    edits = state["world"]["edits"]
+    body.array("i", (x for x, _ in edits))
+    body.array("i", (y for _, y in edits))
+    body.array("I", (strings.ref(edit[0][0]) for edit in edits.values()))
+    body.array("B", chain.from_iterable(edit[0][1] for edit in edits.values()))
+    body.array("I", (strings.ref(edit[1] or "") for edit in edits.values()))
+    body.array("I", (strings.ref(edit[2] or "") for edit in edits.values()))
+
+    table = _Writer()
+    table.pack(_PLAYER, *player_summary_values(player))
+    table.pack(_COUNT, len(strings.strings))
+    for value in strings.strings:
+        encoded = value.encode("utf-8")
+        table.pack(_STRING_LENGTH, len(encoded))
+        table.parts.append(encoded)
+
+    payload = table.getvalue() + body.getvalue()
+    return _HEADER.pack(MAGIC, FORMAT_VERSION, len(payload), zlib.crc32(payload)) + payload
+
+
+def encode(player: Player, skill_tree, seed: int, overlay=None) -> bytes:
+    """Serialize the player, inventory, skill tree unlocks and world seed."""
+    inventory = player.inventory
+    saved_ids = [item.save_id for item in chain(inventory.items, inventory.equipped.values(), inventory.rings)
+                 if item is not None and item.save_id is not None]
+    return encode_state(capture(player, skill_tree, seed, max(saved_ids, default=-1) + 1, overlay))
+
+
+def snapshot_checksum(data: bytes) -> int:
+    """CRC32 stored in a snapshot header; identifies the snapshot a journal extends."""
+    return _HEADER.unpack_from(data)[3]
+
+
+def _player_summary(values: tuple) -> Dict[str, Any]:
+    return dict(zip(SUMMARY_FIELDS, values))
+
+
+def _read_strings(reader: _Reader) -> List[str]:
+    string_count, = reader.unpack(_COUNT)
+    return [reader.string() for _ in range(string_count)]
+
+
+def _decode_v1(reader: _Reader) -> Dict[str, Any]:
+    player = _player_summary(reader.unpack(_PLAYER))
+    strings = _read_strings(reader)
+    player["base_stats"] = dict(zip(STAT_NAMES, reader.array("i")))
+    gold, = reader.unpack(_GOLD)
+    next_item_id, = reader.unpack(_COUNT)
+    items = {
+        "ids": reader.array("I").tolist(),
+        "name_parts": _read_name_parts(reader, strings),
+        "templates": [strings[ref] for ref in reader.array("I")],
+        "types": reader.array("B").tolist(),
+        "qualities": reader.array("B").tolist(),
+        "stats": reader.array("i"),
+        "stat_names": STAT_NAMES,
+    }
+    backpack = reader.array("I").tolist()
+    equipped_pairs = reader.array("i")
+    rings = reader.array("i")
+    available_points, = reader.unpack(_COUNT)
+    unlocked = [strings[ref] for ref in reader.array("I")]
+    seed, = reader.unpack(_SEED)
+    edits = _read_edits(reader, strings)
+
+    return {
+        "player": player,
+        "inventory": {
+            "gold": gold,
+            "next_item_id": next_item_id,
+            "backpack": backpack,
+            "items": items,
+            "equipped": dict(zip(equipped_pairs[::2], equipped_pairs[1::2])),
+            "rings": rings.tolist(),
+        },
+        "skills": {"available_points": available_points, "unlocked": unlocked},
+        "world": {"seed": seed, "edits": edits},
+    }
+
+
+def _read_name_parts(reader: _Reader, strings: List[str]) -> List[tuple]:
+    lengths = reader.array("B")
+    words = [strings[ref] for ref in reader.array("I")]
+    parts, start = [], 0
+    for length in lengths:
+        parts.append(tuple(words[start:start + length]))
+        start += length
+    return parts
+
+
+def _read_edits(reader: _Reader, strings: List[str]) -> Dict[tuple, tuple]:
+    xs = reader.array("i")
+    ys = reader.array("i")
+    chars = reader.array("I")
+    colors = reader.array("B")
+    fonts = reader.array("I")
+    biomes = reader.array("I")
+    return {
+        (x, y): ((strings[char], tuple(colors[i * 3:i * 3 + 3])), strings[font] or None, strings[biome] or None)
+        for i, (x, y, char, font, biome) in enumerate(zip(xs, ys, chars, fonts, biomes))
+    }
+
+
+_DECODERS: Dict[int, Callable[[_Reader], Dict[str, Any]]] = {
+    1: _decode_v1,
+}
+
+
+@migration(0)
+def _migrate_legacy_json(state: Dict[str, Any]) -> Dict[str, Any]:
+    """Position-only JSON saves: start a fresh character where the old one stood."""
+    fresh = Player(state.get("x", 0), state.get("y", 0))
+    return {
+        "player": {
+            "x": fresh.x, "y": fresh.y, "level": fresh.level, "meta_level": fresh.meta_level,
+            "experience": fresh.experience, "next_level_exp": fresh.next_level_exp,
+            "skill_points": fresh.skill_points, "points_available": 0,
+            "max_hp": fresh.max_hp, "current_hp": fresh.current_hp,
+            "base_stats": fresh.base_stats.as_dict(),
+        },
+        "inventory": {
+            "gold": 0, "next_item_id": 0, "backpack": [],
+            "items": {"ids": [], "name_parts": [], "templates": [], "types": [],
+                      "qualities": [], "stats": array("i"), "stat_names": STAT_NAMES},
+            "equipped": {}, "rings": [-1] * RING_SLOTS,
+        },
+        "skills": {"available_points": 0, "unlocked": []},
+        "world": {"seed": None, "edits": {}},  # Keep whatever world is already generated
+    }
+
+
+def migrate(state: Dict[str, Any], version: int) -> Dict[str, Any]:
+    while version < FORMAT_VERSION:
+        if version not in MIGRATIONS:
+            raise SaveFormatError(f"No migration from save version {version}")
+        state = MIGRATIONS[version](state)
+        version += 1
+    return state
+
+
+def decode(data: bytes) -> Dict[str, Any]:
+    """Validate the header and checksum, decode, and migrate to the current version."""
+    if len(data) < _HEADER.size:
+        raise SaveFormatError("Save file is truncated")
+    magic, version, length, checksum = _HEADER.unpack_from(data)
+    if magic != MAGIC:
+        raise SaveFormatError("Not an Adventure save file")
+    if version not in _DECODERS:
+        raise SaveFormatError(f"Unsupported save version {version}")
+    payload = memoryview(data)[_HEADER.size:_HEADER.size + length]
+    if len(payload) != length or zlib.crc32(payload) != checksum:
+        raise SaveFormatError("Save file checksum mismatch")
+    return migrate(_DECODERS[version](_Reader(payload)), version)
+
+
+def save_path() -> Optional[str]:
+    """Path of the save that load_save would read, if any."""
+    for name in (SAVE_FILENAME, LEGACY_FILENAME):
+        path = os.path.join(get_data_dir(), name)
+        if os.path.exists(path):
+            return path
+    return None
+
+
+def read_summary(path: str) -> Optional[Dict[str, Any]]:
+    """
+    Player summary (level, position...) without decoding the whole save.
+    The checksum is not verified; full loads still go through decode().
+    """
+    if path.endswith(".json"):
+        legacy = load_game_data(LEGACY_FILENAME) or {}
+        return {"x": legacy.get("x", 0), "y": legacy.get("y", 0), "level": 1}
+
+    with open(path, "rb") as f:
+        data = f.read(_HEADER.size + _PLAYER.size)
+    if len(data) < _HEADER.size:
+        return None
+    magic, version, _, _ = _HEADER.unpack_from(data)
+    if magic != MAGIC or version not in _DECODERS or len(data) < _HEADER.size + _PLAYER.size:
+        return None
+    return _player_summary(_PLAYER.unpack_from(data, _HEADER.size))
+
+
+def _build_items(columns: Dict[str, Any],
+                 templates: Optional[Dict[str, List[List[ItemTemplate]]]] = None) -> Dict[int, Item]:
+    """
+    Saved items on their items.json templates, looked up by base name and
+    slot in templates (LootGenerator.templates). Items whose template is
+    unknown, or that never had one, are rebuilt on their type's custom template.
+    """
+    by_key = {
+        (template.base_name, template.item_type): template
+        for groups in (templates or {}).values() for group in groups for template in group
+    }
+    stat_names = columns["stat_names"]
+    width = len(stat_names)
+    stats = columns["stats"]
+    words: Dict[str, str] = {}  # One object per distinct word, wherever it was read from
+    items = {}
+    for i, (save_id, name_parts, base_name, type_value, quality) in enumerate(zip(
+            columns["ids"], columns["name_parts"], columns["templates"], columns["types"], columns["qualities"])):
+        item_stats = ItemStats(**dict(zip(stat_names, stats[i * width:(i + 1) * width])))
+        item_type = ItemType(type_value)
+        template = by_key.get((base_name, item_type)) if base_name else None
+        name_parts = tuple(words.setdefault(word, word) for word in name_parts)
+        item = Item.rolled(template or ItemTemplate.custom(item_type), quality, item_stats, name_parts)
+        item.save_id = save_id
+        items[save_id] = item
+    return items
+
+
+def restore_player(state: Dict[str, Any],
+                   templates: Optional[Dict[str, List[List[ItemTemplate]]]] = None) -> Player:
+    """
+    Rebuild the player and inventory with the saved level, meta level and HP.
+    Pass LootGenerator.templates so restored items share the live templates.
+    """
+    data = state["player"]
+    player = Player(data["x"], data["y"])
+    player.level = data["level"]
+    player.meta_level = data["meta_level"]
+    player.experience = data["experience"]
+    player.next_level_exp = data["next_level_exp"]
+    player.skill_points = data["skill_points"]
+    player.points_available = data["points_available"]
+    player.base_stats = Stats(**data["base_stats"])
+    player.stat_pipeline.invalidate()
+    player.max_hp = data["max_hp"]
+    player.current_hp = data["current_hp"]
+
+    saved = state["inventory"]
+    inventory = player.inventory
+    inventory.gold = saved["gold"]
+    items = _build_items(saved["items"], templates)
+    for save_id in saved["backpack"]:
+        inventory.add_item(items[save_id])
+    for type_value, save_id in saved["equipped"].items():
+        if save_id in items:
+            inventory.equip(items[save_id])
+    for slot, save_id in enumerate(saved["rings"][:RING_SLOTS]):
+        if save_id in items:
+            inventory.equip(items[save_id], slot)
+    return player
+
+
+def restore_skill_tree(state: Dict[str, Any], skill_tree, player: Optional[Player] = None) -> None:
+    """
+    Apply saved unlocks. Given the player, its skill layer is rebuilt from
+    the unlocked skills' current buffs; saved base stats never include them.
+    """
+    unlocked = set(state["skills"]["unlocked"])
+    skill_tree.exclusive_groups.clear()
+    for branch, nodes in skill_tree.branches.items():
+        for node in nodes:
+            node.skill.unlocked = _skill_id(branch, node) in unlocked
+            if node.skill.unlocked and node.exclusive_group:
+                skill_tree.exclusive_groups[node.exclusive_group] = node
+    skill_tree.available_points = state["skills"]["available_points"]
+    skill_tree.version += 1
+
+    if player is not None:
+        player.stat_pipeline.set_skill_bonus(skill_tree.unlocked_bonus())
@@ -0,0 +1,380 @@
+"""
+Append-only save journal.
+
+Between full snapshots, autosaves append small delta records (moved, item
+added, item equipped, skill unlocked, gold changed...) to save.journal instead
+of rewriting save.dat. Loading replays the journal on top of the snapshot, and
+compaction folds it back into a fresh snapshot on the autosave thread.
+
+Layout (little-endian):
+    header   magic b"ADVJ", journal version (H), CRC32 of the base snapshot (I)
+    batches  length (I), CRC32 (I), records
+
+A batch is one autosave's worth of records. A torn or corrupt batch ends the
+replay, so a crash loses at most the last unflushed batch.
+"""
+
+import os
+import struct
+import zlib
+from array import array
+from typing import Any, Dict, List, Optional, Tuple
+
+from .save_format import (
+    SAVE_FILENAME, LEGACY_FILENAME, STAT_NAMES, SUMMARY_FIELDS, SaveFormatError,
+    decode, encode_state, migrate, player_summary_values, snapshot_checksum,
+    unlocked_skill_ids,
+)
+from ..generics import get_data_dir, load_game_data, read_save_file, write_save_file
+
+JOURNAL_MAGIC = b"ADVJ"
+JOURNAL_VERSION = 1
+JOURNAL_FILENAME = "save.journal"
+
+OP_MOVE = 1
+OP_PLAYER = 2
+OP_GOLD = 3
+OP_ITEM_DEFINE = 4
+OP_BACKPACK_ADD = 5
+OP_BACKPACK_REMOVE = 6
+OP_EQUIP = 7
+OP_SKILL_UNLOCK = 8
+OP_SKILL_POINTS = 9
+OP_TILE_SET = 10
+OP_TILE_CLEAR = 11
+
+_HEADER = struct.Struct("<4sHI")
+_BATCH = struct.Struct("<II")
+_OP = struct.Struct("<B")
+_MOVE = struct.Struct("<ii")
+_PLAYER = struct.Struct("<iiHHIIHHii" + "i" * len(STAT_NAMES))
+_GOLD = struct.Struct("<q")
+_ITEM = struct.Struct("<IBB" + "i" * len(STAT_NAMES))
+_ID = struct.Struct("<I")
+_NAME_LENGTH = struct.Struct("<B")
+_EQUIP = struct.Struct("<Bbi")
+_POINTS = struct.Struct("<I")
+_TILE = struct.Struct("<iiBBB")
+_TILE_CLEAR = struct.Struct("<ii")
+_STRING_LENGTH = struct.Struct("<H")
+
+
+def _string(value: str) -> bytes:
+    encoded = value.encode("utf-8")
+    return _STRING_LENGTH.pack(len(encoded)) + encoded
+
+
+class JournalRecorder:
+    """
+    Turns changes to the live game into journal records.
+
+    Backpack adds/removes and world tile edits come from change logs on the
+    inventory and world overlay; everything else is small enough to diff
+    against the last recorded values.
+    """
+
+    def __init__(self, player, skill_tree, next_item_id: int = 0, overlay=None):
+        self.player = player
+        self.skill_tree = skill_tree
+        self.overlay = overlay
+        self.next_item_id = next_item_id
+        self.bytes_since_snapshot = 0
+        player.inventory.change_log = []
+        if overlay is not None:
+            overlay.change_log = []
+        self.mark_recorded()
+
+    def mark_recorded(self) -> None:
+        """Treat the current live state as already saved (after a full snapshot or load)."""
+        inventory = self.player.inventory
+        inventory.change_log.clear()
+        if self.overlay is not None:
+            self.overlay.change_log.clear()
+        self._player = self._player_values()
+        self._gold = inventory.gold
+        self._equipped = {slot: self._peek_id(item) for slot, item in inventory.equipped.items()}
+        self._rings = [self._peek_id(ring) for ring in inventory.rings]
+        self._skill_version = self.skill_tree.version
+        self._unlocked = set(unlocked_skill_ids(self.skill_tree))
+        self._skill_points = self.skill_tree.available_points
+
+    def _player_values(self) -> tuple:
+        return player_summary_values(self.player) + tuple(self.player.base_stats.values)
+
+    @staticmethod
+    def _peek_id(item) -> int:
+        return -1 if item is None or item.save_id is None else item.save_id
+
+    def _item_id(self, item, out: bytearray) -> int:
+        """Save id of item, defining it in the journal the first time it is seen."""
+        if item is None:
+            return -1
+        if item.save_id is None:
+            item.save_id = self.next_item_id
+            self.next_item_id += 1
+            out += _OP.pack(OP_ITEM_DEFINE)
+            out += _ITEM.pack(item.save_id, item.item_type.value, item.quality, *item.stats.values)
+            out += _string(item.template.base_name) + _NAME_LENGTH.pack(len(item.name_parts))
+            for word in item.name_parts:
+                out += _string(word)
+        return item.save_id
+
+    def collect(self) -> bytes:
+        """Records for everything that changed since the last call."""
+        out = bytearray()
+        player = self.player
+        inventory = player.inventory
+
+        for added, item in inventory.change_log:
+            item_id = self._item_id(item, out)
+            out += _OP.pack(OP_BACKPACK_ADD if added else OP_BACKPACK_REMOVE) + _ID.pack(item_id)
+        inventory.change_log.clear()
+
+        for slot, item in inventory.equipped.items():
+            item_id = self._item_id(item, out)
+            if self._equipped.get(slot) != item_id:
+                out += _OP.pack(OP_EQUIP) + _EQUIP.pack(slot.value, -1, item_id)
+                self._equipped[slot] = item_id
+        for ring_slot, ring in enumerate(inventory.rings):
+            item_id = self._item_id(ring, out)
+            if self._rings[ring_slot] != item_id:
+                out += _OP.pack(OP_EQUIP) + _EQUIP.pack(0, ring_slot, item_id)
+                self._rings[ring_slot] = item_id
+
+        if inventory.gold != self._gold:
+            out += _OP.pack(OP_GOLD) + _GOLD.pack(inventory.gold)
+            self._gold = inventory.gold
+
+        values = self._player_values()
+        if values != self._player:
+            if values[2:] == self._player[2:]:
+                out += _OP.pack(OP_MOVE) + _MOVE.pack(player.x, player.y)
+            else:
+                out += _OP.pack(OP_PLAYER) + _PLAYER.pack(*values)
+            self._player = values
+
+        if self.skill_tree.version != self._skill_version:
+            self._skill_version = self.skill_tree.version
+            for skill_id in unlocked_skill_ids(self.skill_tree):
+                if skill_id not in self._unlocked:
+                    out += _OP.pack(OP_SKILL_UNLOCK) + _string(skill_id)
+                    self._unlocked.add(skill_id)
+            if self.skill_tree.available_points != self._skill_points:
+                out += _OP.pack(OP_SKILL_POINTS) + _POINTS.pack(self.skill_tree.available_points)
+                self._skill_points = self.skill_tree.available_points
+
+        if self.overlay is not None and self.overlay.change_log:
+            for world_x, world_y in dict.fromkeys(self.overlay.change_log):
+                edit = self.overlay.get(world_x, world_y)
+                if edit is None:
+                    out += _OP.pack(OP_TILE_CLEAR) + _TILE_CLEAR.pack(world_x, world_y)
+                else:
+                    (char, color), font_name, biome = edit
+                    out += _OP.pack(OP_TILE_SET) + _TILE.pack(world_x, world_y, *color)
+                    out += _string(char) + _string(font_name or "") + _string(biome or "")
+            self.overlay.change_log.clear()
+
+        self.bytes_since_snapshot += len(out)
+        return bytes(out)
+
+
+def _read_string(data: memoryview, offset: int) -> Tuple[str, int]:
+    length, = _STRING_LENGTH.unpack_from(data, offset)
+    offset += _STRING_LENGTH.size
+    return bytes(data[offset:offset + length]).decode("utf-8"), offset + length
+
+
+def apply_records(state: Dict[str, Any], records: bytes) -> None:
+    """Replay one batch of records onto a decoded snapshot state."""
+    data = memoryview(records)
+    player = state["player"]
+    inventory = state["inventory"]
+    items = inventory["items"]
+    offset = 0
+    while offset < len(data):
+        op, = _OP.unpack_from(data, offset)
+        offset += _OP.size
+        if op == OP_MOVE:
+            player["x"], player["y"] = _MOVE.unpack_from(data, offset)
+            offset += _MOVE.size
+        elif op == OP_PLAYER:
+            values = _PLAYER.unpack_from(data, offset)
+            offset += _PLAYER.size
+            player.update(zip(SUMMARY_FIELDS, values))
+            player["base_stats"] = dict(zip(STAT_NAMES, values[len(SUMMARY_FIELDS):]))
+        elif op == OP_GOLD:
+            inventory["gold"], = _GOLD.unpack_from(data, offset)
+            offset += _GOLD.size
+        elif op == OP_ITEM_DEFINE:
+            save_id, type_value, quality, *stats = _ITEM.unpack_from(data, offset)
+            offset += _ITEM.size
+            base_name, offset = _read_string(data, offset)
+            length, = _NAME_LENGTH.unpack_from(data, offset)
+            offset += _NAME_LENGTH.size
+            name_parts = []
+            for _ in range(length):
+                word, offset = _read_string(data, offset)
+                name_parts.append(word)
+            items["ids"].append(save_id)
+            items["name_parts"].append(tuple(name_parts))
+            items["templates"].append(base_name)
+            items["types"].append(type_value)
+            items["qualities"].append(quality)
+            items["stats"].extend(stats)
+            inventory["next_item_id"] = max(inventory["next_item_id"], save_id + 1)
+        elif op in (OP_BACKPACK_ADD, OP_BACKPACK_REMOVE):
+            save_id, = _ID.unpack_from(data, offset)
+            offset += _ID.size
+            if op == OP_BACKPACK_ADD:
+                inventory["backpack"].append(save_id)
+            else:
+                inventory["backpack"].remove(save_id)
+        elif op == OP_EQUIP:
+            slot, ring_slot, save_id = _EQUIP.unpack_from(data, offset)
+            offset += _EQUIP.size
+            if ring_slot >= 0:
+                inventory["rings"][ring_slot] = save_id
+            else:
+                inventory["equipped"][slot] = save_id
+        elif op == OP_SKILL_UNLOCK:
+            skill_id, offset = _read_string(data, offset)
+            if skill_id not in state["skills"]["unlocked"]:
+                state["skills"]["unlocked"].append(skill_id)
+        elif op == OP_SKILL_POINTS:
+            state["skills"]["available_points"], = _POINTS.unpack_from(data, offset)
+            offset += _POINTS.size
+        elif op == OP_TILE_SET:
+            world_x, world_y, *color = _TILE.unpack_from(data, offset)
+            offset += _TILE.size
+            char, offset = _read_string(data, offset)
+            font_name, offset = _read_string(data, offset)
+            biome, offset = _read_string(data, offset)
+            state["world"]["edits"][(world_x, world_y)] = ((char, tuple(color)), font_name or None, biome or None)
+        elif op == OP_TILE_CLEAR:
+            world_x, world_y = _TILE_CLEAR.unpack_from(data, offset)
+            offset += _TILE_CLEAR.size
+            state["world"]["edits"].pop((world_x, world_y), None)
+        else:
+            raise SaveFormatError(f"Unknown journal record {op}")
+
+
+def read_journal(data: bytes) -> Tuple[Optional[int], List[bytes], bool]:
+    """(base snapshot checksum, intact batches, whether the tail was torn)."""
+    if len(data) < _HEADER.size:
+        return None, [], True
+    magic, version, base = _HEADER.unpack_from(data)
+    if magic != JOURNAL_MAGIC or version != JOURNAL_VERSION:
+        return None, [], True
+
+    batches = []
+    offset = _HEADER.size
+    view = memoryview(data)
+    while offset < len(data):
+        if offset + _BATCH.size > len(data):
+            return base, batches, True
+        length, checksum = _BATCH.unpack_from(data, offset)
+        start = offset + _BATCH.size
+        batch = view[start:start + length]
+        if len(batch) != length or zlib.crc32(batch) != checksum:
+            return base, batches, True
+        batches.append(bytes(batch))
+        offset = start + length
+    return base, batches, False
+
+
+def replay(state: Dict[str, Any], snapshot: bytes, journal: Optional[bytes]) -> bool:
+    """
+    Apply the journal if it extends this snapshot.
+    Returns True if the journal can keep being appended to.
+    """
+    if journal is None:
+        return False
+    base, batches, torn = read_journal(journal)
+    if base != snapshot_checksum(snapshot):
+        return False
+    for batch in batches:
+        apply_records(state, batch)
+    return not torn
+
+
+def prune(state: Dict[str, Any]) -> None:
+    """Drop item definitions nothing refers to any more (sold or discarded items)."""
+    inventory = state["inventory"]
+    items = inventory["items"]
+    live = set(inventory["backpack"])
+    live.update(inventory["equipped"].values())
+    live.update(inventory["rings"])
+    keep = [i for i, save_id in enumerate(items["ids"]) if save_id in live]
+    if len(keep) == len(items["ids"]):
+        return
+
+    width = len(items["stat_names"])
+    stats = items["stats"]
+    for column in ("ids", "name_parts", "templates", "types", "qualities"):
+        values = items[column]
+        items[column] = [values[i] for i in keep]
+    items["stats"] = array("i", [value for i in keep for value in stats[i * width:(i + 1) * width]])
+
+
+def load_save() -> Optional[Dict[str, Any]]:
+    """
+    Snapshot plus journal, a migrated legacy JSON save, or None.
+    state["journal_base"] is the snapshot checksum when new records may be
+    appended to the existing journal, otherwise None.
+    """
+    data = read_save_file(SAVE_FILENAME)
+    if data is not None:
+        state = decode(data)
+        appendable = replay(state, data, read_save_file(JOURNAL_FILENAME))
+        state["journal_base"] = snapshot_checksum(data) if appendable else None
+        return state
+    legacy = load_game_data(LEGACY_FILENAME)
+    if legacy is not None:
+        state = migrate(legacy, 0)
+        state["journal_base"] = None
+        return state
+    return None
+
+
+class JournalFile:
+    """Writer-thread side: appends batches and rebases the journal onto new snapshots."""
+
+    def __init__(self, filename: str = JOURNAL_FILENAME):
+        self.filename = filename
+        self.bytes_written = 0
+
+    @property
+    def path(self) -> str:
+        return os.path.join(get_data_dir(), self.filename)
+
+    def reset(self, snapshot: bytes) -> None:
+        """Start an empty journal on top of a snapshot that was just written."""
+        write_save_file(_HEADER.pack(JOURNAL_MAGIC, JOURNAL_VERSION, snapshot_checksum(snapshot)),
+                        self.filename)
+
+    def append(self, records: bytes) -> None:
+        batch = _BATCH.pack(len(records), zlib.crc32(records)) + records
+        with open(self.path, "ab") as f:
+            f.write(batch)
+            f.flush()
+            os.fsync(f.fileno())
+        self.bytes_written += len(batch)
+
+    def compact(self, snapshot_filename: str = SAVE_FILENAME) -> bool:
+        """Fold the journal into a new snapshot. Returns True if anything was folded."""
+        snapshot = read_save_file(snapshot_filename)
+        journal = read_save_file(self.filename)
+        if snapshot is None or journal is None:
+            return False
+        base, batches, _ = read_journal(journal)
+        if base != snapshot_checksum(snapshot) or not batches:
+            return False
+
+        state = decode(snapshot)
+        for batch in batches:
+            apply_records(state, batch)
+        prune(state)
+        compacted = encode_state(state)
+        write_save_file(compacted, snapshot_filename)
+        self.reset(compacted)
+        return True
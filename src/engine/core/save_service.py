@@ -0,0 +1,206 @@
+"""
+Save file services.
+
+AutosaveService: snapshots and journal records are produced on the game thread
+and handed to a writer thread. Only the latest snapshot is ever written, journal
+records queued in the meantime are written as one batch, and compaction runs
+there too, so the game thread never waits on the disk.
+
+SaveMetadataService: in-memory view of whether a save exists and what is in
+it, so menus never touch the disk while nothing has changed.
+"""
+
+import os
+import time
+import threading
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+
+from .services import ConfigService
+from .save_format import save_path, read_summary
+from .save_journal import JournalFile
+from ..generics import write_save_file
+
+
+@dataclass(frozen=True)
+class SaveInfo:
+    path: str
+    mtime: float
+    summary: Optional[Dict[str, Any]]  # None if the header could not be read
+
+
+class SaveMetadataService:
+    """
+    Cached save existence, mtime and player summary.
+
+    The cache is refreshed when a save completes (invalidate) or when a
+    throttled stat shows the file changed underneath us.
+    """
+
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+        return cls._instance
+
+    def __init__(self, poll_interval: float = 1.0):
+        if not hasattr(self, 'initialized'):
+            self.initialized = True
+            self.poll_interval = poll_interval
+            self.logger = ConfigService().logger
+            self.refreshes = 0
+            self._info: Optional[SaveInfo] = None
+            self._stamp = None
+            self._stale = True
+            self._next_poll = 0.0
+
+    def invalidate(self) -> None:
+        """Called once a save has been written; safe from any thread."""
+        self._stale = True
+
+    def get(self) -> Optional[SaveInfo]:
+        now = time.monotonic()
+        if not self._stale and now >= self._next_poll:
+            self._next_poll = now + self.poll_interval
+            self._stale = self._file_stamp(save_path()) != self._stamp
+        if self._stale:
+            self._refresh()
+        return self._info
+
+    def has_save(self) -> bool:
+        return self.get() is not None
+
+    @staticmethod
+    def _file_stamp(path: Optional[str]):
+        if path is None:
+            return None
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        return (path, stat.st_mtime_ns, stat.st_size)
+
+    def _refresh(self) -> None:
+        self._stale = False
+        self._next_poll = time.monotonic() + self.poll_interval
+        self.refreshes += 1
+
+        path = save_path()
+        self._stamp = self._file_stamp(path)
+        if self._stamp is None:
+            self._info = None
+            return
+        try:
+            summary = read_summary(path)
+        except Exception as e:
+            self.logger.error("Could not read save summary: %s", e)
+            summary = None
+        self._info = SaveInfo(path, self._stamp[1] / 1e9, summary)
+
+
+class AutosaveService:
+    """Coalescing, atomic, off-thread save writer."""
+
+    def __init__(self, filename: str):
+        self.filename = filename
+        self.logger = ConfigService().logger
+        self.journal = JournalFile()
+
+        self.saves_requested = 0  # Every change or event that wanted a save
+        self.saves_queued = 0     # Snapshots and journal batches handed to the writer
+        self.saves_written = 0    # Full snapshots that actually reached disk
+        self.journal_batches = 0  # Journal batches appended
+        self.compactions = 0      # Journals folded into a new snapshot
+
+        self._cond = threading.Condition()
+        self._pending: Optional[bytes] = None
+        self._pending_records = bytearray()
+        self._compact = False
+        self._writing = False
+        self._closing = False
+        self._thread = threading.Thread(target=self._run, name="autosave", daemon=True)
+        self._thread.start()
+
+    def note_request(self) -> None:
+        """Count a change that the old save-every-frame path would have written."""
+        self.saves_requested += 1
+
+    def submit(self, data: bytes) -> None:
+        """
+        Queue a full snapshot. It supersedes any snapshot or journal records
+        the writer has not picked up yet, and starts a fresh journal.
+        """
+        with self._cond:
+            self._pending = data
+            self._pending_records.clear()
+            self.saves_queued += 1
+            self._cond.notify_all()
+
+    def append(self, records: bytes) -> None:
+        """Queue journal records; everything queued before the next write goes in one batch."""
+        with self._cond:
+            self._pending_records += records
+            self.saves_queued += 1
+            self._cond.notify_all()
+
+    def compact(self) -> None:
+        """Fold the journal into the snapshot once queued writes are done."""
+        with self._cond:
+            self._compact = True
+            self._cond.notify_all()
+
+    def _idle(self) -> bool:
+        return self._pending is None and not self._pending_records and not self._compact
+
+    def flush(self, timeout: float = 5.0) -> bool:
+        """Block until everything queued is on disk."""
+        with self._cond:
+            return self._cond.wait_for(lambda: self._idle() and not self._writing, timeout)
+
+    def close(self, timeout: float = 5.0) -> None:
+        with self._cond:
+            self._closing = True
+            self._cond.notify_all()
+        self._thread.join(timeout)
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "requested": self.saves_requested,
+            "queued": self.saves_queued,
+            "written": self.saves_written,
+            "journal_batches": self.journal_batches,
+            "journal_bytes": self.journal.bytes_written,
+            "compactions": self.compactions,
+        }
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while self._idle() and not self._closing:
+                    self._cond.wait()
+                if self._idle():
+                    return
+                data, self._pending = self._pending, None
+                records, self._pending_records = bytes(self._pending_records), bytearray()
+                compact, self._compact = self._compact, False
+                self._writing = True
+
+            try:
+                if data is not None:
+                    write_save_file(data, self.filename)
+                    self.journal.reset(data)
+                    self.saves_written += 1
+                    SaveMetadataService().invalidate()
+                if records:
+                    self.journal.append(records)
+                    self.journal_batches += 1
+                if compact and self.journal.compact(self.filename):
+                    self.compactions += 1
+                    SaveMetadataService().invalidate()
+            except Exception as e:
+                self.logger.error("Autosave failed: %s", e)
+            finally:
+                with self._cond:
+                    self._writing = False
+                    self._cond.notify_all()
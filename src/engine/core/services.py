@@ -4,54 +4,119 @@ Provides error handling, logging, configuration management, and common services.
 """
 
 import os
+import queue
+import atexit
 import logging
 import functools
+from logging.handlers import QueueHandler, QueueListener
 from typing import Any, Callable, Dict, Optional, TypeVar
 
 from src.combat.entity import Entity
 from src.combat.skills import Skill
 from src.engine.player import ItemType, Item, Player
+from src.config.game_config import GameConfig
 
 # Type variables for generic function decorators
 T = TypeVar('T')
 F = TypeVar('F', bound=Callable[..., Any])
 
+class _DroppingQueueHandler(QueueHandler):
+    """
+    Hands records to the listener thread without formatting them and
+    without ever blocking: when the queue is full the record is dropped
+    and counted.
+    """
+
+    def __init__(self, maxsize: int):
+        # SimpleQueue puts are much cheaper than Queue's; the bound is checked here
+        super().__init__(queue.SimpleQueue())
+        self.maxsize = maxsize
+        self.dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # The listener's handlers format the record (msg % args) when they emit it
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        if self.queue.qsize() >= self.maxsize:
+            self.dropped += 1
+        else:
+            self.queue.put_nowait(record)
+
+
 class GameLogger:
-    """Centralized logging system for the game."""
+    """
+    Centralized logging system for the game.
 
-    def __init__(self, debug_mode: bool = False):
-        self.logger = logging.getLogger('adventure')
+    Log calls only put the record on a bounded queue; a background listener
+    formats it and writes the console and file output. Pass arguments
+    separately (logger.info("Loaded %s", name)) so the text is only built
+    on the listener thread, and only for levels that are enabled.
+    """
+
+    def __init__(self, debug_mode: bool = False, name: str = 'adventure', log_path: Optional[str] = None):
+        self.logger = logging.getLogger(name)
         self.logger.setLevel(logging.DEBUG if debug_mode else logging.INFO)
+        formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 
         # Console handler
         console = logging.StreamHandler()
-        console.setFormatter(logging.Formatter(
-            '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-        ))
-        self.logger.addHandler(console)
+        console.setFormatter(formatter)
 
         # File handler
-        log_dir = os.path.join(os.getenv('APPDATA'), 'Adventure', 'logs')
-        os.makedirs(log_dir, exist_ok=True)
-        file_handler = logging.FileHandler(
-            os.path.join(log_dir, 'game.log')
-        )
-        file_handler.setFormatter(logging.Formatter(
-            '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-        ))
-        self.logger.addHandler(file_handler)
-
-    def debug(self, msg: str):
-        self.logger.debug(msg)
-
-    def info(self, msg: str):
-        self.logger.info(msg)
-
-    def warning(self, msg: str):
-        self.logger.warning(msg)
-
-    def error(self, msg: str):
-        self.logger.error(msg)
+        if log_path is None:
+            from ..generics import get_data_dir
+            log_dir = os.path.join(get_data_dir(), 'logs')
+            os.makedirs(log_dir, exist_ok=True)
+            log_path = os.path.join(log_dir, 'game.log')
+        file_handler = logging.FileHandler(log_path)
+        file_handler.setFormatter(formatter)
+
+        self.handlers = (console, file_handler)
+        self.queue_handler = _DroppingQueueHandler(GameConfig.LOG_QUEUE_SIZE)
+        self.listener = QueueListener(self.queue_handler.queue, *self.handlers, respect_handler_level=True)
+        self.logger.addHandler(self.queue_handler)
+        self.listener.start()
+        self._closed = False
+        atexit.register(self.close)
+
+    @property
+    def dropped(self) -> int:
+        """Records dropped because the queue was full"""
+        return self.queue_handler.dropped
+
+    def is_enabled(self, level: int) -> bool:
+        """Whether a message at level would be logged, to skip building costly reports."""
+        return self.logger.isEnabledFor(level)
+
+    def debug(self, msg: str, *args):
+        self.logger.debug(msg, *args)
+
+    def info(self, msg: str, *args):
+        self.logger.info(msg, *args)
+
+    def warning(self, msg: str, *args):
+        self.logger.warning(msg, *args)
+
+    def error(self, msg: str, *args):
+        self.logger.error(msg, *args)
+
+    def close(self):
+        """Write out every queued record and stop the listener thread."""
+        if self._closed:
+            return
+        self._closed = True
+        self.listener.stop()
+        self.logger.removeHandler(self.queue_handler)
+        if self.dropped:
+            record = self.logger.makeRecord(
+                self.logger.name, logging.WARNING, __file__, 0,
+                "Log queue was full; %d records dropped", (self.dropped,), None
+            )
+            for handler in self.handlers:
+                handler.handle(record)
+        for handler in self.handlers:
+            handler.close()
 
 
 class ConfigService:
@@ -68,21 +133,16 @@ class ConfigService:
         if not hasattr(self, 'initialized'):
             self.initialized = True
             self.debug_mode = bool(os.getenv('ADVENTURE_DEBUG', False))
+            self.hot_reload = bool(os.getenv('ADVENTURE_HOT_RELOAD', False))
             self.logger = GameLogger(self.debug_mode)
-            self._cache: Dict[str, Any] = {}
 
     def get_config(self, name: str) -> Optional[Dict]:
-        """Get configuration data, using cache if available."""
-        if name in self._cache:
-            return self._cache[name]
-
+        """Get shared, read-only configuration data from the config registry."""
         try:
             from ..generics import load_json_config
-            config = load_json_config(f"{name}.json")
-            self._cache[name] = config
-            return config
+            return load_json_config(f"{name}.json")
         except Exception as e:
-            self.logger.error(f"Error loading config {name}: {str(e)}")
+            self.logger.error("Error loading config %s: %s", name, e)
             return None
 
 
@@ -91,13 +151,12 @@ def with_error_handling(func: F) -> F:
 
     @functools.wraps(func)
     def wrapper(*args, **kwargs):
-        config = ConfigService()
         try:
             return func(*args, **kwargs)
         except Exception as e:
-            config.logger.error(
-                f"Error in {func.__name__}: {str(e)}"
-            )
+            # Only look up the logger on failure so the happy path stays a bare call
+            config = ConfigService()
+            config.logger.error("Error in %s: %s", func.__name__, e)
             raise
 
     return wrapper
@@ -188,7 +247,7 @@ class InventoryService:
         changes = {}
         multiplier = -1 if unequip else 1
 
-        for stat_name, value in item.stats.__dict__.items():
+        for stat_name, value in item.stats.items():
             if value != 0:
                 changes[stat_name] = value * multiplier
 
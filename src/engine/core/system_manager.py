@@ -3,10 +3,17 @@ Core game systems management module.
 Handles initialization and coordination of game subsystems.
 """
 
-from typing import Dict, Type
+import time
+from typing import Dict, Optional, Type
 from ...combat.skill_tree import SkillTree
 from ...combat.combat_manager import CombatManager
 from ...combat.encounter_manager import EncounterManager
+from .profiler import FrameProfiler
+from .save_service import AutosaveService
+from .save_format import SAVE_FILENAME, capture, encode_state
+from .save_journal import JournalRecorder
+from ..config_registry import ConfigRegistry
+from ...config.game_config import GameConfig
 from .services import ConfigService, with_error_handling
 
 class GameSystem:
@@ -21,7 +28,7 @@ class GameSystem:
         """Update system state. Override in subclasses."""
         pass
 
-    def cleanup(self) -> None:
+    def cleanup(self, game_state=None) -> None:
         """Clean up system resources. Override if needed."""
         pass
 
@@ -53,20 +60,13 @@ class EncounterSystem(GameSystem):
             return
 
         coords = (game_state.player.x, game_state.player.y)
-        chunk = game_state.world.get_chunk(
-            coords[0] // game_state.world.chunk_size,
-            coords[1] // game_state.world.chunk_size
-        )
-
-        local_x = coords[0] % game_state.world.chunk_size
-        local_y = coords[1] % game_state.world.chunk_size
-        biome = chunk.get_biome(local_x, local_y)
+        biome = game_state.world.get_biome(*coords)
 
         should_encounter, monster_name = self.encounter_manager.should_encounter(coords, biome)
 
         if should_encounter and monster_name:
-            self.logger.info(f"Triggering encounter with {monster_name} in {biome}")
-            game_state.current_enemy = self.encounter_manager.generate_encounter(coords, biome)
+            self.logger.info("Triggering encounter with %s in %s", monster_name, biome)
+            game_state.current_enemy = self.encounter_manager.generate_encounter(coords, biome, monster_name)
             game_state.systems.combat_system.combat_manager.start_combat(
                 game_state.player,
                 game_state.current_enemy
@@ -75,17 +75,128 @@ class EncounterSystem(GameSystem):
 
 
 class SaveSystem(GameSystem):
-    """Handles game save/load operations."""
+    """
+    Handles game save/load operations.
+    Changes only mark the game dirty; a save is written in the background
+    once the autosave interval has passed or a significant event happens.
+
+    The first save of a session is a full snapshot. After that only journal
+    records for what changed are written, and the journal is compacted into
+    a new snapshot once it grows past JOURNAL_COMPACT_BYTES.
+    """
+
+    def __init__(self, interval: float = GameConfig.AUTOSAVE_INTERVAL,
+                 compact_bytes: int = GameConfig.JOURNAL_COMPACT_BYTES):
+        super().__init__()
+        self.interval = interval
+        self.compact_bytes = compact_bytes
+        self.autosave = AutosaveService(SAVE_FILENAME)
+        self.recorder: Optional[JournalRecorder] = None
+        self._needs_snapshot = True
+        self.dirty = False
+        self._significant: Optional[str] = None
+        self._last_save = time.monotonic()
+        self._last_position = None
+        self._last_chunk = None
+        self._last_edit_version = 0
+
+    def attach(self, game_state, save_data: Optional[dict] = None) -> None:
+        """
+        Start recording for a new or loaded player. A loaded save whose journal
+        is intact keeps appending to it; anything else starts with a snapshot.
+        """
+        next_item_id = save_data["inventory"]["next_item_id"] if save_data else 0
+        self.recorder = JournalRecorder(game_state.player, game_state.skill_tree, next_item_id,
+                                        game_state.world.overlay)
+        self._needs_snapshot = not save_data or save_data.get("journal_base") is None
+        self.dirty = self._needs_snapshot
+        self._last_position = None
+        self._last_chunk = None
+        self._last_edit_version = game_state.world.overlay.version
+
+    def mark_dirty(self) -> None:
+        self.dirty = True
+        self.autosave.note_request()
+
+    def mark_significant(self, reason: str) -> None:
+        """Save on the next update regardless of the interval (level-up, loot...)."""
+        self.mark_dirty()
+        self._significant = reason
 
     @with_error_handling
     def update(self, game_state) -> None:
-        if game_state.current_state == "game":
-            from ...engine.generics import save_game_data
-            save_game_data({
-                'x': game_state.player.x,
-                'y': game_state.player.y
-            })
-            self.logger.debug("Game state autosaved")
+        if game_state.current_state != "game" or not game_state.player:
+            return
+
+        player = game_state.player
+        position = (player.x, player.y)
+        if position != self._last_position:
+            chunk_size = game_state.world.chunk_size
+            chunk = (player.x // chunk_size, player.y // chunk_size)
+            if self._last_chunk is not None and chunk != self._last_chunk:
+                self.mark_significant("area")
+            else:
+                self.mark_dirty()
+            self._last_position = position
+            self._last_chunk = chunk
+
+        edit_version = game_state.world.overlay.version
+        if edit_version != self._last_edit_version:
+            self.mark_dirty()
+            self._last_edit_version = edit_version
+
+        if not self.dirty:
+            return
+        if self._significant or time.monotonic() - self._last_save >= self.interval:
+            self.save_now(game_state, self._significant or "interval")
+
+    def save_now(self, game_state, reason: str = "manual") -> None:
+        """Capture changes on this thread and hand the write to the autosave thread."""
+        if self.recorder is None or self.recorder.player is not game_state.player:
+            self.attach(game_state)
+
+        if self._needs_snapshot:
+            self.autosave.submit(self._snapshot(game_state))
+            self._needs_snapshot = False
+        else:
+            records = self.recorder.collect()
+            if records:
+                self.autosave.append(records)
+            if reason == "menu" or self.recorder.bytes_since_snapshot >= self.compact_bytes:
+                # The menu reads the snapshot header, so fold the journal in first
+                self.autosave.compact()
+                self.recorder.bytes_since_snapshot = 0
+
+        self.dirty = False
+        self._significant = None
+        self._last_save = time.monotonic()
+        self.logger.debug("Game state autosave queued (%s)", reason)
+
+    def _snapshot(self, game_state) -> bytes:
+        recorder = self.recorder
+        world = game_state.world
+        state = capture(game_state.player, game_state.skill_tree,
+                        world.generator.seed, recorder.next_item_id, world.overlay)
+        recorder.next_item_id = state["inventory"]["next_item_id"]
+        recorder.mark_recorded()
+        recorder.bytes_since_snapshot = 0
+        return encode_state(state)
+
+    def cleanup(self, game_state=None) -> None:
+        # Quitting mid-game (window closed) must not lose changes since the last interval save
+        if (game_state is not None and game_state.player and self.dirty
+                and game_state.current_state != "menu"):
+            self.save_now(game_state, "quit")
+        if self.recorder is not None:
+            self.autosave.compact()
+        self.autosave.flush()
+        self.autosave.close()
+        stats = self.autosave.stats()
+        self.logger.info(
+            "Autosave: %(requested)d requested, %(queued)d queued, %(written)d written, "
+            "%(journal_batches)d journal batches (%(journal_bytes)d bytes), %(compactions)d compactions",
+            stats
+        )
 
 
 class ProgressionSystem(GameSystem):
@@ -100,7 +211,73 @@ class ProgressionSystem(GameSystem):
         if game_state.player.experience >= game_state.player.next_level_exp:
             old_level = game_state.player.level
             game_state.player.level_up()
-            self.logger.info(f"Player leveled up from {old_level} to {game_state.player.level}")
+            self.logger.info("Player leveled up from %d to %d", old_level, game_state.player.level)
+
+
+class ConfigReloadSystem(GameSystem):
+    """
+    Hot-reloads edited config files (ADVENTURE_HOT_RELOAD=1).
+    Only registered when enabled, so normal runs never stat the config dir.
+    Each file rebuilds just the structures derived from it.
+    """
+
+    def __init__(self, poll_interval: float = GameConfig.CONFIG_POLL_INTERVAL):
+        super().__init__()
+        self.poll_interval = poll_interval
+        self.registry = ConfigRegistry()
+        self.reloads = 0
+        self._next_poll = time.monotonic() + poll_interval
+        self._handlers = {
+            "config/biomes.json": self._reload_biomes,
+            "config/monsters.json": self._reload_monsters,
+            "config/items.json": self._reload_loot,
+            "config/prefixes.json": self._reload_loot,
+            "config/descriptions.json": self._reload_loot,
+            "config/skill_trees.json": self._reload_skill_trees,
+            "config/font_support.json": self._reload_fonts,
+        }
+
+    @with_error_handling
+    def update(self, game_state) -> None:
+        now = time.monotonic()
+        if now < self._next_poll:
+            return
+        self._next_poll = now + self.poll_interval
+
+        rebuilt = set()  # Loot files share one rebuild
+        for key, (old, new) in self.registry.reload_changed().items():
+            self.reloads += 1
+            self.logger.info("Reloaded %s", key)
+            handler = self._handlers.get(key)
+            if handler is not None and handler not in rebuilt:
+                rebuilt.add(handler)
+                handler(game_state, old, new)
+
+    def _reload_biomes(self, game_state, old, new) -> None:
+        if game_state.world is not None:
+            evicted = game_state.world.reload_biomes(old, new)
+            self.logger.debug("Evicted %d cached chunks", evicted)
+
+    def _reload_monsters(self, game_state, old, new) -> None:
+        game_state.systems.encounter_system.encounter_manager.reload()
+        game_state.systems.combat_system.combat_manager.reload()
+
+    def _reload_loot(self, game_state, old, new) -> None:
+        game_state.systems.combat_system.combat_manager.loot_generator.reload()
+
+    def _reload_skill_trees(self, game_state, old, new) -> None:
+        game_state.skill_tree.reload()
+        player = game_state.player
+        if player is not None:
+            # Removed skills lose their buff and edited buffs take effect
+            player.stat_pipeline.set_skill_bonus(game_state.skill_tree.unlocked_bonus())
+            player.max_hp = player.calculate_max_hp()
+            player.current_hp = min(player.current_hp, player.max_hp)
+
+    def _reload_fonts(self, game_state, old, new) -> None:
+        game_state.display_manager.font_config.reload()
+        if game_state.world is not None:
+            game_state.world.chunk_cache.clear()  # Every tile's font choice may change
 
 
 class SystemManager:
@@ -112,7 +289,9 @@ class SystemManager:
         self.logger.info("Initializing game systems")
 
         self.systems: Dict[str, GameSystem] = {}
+        self.profiler = FrameProfiler()
         self._init_systems()
+        self._stage_names = {name: f"system:{name}" for name in self.systems}
 
     @with_error_handling
     def _init_systems(self) -> None:
@@ -123,35 +302,39 @@ class SystemManager:
             'save': SaveSystem,
             'progression': ProgressionSystem
         }
+        if self.config.hot_reload:
+            system_classes['config'] = ConfigReloadSystem
 
         for name, system_class in system_classes.items():
             try:
                 self.systems[name] = system_class()
-                self.logger.debug(f"Initialized {name} system")
+                self.logger.debug("Initialized %s system", name)
             except Exception as e:
-                self.logger.error(f"Failed to initialize {name} system: {str(e)}")
+                self.logger.error("Failed to initialize %s system: %s", name, e)
                 raise
 
         # Store commonly accessed systems as properties
         self.combat_system = self.systems['combat']
         self.encounter_system = self.systems['encounter']
+        self.save_system = self.systems['save']
 
     @with_error_handling
     def update(self, game_state) -> None:
         """Update all game systems."""
         for system_name, system in self.systems.items():
             try:
-                system.update(game_state)
+                with self.profiler.stage(self._stage_names[system_name]):
+                    system.update(game_state)
             except Exception as e:
-                self.logger.error(f"Error updating {system_name} system: {str(e)}")
+                self.logger.error("Error updating %s system: %s", system_name, e)
                 raise
 
-    def cleanup(self) -> None:
-        """Clean up all systems."""
+    def cleanup(self, game_state=None) -> None:
+        """Clean up all systems, saving game_state first if it has unsaved changes."""
         self.logger.info("Cleaning up game systems")
         for system_name, system in self.systems.items():
             try:
-                system.cleanup()
-                self.logger.debug(f"Cleaned up {system_name} system")
+                system.cleanup(game_state)
+                self.logger.debug("Cleaned up %s system", system_name)
             except Exception as e:
-                self.logger.error(f"Error cleaning up {system_name} system: {str(e)}")
\ No newline at end of file
+                self.logger.error("Error cleaning up %s system: %s", system_name, e)
\ No newline at end of file
@@ -6,7 +6,9 @@ from ...UI.level_up_ui import LevelUpUI
 from ...UI.inventory_ui import InventoryUI
 from ...UI.combat_log_ui import CombatLogUI
 from ...UI.skill_tree_ui import SkillTreeUI
+from ...UI.profiler_ui import ProfilerUI
 from ...UI.loading_screen import LoadingScreen
+from .font_service import FontService
 
 class UIManager:
     def __init__(self, screen):
@@ -18,11 +20,12 @@ class UIManager:
         self.skill_tree_ui = SkillTreeUI(screen)
         
         self.loading_screen.update(0.4, "Loading combat system...")
-        self.level_up_ui = LevelUpUI(screen, pygame.font.SysFont(None, 32))
-        self.combat_log = CombatLogUI(screen, pygame.font.SysFont(None, 24))
+        self.level_up_ui = LevelUpUI(screen, FontService().get(None, 32))
+        self.combat_log = CombatLogUI(screen, FontService().get(None, 24))
         
         self.loading_screen.update(0.6, "Loading inventory...")
         self.inventory_ui = InventoryUI(screen, combat_log=self.combat_log)
+        self.profiler_ui = ProfilerUI(screen)
         
         self.loading_screen.update(1.0, "Ready!")
 
@@ -45,4 +48,43 @@ class UIManager:
         """Prepare UI for normal game state"""
         self.combat_log.visible = True
         self.inventory_ui.hide()
-        self.level_up_ui.hide()
\ No newline at end of file
+        self.level_up_ui.hide()
+
+
+def _ignore(*args, **kwargs):
+    return None
+
+
+class NullPanel:
+    """Stand-in UI panel that keeps its visibility flag and ignores every call."""
+
+    def __init__(self):
+        self.visible = False
+
+    def __getattr__(self, name):
+        return _ignore
+
+
+class NullUIManager:
+    """UI manager for headless runs without a UI layer."""
+
+    def __init__(self):
+        self.menu = NullPanel()
+        self.combat_ui = NullPanel()
+        self.skill_tree_ui = NullPanel()
+        self.level_up_ui = NullPanel()
+        self.combat_log = NullPanel()
+        self.inventory_ui = NullPanel()
+        self.profiler_ui = NullPanel()
+
+    def show_loading(self, progress: float, message: str):
+        pass
+
+    def reset_ui_state(self):
+        pass
+
+    def show_combat_ui(self):
+        pass
+
+    def show_game_ui(self):
+        pass
\ No newline at end of file
@@ -1,14 +1,25 @@
 """
 Main game engine module, responsible for initializing and coordinating game systems.
 """
-from ..world.world import World
+import time
+import logging
+import threading
+from importlib import import_module
+from concurrent.futures import ThreadPoolExecutor
+
+from ..UI.overlay_pool import OverlayPool
 
 from .core.game_state import GameState
-from .core.ui_manager import UIManager
-from .core.input_manager import InputManager
+from .core.ui_manager import UIManager, NullUIManager
+from .core.input_manager import InputManager, ScriptedInput
 from .core.system_manager import SystemManager
-from .core.display_manager import DisplayManager
+from .core.display_manager import DisplayManager, NullDisplayManager
+from .core.profiler import FrameProfiler, StartupProfiler
+from .core.font_service import FontService
+from .core.event_bus import EventBus
 from .core.services import ConfigService, with_error_handling
+from .config_registry import ConfigRegistry
+from ..config.game_config import GameConfig
 
 class GameEngine:
     """
@@ -16,44 +27,86 @@ class GameEngine:
     Handles initialization, updates, and cleanup of game components.
     """
 
-    def __init__(self):
-        """Initialize game engine and all core systems."""
+    def __init__(self, headless: bool = False, with_ui: bool = True,
+                 input_script: ScriptedInput = None, started_at: float = None):
+        """
+        Initialize game engine and all core systems.
+
+        Args:
+            headless: Run without a window, simulating as fast as possible
+            with_ui: In headless mode, still build and render the UI off-screen
+            input_script: Scripted input replacing the keyboard and mouse
+            started_at: time.perf_counter() at process start, for the startup report
+        """
+        self.startup = StartupProfiler(started_at)
+        startup = self.startup
+        if started_at is not None:
+            startup.record("imports", 0.0, startup.mark("engine"))
+
         # Initialize configuration and logging
         self.config = ConfigService()
         self.logger = self.config.logger
         self.logger.info("Initializing game engine...")
+        # Game events are only formatted into the log in debug mode
+        self._stop_event_log = (EventBus().subscribe(lambda event: self.logger.debug("%s", event))
+                                if self.config.debug_mode else None)
+        self.headless = headless
+        self.with_ui = with_ui or not headless
+        # Shared singletons are built before workers can race to create them
+        FrameProfiler()
+        FontService()
 
         try:
-            # Initialize core systems
-            self.display_manager = self._init_display_manager()
-            self.ui_manager = self._init_ui_manager()
-            self.systems = self._init_system_manager()
-            self.input_manager = InputManager()
+            # Work that does not touch the window runs on workers while the
+            # main thread opens the display and builds the UI
+            with ThreadPoolExecutor(max_workers=4, thread_name_prefix="startup") as pool:
+                font_names = pool.submit(startup.timed("fonts", DisplayManager.resolve_fonts)) if self.with_ui else None
+                config = pool.submit(startup.timed("config", ConfigRegistry().preload))
+                systems = pool.submit(startup.timed("systems", self._init_system_manager))
+                world_module = pool.submit(startup.timed("world import", import_module, "..world.world", __package__))
+
+                with startup.stage("display"):
+                    self.display_manager = self._init_display_manager(font_names)
+                with startup.stage("ui"):
+                    self.ui_manager = self._init_ui_manager()
+                self.input_manager = input_script or InputManager()
+
+                # Store reference to loaded fonts
+                self.fonts = self.display_manager.fonts
 
-            # Store reference to loaded fonts
-            self.fonts = self.display_manager.fonts
+                config.result()
+                self.systems = systems.result()
+                world_module.result()
 
             # Initialize world and game state
-            self.world = self._init_world()
-            self.state = self._init_game_state()
+            with startup.stage("world"):
+                self.world = self._init_world()
+            with startup.stage("state"):
+                self.state = self._init_game_state()
 
             self.logger.info("Game engine initialization complete")
+            if self.logger.is_enabled(logging.DEBUG):
+                self.logger.debug(ConfigRegistry().report())
 
         except Exception as e:
-            self.logger.error(f"Error during game engine initialization: {str(e)}")
+            self.logger.error("Error during game engine initialization: %s", e)
             raise
 
     @with_error_handling
-    def _init_display_manager(self) -> DisplayManager:
-        """Initialize the display manager."""
+    def _init_display_manager(self, font_names=None) -> DisplayManager:
+        """Initialize the display manager, optionally with font names resolving on a worker."""
         self.logger.debug("Initializing display manager...")
-        display_manager = DisplayManager()
+        if not self.with_ui:
+            return NullDisplayManager()
+        display_manager = DisplayManager(headless=self.headless, font_names=font_names)
         return display_manager
 
     @with_error_handling
     def _init_ui_manager(self) -> UIManager:
         """Initialize the UI manager."""
         self.logger.debug("Initializing UI manager...")
+        if not self.with_ui:
+            return NullUIManager()
         self.ui_manager = UIManager(self.display_manager.screen)
         self.ui_manager.show_loading(0.4, "Loading systems...")
         return self.ui_manager
@@ -65,8 +118,9 @@ class GameEngine:
         return SystemManager()
 
     @with_error_handling
-    def _init_world(self) -> World:
+    def _init_world(self):
         """Initialize the game world."""
+        from ..world.world import World
         self.logger.debug("Generating world...")
         self.ui_manager.show_loading(0.6, "Generating world...")
         return World(self)
@@ -87,24 +141,100 @@ class GameEngine:
 
     @with_error_handling
     def run(self):
-        """Main game loop."""
+        """
+        Main game loop.
+        Simulation advances in fixed ticks from an accumulator while rendering
+        runs once per frame, so slow frames never change game speed.
+        """
         self.logger.info("Starting game loop")
         running = True
+        tick_time = 1.0 / GameConfig.TICK_RATE
+        accumulator = 0.0
+        previous = time.perf_counter()
+        profiler = FrameProfiler()
 
         try:
             while running:
-                running = self.input_manager.handle_input(self.state)
-                self.systems.update(self.state)
+                profiler.begin_frame()
+                now = time.perf_counter()
+                accumulator += min(now - previous, GameConfig.MAX_FRAME_TIME)
+                previous = now
+
+                with profiler.stage("input"):
+                    running = self.input_manager.handle_input(self.state)
+
+                while accumulator >= tick_time:
+                    self._simulate_tick()
+                    accumulator -= tick_time
+
+                self.state.interpolation = accumulator / tick_time
                 self._render_frame()
-                self.display_manager.clock.tick(self.config.get_config("game_config")["FPS"])
+                profiler.end_frame()
+                if "first frame" not in self.startup.marks:
+                    self._on_first_frame()
+                self.display_manager.clock.tick(GameConfig.FPS)
 
         except Exception as e:
-            self.logger.error(f"Error in game loop: {str(e)}")
+            self.logger.error("Error in game loop: %s", e)
             raise
 
         finally:
             self.cleanup()
 
+    def _on_first_frame(self):
+        """Report startup, then warm imports the first new game will need."""
+        self.startup.mark("first frame")
+        self.logger.info("First menu frame after %.0f ms", self.startup.marks["first frame"])
+        if self.logger.is_enabled(logging.DEBUG):
+            self.logger.debug(self.startup.report())
+        from ..world.world import prewarm_imports
+        threading.Thread(target=prewarm_imports, name="prewarm", daemon=True).start()
+
+    @with_error_handling
+    def run_headless(self, max_ticks: int = None) -> dict:
+        """
+        Simulation loop for headless runs: one tick per iteration with no frame
+        cap, rendering off-screen only when the UI layer is enabled.
+        Returns tick throughput and the profiler summary.
+        """
+        self.logger.info("Starting headless run")
+        profiler = FrameProfiler()
+        profiler.enabled = True
+        ticks = 0
+        start = time.perf_counter()
+
+        try:
+            while max_ticks is None or ticks < max_ticks:
+                profiler.begin_frame()
+                with profiler.stage("input"):
+                    if not self.input_manager.handle_input(self.state):
+                        break
+                self._simulate_tick()
+                ticks += 1
+                if self.with_ui:
+                    self._render_frame()
+                profiler.end_frame()
+
+        finally:
+            elapsed = time.perf_counter() - start
+            self.logger.info("Headless run: %d ticks in %.2fs (%.0f ticks/s)",
+                             ticks, elapsed, ticks / elapsed if elapsed else 0)
+            self.cleanup()
+
+        return {
+            "ticks": ticks,
+            "elapsed_s": elapsed,
+            "ticks_per_s": ticks / elapsed if elapsed else 0.0,
+            "stages": profiler.summary(),
+        }
+
+    def _simulate_tick(self):
+        """Advance the simulation by one fixed tick."""
+        self.state.begin_tick()
+        with FrameProfiler().stage("movement"):
+            self.input_manager.update(self.state)
+        self.systems.update(self.state)
+
     @with_error_handling
     def _render_frame(self):
         """Render a single frame."""
@@ -119,5 +249,9 @@ class GameEngine:
     def cleanup(self):
         """Clean up resources before exit."""
         self.logger.info("Cleaning up game resources...")
+        self.logger.info(OverlayPool().report())
+        if self._stop_event_log:
+            self._stop_event_log()
+        self.systems.cleanup(self.state)
         self.display_manager.cleanup()
         self.logger.info("Cleanup complete")
\ No newline at end of file
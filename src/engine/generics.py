@@ -7,31 +7,58 @@ def get_project_root() -> str:
     """Get the root directory of the project."""
     return os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+def get_data_dir() -> str:
+    """Per-user data directory: %APPDATA% on Windows, XDG data home elsewhere."""
+    base = os.getenv('APPDATA') or os.getenv('XDG_DATA_HOME') or os.path.join(
+        os.path.expanduser('~'), '.local', 'share'
+    )
+    return os.path.join(base, 'Adventure')
+
 def load_json_config(filename: str, subdirectory: str = "config") -> Dict[str, Any]:
     """
     Load a JSON configuration file from the config directory.
+
+    The file is parsed once per process by ConfigRegistry and every caller
+    shares the same read-only view; copy it before modifying.
     
     Args:
         filename: Name of the JSON file
         subdirectory: Subdirectory within project (default: "config")
     """
-    script_dir = get_project_root()
-    file_path = os.path.join(script_dir, "src", subdirectory, filename)
-    with open(file_path, "r", encoding="utf-8") as f:
-        return json.load(f)
+    from .config_registry import ConfigRegistry
+    return ConfigRegistry().get(filename, subdirectory)
 
-def save_game_data(data: Dict[str, Any], filename: str = "save.json") -> None:
-    """Save game data to the appropriate directory."""
-    save_dir = os.path.join(os.getenv('APPDATA'), 'Adventure')
+def write_save_file(data: bytes, filename: str) -> None:
+    """
+    Write raw save bytes to the data directory.
+    Writes to a temporary file first so a crash never leaves a torn save.
+    """
+    save_dir = get_data_dir()
     os.makedirs(save_dir, exist_ok=True)
     
     save_path = os.path.join(save_dir, filename)
-    with open(save_path, 'w', encoding='utf-8') as f:
-        json.dump(data, f)
+    temp_path = save_path + ".tmp"
+    with open(temp_path, 'wb') as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(temp_path, save_path)
+
+def read_save_file(filename: str) -> Optional[bytes]:
+    """Raw save bytes, or None if there is no such save."""
+    save_path = os.path.join(get_data_dir(), filename)
+    if os.path.exists(save_path):
+        with open(save_path, 'rb') as f:
+            return f.read()
+    return None
+
+def save_game_data(data: Dict[str, Any], filename: str = "save.json") -> None:
+    """Save game data to the appropriate directory."""
+    write_save_file(json.dumps(data).encode('utf-8'), filename)
 
 def load_game_data(filename: str = "save.json") -> Optional[Dict[str, Any]]:
     """Load game data from save file."""
-    save_path = os.path.join(os.getenv('APPDATA'), 'Adventure', filename)
+    save_path = os.path.join(get_data_dir(), filename)
     if os.path.exists(save_path):
         with open(save_path, 'r', encoding='utf-8') as f:
             return json.load(f)
@@ -1,9 +1,10 @@
 import random
+from itertools import chain
+from bisect import bisect_left, bisect_right, insort
 from enum import Enum, auto
-from dataclasses import dataclass
-from typing import Optional, Dict, List
+from typing import Optional, Dict, List, Tuple
 from ..engine.generics import load_json_config
-from ..combat.entity import Entity, EntityType, Stats
+from ..combat.entity import Entity, EntityType, Stats, STAT_INDEX, STAT_NAMES
 
 class ItemType(Enum):
     HELMET = auto()
@@ -17,22 +18,196 @@ class ItemType(Enum):
     GOLD = auto()
     WEAPON = auto()
 
-@dataclass
 class ItemStats(Stats):
-    pass
+    """Stat bonuses from an item; stats it does not list add nothing."""
+
+    __slots__ = ()
+    DEFAULTS = (0,) * len(STAT_NAMES)
+
+class ItemTemplate:
+    """
+    What every item of one kind shares: base name, slot and base stats from
+    items.json. Built once per config load and referenced by each Item, so
+    an item only keeps what was rolled for it.
+    """
+
+    __slots__ = ('base_name', 'item_type', 'base_stats', 'stat_names')
+
+    _custom: Dict[ItemType, "ItemTemplate"] = {}
+
+    def __init__(self, base_name: str, item_type: ItemType, base_stats: Dict[str, int]):
+        self.base_name = base_name
+        self.item_type = item_type
+        self.base_stats = ItemStats(**base_stats)
+        self.stat_names = tuple(base_stats)  # The stats items.json gives this kind of item
+
+    @classmethod
+    def custom(cls, item_type: ItemType) -> "ItemTemplate":
+        """The shared, all-zero template for items made outside items.json (debug spawns, restored saves)."""
+        template = cls._custom.get(item_type)
+        if template is None:
+            template = cls._custom[item_type] = cls("", item_type, {})
+        return template
+
+    def __repr__(self) -> str:
+        return f"ItemTemplate({self.base_name!r}, {self.item_type.name})"
 
 class Item:
+    """
+    An item as its template, quality, rolled stat changes and name parts.
+    The full name and stats are rebuilt from those when asked for.
+    """
+
+    __slots__ = ('template', 'quality', 'deltas', 'name_parts', 'save_id')
+
     def __init__(self, name: str, item_type: ItemType, quality: int, stats: ItemStats):
-        self.name = name
-        self.item_type = item_type
+        self._set(ItemTemplate.custom(item_type), quality, stats, (name,))
+
+    @classmethod
+    def rolled(cls, template: ItemTemplate, quality: int, stats: ItemStats,
+               name_parts: Tuple[str, ...]) -> "Item":
+        item = cls.__new__(cls)
+        item._set(template, quality, stats, name_parts)
+        return item
+
+    def _set(self, template: ItemTemplate, quality: int, stats: ItemStats, name_parts: Tuple[str, ...]) -> None:
+        self.template = template
         self.quality = quality  # 0-4, matching prefixes.json
-        self.stats = stats
-        self.prefixes = load_json_config("prefixes.json")
-        self.full_name = name
+        # (stat index, change from the template) pairs, flattened, for the stats that differ
+        self.deltas = tuple(chain.from_iterable(
+            (index, value - base) for index, (value, base)
+            in enumerate(zip(stats.values, template.base_stats.values)) if value != base
+        ))
+        self.name_parts = name_parts
+        self.save_id: Optional[int] = None  # Stable id used by save snapshots and journal
+
+    @property
+    def name(self) -> str:
+        return " ".join(self.name_parts)
+
+    full_name = name
+
+    @property
+    def item_type(self) -> ItemType:
+        return self.template.item_type
+
+    @property
+    def stats(self) -> ItemStats:
+        """A fresh copy of the item's stats; changing it does not change the item."""
+        stats = self.template.base_stats.copy()
+        values, deltas = stats.values, self.deltas
+        for i in range(0, len(deltas), 2):
+            values[deltas[i]] += deltas[i + 1]
+        return stats
+
+    def stat(self, name: str) -> int:
+        """One stat without building the whole stats copy."""
+        index = STAT_INDEX[name]
+        deltas = self.deltas
+        for i in range(0, len(deltas), 2):
+            if deltas[i] == index:
+                return self.template.base_stats.values[index] + deltas[i + 1]
+        return self.template.base_stats.values[index]
+
+    @property
+    def prefixes(self) -> Dict[str, List[str]]:
+        """The shared prefixes.json view."""
+        return load_json_config("prefixes.json")
 
     def _get_random_prefix(self) -> str:
         return random.choice(self.prefixes[str(self.quality)])
 
+    def __repr__(self) -> str:
+        return f"Item({self.name!r}, {self.item_type.name}, quality={self.quality})"
+
+class InventoryIndex:
+    """
+    Secondary indexes over the backpack, maintained on insert and remove.
+
+    Type and quality buckets are insertion-ordered dicts used as ordered sets,
+    and every stat keeps a sorted list of (value, seq, item) so stat sorting
+    and "has stat" filtering never rescan or re-sort the whole inventory.
+    """
+
+    STAT_NAMES = STAT_NAMES
+    SORT_KEYS = ("type", "quality") + STAT_NAMES
+
+    def __init__(self):
+        self.version = 0
+        self._next_seq = 0
+        self._seq: Dict[Item, int] = {}
+        self.by_type: Dict[ItemType, Dict[Item, None]] = {t: {} for t in ItemType}
+        self.by_quality: Dict[int, Dict[Item, None]] = {}
+        self.by_stat: Dict[str, List[Tuple[int, int, Item]]] = {s: [] for s in self.STAT_NAMES}
+
+    def __contains__(self, item: Item) -> bool:
+        return item in self._seq
+
+    def __len__(self) -> int:
+        return len(self._seq)
+
+    def add(self, item: Item) -> None:
+        seq = self._next_seq
+        self._next_seq += 1
+        self._seq[item] = seq
+        self.by_type[item.item_type][item] = None
+        self.by_quality.setdefault(item.quality, {})[item] = None
+        for stat, value in zip(self.STAT_NAMES, item.stats.values):
+            insort(self.by_stat[stat], (value, seq, item))
+        self.version += 1
+
+    def remove(self, item: Item) -> None:
+        seq = self._seq.pop(item)
+        del self.by_type[item.item_type][item]
+        del self.by_quality[item.quality][item]
+        for stat, value in zip(self.STAT_NAMES, item.stats.values):
+            entries = self.by_stat[stat]
+            entries.pop(bisect_left(entries, (value, seq)))
+        self.version += 1
+
+    def query(self, items: List[Item], item_type: Optional[ItemType] = None,
+              quality: Optional[int] = None, stat: Optional[str] = None,
+              sort_by: Optional[str] = None, descending: bool = True) -> List[Item]:
+        # Start from the smallest candidate set the filters allow
+        candidates = None
+        if item_type is not None:
+            candidates = self.by_type[item_type]
+        if quality is not None:
+            bucket = self.by_quality.get(quality, {})
+            if candidates is None or len(bucket) < len(candidates):
+                candidates = bucket
+        if stat is not None:
+            entries = self.by_stat[stat]
+            positive = entries[bisect_right(entries, (0, self._next_seq)):]
+            if candidates is None or len(positive) < len(candidates):
+                candidates = {entry[2]: None for entry in positive}
+
+        def keep(item: Item) -> bool:
+            return ((item_type is None or item.item_type == item_type) and
+                    (quality is None or item.quality == quality) and
+                    (stat is None or item.stat(stat) > 0))
+
+        if sort_by is None:
+            if candidates is None:
+                return list(items)
+            # Buckets are already in insertion order, stat slices are not
+            return sorted((item for item in candidates if keep(item)), key=self._seq.__getitem__)
+
+        if sort_by == "type":
+            ordered = (item for bucket in self.by_type.values() for item in bucket)
+            result = [item for item in ordered if keep(item)]
+            return result[::-1] if descending else result
+
+        if sort_by == "quality":
+            ordered = (item for q in sorted(self.by_quality, reverse=descending)
+                       for item in self.by_quality[q])
+            return [item for item in ordered if keep(item)]
+
+        entries = self.by_stat[sort_by]
+        if descending:
+            entries = reversed(entries)
+        return [entry[2] for entry in entries if keep(entry[2])]
+
 class Inventory:
     def __init__(self):
         self.equipped: Dict[ItemType, Optional[Item]] = {
@@ -44,8 +219,38 @@ class Inventory:
             ItemType.FEET: None,
         }
         self.rings: List[Optional[Item]] = [None] * 10
+        self.equipment_version = 0  # Bumped on every equip/unequip
+        self._equipment_stats: Optional[Tuple[int, ItemStats]] = None  # (version, summed stats)
         self.items: List[Item] = []
         self.gold = 0
+        self.index = InventoryIndex()
+        self.change_log: Optional[List[Tuple[bool, Item]]] = None  # (added, item), drained by the save journal
+
+    @property
+    def version(self) -> int:
+        """Bumped on every add/remove so views can tell when they are stale."""
+        return self.index.version
+
+    def add_item(self, item: Item) -> None:
+        self.items.append(item)
+        self.index.add(item)
+        if self.change_log is not None:
+            self.change_log.append((True, item))
+
+    def remove_item(self, item: Item) -> bool:
+        if item not in self.index:
+            return False
+        self.items.remove(item)
+        self.index.remove(item)
+        if self.change_log is not None:
+            self.change_log.append((False, item))
+        return True
+
+    def query(self, item_type: Optional[ItemType] = None, quality: Optional[int] = None,
+              stat: Optional[str] = None, sort_by: Optional[str] = None,
+              descending: bool = True) -> List[Item]:
+        """Filtered/sorted view of the backpack, served from the index."""
+        return self.index.query(self.items, item_type, quality, stat, sort_by, descending)
         
     def equip(self, item: Item, slot: Optional[int] = None) -> Optional[Item]:
         if item.item_type == ItemType.RING:
@@ -53,10 +258,12 @@ class Inventory:
                 return None
             old_item = self.rings[slot]
             self.rings[slot] = item
+            self.equipment_version += 1
             return old_item
         
         old_item = self.equipped.get(item.item_type)
         self.equipped[item.item_type] = item
+        self.equipment_version += 1
         return old_item
 
     def unequip(self, item_type: ItemType, slot: Optional[int] = None) -> Optional[Item]:
@@ -65,40 +272,36 @@ class Inventory:
                 return None
             item = self.rings[slot]
             self.rings[slot] = None
+            self.equipment_version += 1
             return item
         
         item = self.equipped.get(item_type)
         self.equipped[item_type] = None
+        self.equipment_version += 1
         return item
 
     def get_total_stats(self) -> ItemStats:
-        total = ItemStats()
-        
-        for item in self.equipped.values():
-            if item:
-                for stat_name, value in item.stats.__dict__.items():
-                    current = getattr(total, stat_name)
-                    setattr(total, stat_name, current + value)
-        
-        for ring in self.rings:
-            if ring:
-                for stat_name, value in ring.stats.__dict__.items():
-                    current = getattr(total, stat_name)
-                    setattr(total, stat_name, current + value)
-        
-        return total
+        """Summed stats of everything equipped, cached until the next equip/unequip."""
+        cached = self._equipment_stats
+        if cached is None or cached[0] != self.equipment_version:
+            total = ItemStats.sum(item.stats for item in chain(self.equipped.values(), self.rings) if item)
+            cached = self._equipment_stats = (self.equipment_version, total)
+        return cached[1]
 
 class Player(Entity):
     def __init__(self, x: int = 0, y: int = 0):
         super().__init__("Player", EntityType.PLAYER, level=1)
         self.x = x
         self.y = y
+        self.prev_x = x  # Position at the start of the current simulation tick
+        self.prev_y = y
         self.speed = 1
         self.inventory = Inventory()
         self.base_stats = Stats(
             strength=10, defence=5, health=20, speed=5, stamina=15,
             dexterity=5, magic_power=5, magic_defence=5, wisdom=5, intelligence=5
         )
+        self.stat_pipeline.equipment = self.inventory
         self.initialize_stats()
         self.experience = 0
         self.next_level_exp = 100
@@ -106,15 +309,17 @@ class Player(Entity):
         self.unlocked_skills = []
 
     def get_total_stats(self) -> Stats:
-        equipment_stats = self.inventory.get_total_stats()
-        total_stats = Stats()
-        
-        for stat_name in self.current_stats.__dict__:
-            base = getattr(self.current_stats, stat_name)
-            bonus = getattr(equipment_stats, stat_name)
-            setattr(total_stats, stat_name, base + bonus)
-            
-        return total_stats
+        """Stats with equipment, skill buffs and effects applied (the same as current_stats)."""
+        return self.stat_pipeline.total
+
+    def begin_tick(self):
+        self.prev_x = self.x
+        self.prev_y = self.y
+
+    def interpolated_position(self, alpha: float) -> tuple[float, float]:
+        """Position blended between the last two simulation ticks for rendering."""
+        return (self.prev_x + (self.x - self.prev_x) * alpha,
+                self.prev_y + (self.y - self.prev_y) * alpha)
 
     def move(self, dx: int, dy: int):
         self.x += dx * self.speed
@@ -1,9 +1,36 @@
+import time
+STARTED_AT = time.perf_counter()  # Before the heavy imports, for the startup report
+
+import argparse
 from src.engine.game_engine import GameEngine
+from src.engine.core.input_manager import ScriptedInput
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Adventure!")
+    parser.add_argument("--headless", action="store_true",
+                        help="run the simulation without a window at maximum speed")
+    parser.add_argument("--no-ui", action="store_true",
+                        help="headless only: skip building and rendering the UI layer")
+    parser.add_argument("--ticks", type=int, default=10_000,
+                        help="headless only: number of scripted simulation ticks")
+    parser.add_argument("--seed", type=int, default=None,
+                        help="headless only: seed for the scripted random walk")
+    return parser.parse_args(argv)
 
-def main():
+def main(argv=None):
+    args = parse_args(argv)
     try:
-        game = GameEngine()
-        game.run()
+        if args.headless:
+            game = GameEngine(
+                headless=True,
+                with_ui=not args.no_ui,
+                input_script=ScriptedInput.random_walk(args.ticks, seed=args.seed),
+                started_at=STARTED_AT
+            )
+            game.run_headless()
+        else:
+            game = GameEngine(started_at=STARTED_AT)
+            game.run()
     except Exception as e:
         import traceback
         with open('error_log.txt', 'w') as f:
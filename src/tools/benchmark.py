@@ -0,0 +1,472 @@
+"""
+Performance benchmarks for the Adventure game.
+
+Run from the project root:
+    python -m src.tools.benchmark            # run everything
+    python -m src.tools.benchmark inventory  # run selected benchmarks
+"""
+import os
+import sys
+import time
+import statistics
+from typing import Any, Callable, Dict, List
+
+# Benchmarks never need a real window
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+FRAME_BUDGET_MS = 1000 / 60
+
+BENCHMARKS: Dict[str, Callable[[], Dict[str, Any]]] = {}
+
+
+def benchmark(name: str):
+    """Register a benchmark function under a command line name."""
+    def decorator(func):
+        BENCHMARKS[name] = func
+        return func
+    return decorator
+
+
+def time_calls(func: Callable[[], Any], repeat: int) -> List[float]:
+    """Call func repeat times and return each call's duration in milliseconds."""
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - start) * 1000)
+    return samples
+
+
+def summarize(samples: List[float]) -> Dict[str, float]:
+    ordered = sorted(samples)
+    return {
+        "mean_ms": statistics.fmean(ordered),
+        "p50_ms": ordered[len(ordered) // 2],
+        "p99_ms": ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))],
+        "max_ms": ordered[-1],
+    }
+
+
+def _init_screen(size=(1920, 1080)):
+    import pygame
+    pygame.init()
+    return pygame.display.set_mode(size)
+
+
+@benchmark("inventory")
+def bench_inventory(item_count: int = 10_000, frames: int = 300) -> Dict[str, Any]:
+    """Inventory UI frame time and index maintenance with a very large backpack."""
+    from ..UI.inventory_ui import InventoryUI
+    from ..engine.player import Player
+
+    screen = _init_screen()
+    player = Player()
+    items = _generate_items(item_count)
+
+    start = time.perf_counter()
+    for item in items:
+        player.inventory.add_item(item)
+    add_us = (time.perf_counter() - start) * 1e6 / item_count
+
+    ui = InventoryUI(screen)
+    ui.visible = True
+    grid_pos = ui.inventory_slots[len(ui.inventory_slots) // 2].center
+
+    def frame():
+        ui.handle_hover(player, grid_pos)
+        ui.render(player)
+
+    # Steady state: scrolling through pages with a stable view
+    def scrolling_frame():
+        ui.change_page(player, 1)
+        frame()
+
+    steady = summarize(time_calls(scrolling_frame, frames))
+
+    # Worst case: the view is rebuilt every frame (sort/filter change or new loot)
+    def rebuild_frame():
+        ui.cycle_sort()
+        frame()
+
+    rebuild = summarize(time_calls(rebuild_frame, len(ui.sort_options) * 4))
+
+    churn_item = items[item_count // 2]
+    churn = summarize(time_calls(
+        lambda: (player.inventory.remove_item(churn_item), player.inventory.add_item(churn_item)),
+        1000
+    ))
+
+    return {
+        "items": item_count,
+        "add_item_us": add_us,
+        "frame": steady,
+        "frame_with_view_rebuild": rebuild,
+        "remove_add_pair": churn,
+        "within_60fps_budget": steady["p99_ms"] < FRAME_BUDGET_MS,
+    }
+
+
+def _generate_items(count: int) -> List[Any]:
+    from ..combat.loot_generator import LootGenerator
+
+    loot = LootGenerator()
+    items = []
+    while len(items) < count:
+        if item := loot._generate_item(10, 5):
+            items.append(item)
+    return items
+
+
+@benchmark("items")
+def bench_items(item_count: int = 20_000, reads: int = 20_000) -> Dict[str, Any]:
+    """Memory retained per generated item, and the cost of reading names and stats back."""
+    import tracemalloc
+
+    _generate_items(1)  # Load item, prefix and description config outside the measurement
+    tracemalloc.start()
+    start = tracemalloc.get_traced_memory()[0]
+    items = _generate_items(item_count)
+    retained = tracemalloc.get_traced_memory()[0] - start
+    tracemalloc.stop()
+
+    sample = items[:reads]
+    name_ms = time_calls(lambda: [item.full_name for item in sample], 1)[0]
+    stats_ms = time_calls(lambda: [item.stats.strength for item in sample], 1)[0]
+    return {
+        "items": item_count,
+        "bytes_per_item": retained / item_count,
+        "full_name_us": name_ms * 1000 / len(sample),
+        "stats_us": stats_ms * 1000 / len(sample),
+    }
+
+
+@benchmark("save")
+def bench_save(item_count: int = 10_000, repeat: int = 20) -> Dict[str, Any]:
+    """
+    Binary save encode/decode/restore for a very large inventory, against plain
+    JSON, and the journal cost of an autosave that only moved the player.
+    """
+    import json
+    from ..engine.player import Player
+    from ..combat.skill_tree import SkillTree
+    from ..engine.core.save_format import encode, decode, restore_player
+    from ..engine.core.save_journal import JournalRecorder
+
+    player = Player()
+    for item in _generate_items(item_count):
+        player.inventory.add_item(item)
+    skill_tree = SkillTree()
+
+    data = encode(player, skill_tree, 1234)
+    state = decode(data)
+    as_json = lambda: json.dumps({
+        "x": player.x, "y": player.y, "gold": player.inventory.gold,
+        "items": [{"name": item.name, "full_name": item.full_name,
+                   "type": item.item_type.value, "quality": item.quality,
+                   "stats": item.stats.as_dict()} for item in player.inventory.items],
+    })
+    json_data = as_json()
+
+    recorder = JournalRecorder(player, skill_tree, item_count)
+
+    def moved_autosave():
+        player.move(1, 0)
+        return recorder.collect()
+
+    move_records = len(moved_autosave())
+
+    return {
+        "items": item_count,
+        "bytes": len(data),
+        "json_bytes": len(json_data),
+        "encode": summarize(time_calls(lambda: encode(player, skill_tree, 1234), repeat)),
+        "decode": summarize(time_calls(lambda: decode(data), repeat)),
+        "restore_player": summarize(time_calls(lambda: restore_player(state), max(1, repeat // 4))),
+        "json_encode": summarize(time_calls(as_json, repeat)),
+        "json_decode": summarize(time_calls(lambda: json.loads(json_data), repeat)),
+        "journal_move_bytes": move_records,
+        "journal_move": summarize(time_calls(moved_autosave, repeat * 10)),
+    }
+
+
+@benchmark("config")
+def bench_config(repeat: int = 20, item_count: int = 1_000) -> Dict[str, Any]:
+    """
+    Loading every config file from JSON, from the binary cache and from the
+    in-process registry, plus the Item constructor that used to re-read
+    prefixes.json.
+    """
+    import tempfile
+    from ..engine.generics import get_project_root, load_json_config
+    from ..engine.config_registry import ConfigRegistry
+
+    config_dir = os.path.join(get_project_root(), "src", "config")
+    names = sorted(name for name in os.listdir(config_dir) if name.endswith(".json"))
+    cache_path = os.path.join(tempfile.mkdtemp(), "config.marshal")
+
+    def fresh_registry(keep_cache: bool):
+        # Bypass the singleton so each pass starts with an empty process cache
+        registry = object.__new__(ConfigRegistry)
+        ConfigRegistry.__init__(registry)
+        registry.cache_path = cache_path
+        if not keep_cache and os.path.exists(cache_path):
+            os.remove(cache_path)
+        return registry
+
+    def load_all(keep_cache: bool):
+        registry = fresh_registry(keep_cache)
+        for name in names:
+            registry.get(name)
+        return registry
+
+    load_all(False)
+    per_file = load_all(True).timings()
+    shared = ConfigRegistry()
+    load_json_config("prefixes.json")
+    items = _generate_items(1)
+
+    return {
+        "files": len(names),
+        "json": summarize(time_calls(lambda: load_all(False), repeat)),
+        "binary_cache": summarize(time_calls(lambda: load_all(True), repeat)),
+        "registry_hit": summarize(time_calls(lambda: [shared.get(name) for name in names], repeat * 10)),
+        "per_file_cache_ms": {key: ms for key, (_, ms) in per_file.items()},
+        f"item_init_x{item_count}": summarize(time_calls(
+            lambda: [type(items[0])(item.name, item.item_type, item.quality, item.stats)
+                     for item in items * item_count], repeat)),
+    }
+
+
+
+@benchmark("combat_sim")
+def bench_combat_sim(fights: int = 1000, scalar_fights: int = 200) -> Dict[str, Any]:
+    """
+    Fights per second through the live CombatManager against the batch
+    simulator, plus a full sweep of every monster at levels 1-10.
+    """
+    from ..combat.combat_manager import CombatManager
+    from ..combat.combat_simulator import BatchCombatSimulator
+    from ..combat.encounter_manager import EncounterManager
+    from ..combat.entity import Entity, EntityType
+    from ..combat.monster_ai import MonsterAI
+    from ..engine.player import Player
+
+    combat_manager, encounter_manager = CombatManager(), EncounterManager()
+    combat_manager.loot_generator.generate_loot = lambda level, meta_level: ([], 0)
+    name, level = "Wolf", 3
+
+    def scalar_fight():
+        player = Player()
+        monster = Entity(name, EntityType.MONSTER, level)
+        monster.base_stats = encounter_manager._generate_base_stats(encounter_manager.monster_data[name], level)
+        monster.initialize_stats()
+        combat_manager.current_encounter = (player, monster)
+        combat_manager.determine_turn_order()
+        combat_manager.monster_ai = MonsterAI(monster, combat_manager.policies[name])
+        for _ in range(100):
+            for attacker in combat_manager.turn_order:
+                defender = monster if attacker is player else player
+                combat_manager.process_turn(attacker, defender, "attack")
+                if player.current_hp <= 0 or monster.current_hp <= 0:
+                    return
+
+    simulator = BatchCombatSimulator(seed=1)
+    player = Player()
+    scalar_ms = statistics.fmean(time_calls(scalar_fight, scalar_fights))
+    batch_ms = statistics.fmean(time_calls(lambda: simulator.simulate(player, name, level, fights), 5))
+    sweep_ms = time_calls(lambda: simulator.sweep(player, range(1, 11), fights=fights), 1)[0]
+    return {
+        "scalar_fights_per_s": 1000 / scalar_ms,
+        "batch_fights_per_s": fights * 1000 / batch_ms,
+        f"sweep_{len(simulator.monster_data)}x10x{fights}_ms": sweep_ms,
+    }
+
+
+@benchmark("stats")
+def bench_stats(reads: int = 100_000, changes: int = 10_000) -> Dict[str, Any]:
+    """Cached derived-stat reads against the rebuilds an equip or level-up triggers."""
+    from ..engine.player import Item, ItemType, Player
+
+    player = Player()
+    for item_type, item in zip((t for t in ItemType if t in player.inventory.equipped), _generate_items(6)):
+        player.inventory.equip(Item(item.full_name, item_type, item.quality, item.stats))
+    for slot, item in enumerate(_generate_items(10)):
+        player.inventory.equip(Item(item.full_name, ItemType.RING, item.quality, item.stats), slot)
+    helmet = player.inventory.equipped[ItemType.HELMET]
+
+    def per_call_us(func: Callable[[], Any], calls: int) -> float:
+        start = time.perf_counter()
+        for _ in range(calls):
+            func()
+        return (time.perf_counter() - start) * 1e6 / calls
+
+    def equip():
+        player.inventory.equip(helmet)
+        return player.current_stats
+
+    return {
+        "cached_read_us": per_call_us(lambda: player.current_stats, reads),
+        "equip_and_read_us": per_call_us(equip, changes),
+        "initialize_and_read_us": per_call_us(lambda: (player.initialize_stats(), player.current_stats), changes),
+    }
+
+
+@benchmark("encounters")
+def bench_encounters(steps: int = 100_000) -> Dict[str, Any]:
+    """Per-step encounter check cost on a walk through every biome, ignoring encounter spacing."""
+    from ..combat.encounter_manager import EncounterManager
+    from ..engine.generics import RandomUtils
+
+    RandomUtils.set_seed(1)
+    manager = EncounterManager()
+    biomes = sorted(manager.spawn_tables)
+    walk = [((i * 7) % 1200 - 600, (i * 13) % 1200 - 600, biomes[i % len(biomes)]) for i in range(steps)]
+
+    encounters = 0
+    start = time.perf_counter()
+    for x, y, biome in walk:
+        manager.last_encounter_coords = None
+        encounters += manager.should_encounter((x, y), biome)[0]
+    elapsed = time.perf_counter() - start
+    return {
+        "steps": steps,
+        "step_us": elapsed * 1e6 / steps,
+        "encounter_rate": encounters / steps,
+    }
+
+
+@benchmark("logging")
+def bench_logging(calls: int = 2_000, burst: int = 20_000) -> Dict[str, Any]:
+    """
+    Per-call cost on the game thread of an info() with arguments, through
+    the queued GameLogger and through console/file handlers called directly
+    (the previous setup), plus a disabled debug() call. Calls come in
+    frame-sized batches of 10; a final burst shows the drop policy.
+    """
+    import logging
+    import tempfile
+    from ..engine.core.services import GameLogger
+
+    log_dir = tempfile.mkdtemp()
+    devnull = open(os.devnull, "w")
+
+    queued = GameLogger(name="bench.queued", log_path=os.path.join(log_dir, "queued.log"))
+    queued.logger.propagate = False
+    queued.handlers[0].setStream(devnull)
+
+    direct = logging.getLogger("bench.direct")
+    direct.propagate = False
+    direct.setLevel(logging.INFO)
+    for handler in (logging.StreamHandler(devnull), logging.FileHandler(os.path.join(log_dir, "direct.log"))):
+        handler.setFormatter(queued.handlers[0].formatter)
+        direct.addHandler(handler)
+
+    def per_call_us(log):
+        elapsed = 0.0
+        for frame in range(calls // 10):
+            start = time.perf_counter()
+            for i in range(10):
+                log("Triggering encounter with %s in %s", "Wolf", i)
+            elapsed += time.perf_counter() - start
+            time.sleep(FRAME_BUDGET_MS / 1000)
+        return elapsed * 1e6 / calls
+
+    direct_us = per_call_us(direct.info)
+    queued_us = per_call_us(queued.info)
+    disabled_us = per_call_us(queued.debug)
+    start = time.perf_counter()
+    for i in range(burst):
+        queued.info("Burst record %d", i)
+    burst_us = (time.perf_counter() - start) * 1e6 / burst
+    drain_start = time.perf_counter()
+    queued.close()
+    result = {
+        "direct_info_us": direct_us,
+        "queued_info_us": queued_us,
+        "disabled_debug_us": disabled_us,
+        f"burst_x{burst}_info_us": burst_us,
+        "burst_dropped": queued.dropped,
+        "drain_ms": (time.perf_counter() - drain_start) * 1000,
+    }
+    for handler in direct.handlers:
+        handler.close()
+    devnull.close()
+    return result
+
+_STARTUP_CHILD = """
+import time
+started_at = time.perf_counter()
+import os, sys, json
+from src.engine.game_engine import GameEngine
+engine = GameEngine(headless=True, started_at=started_at)
+engine._render_frame()
+engine._on_first_frame()
+stages = {}
+for name, _, _, duration in engine.startup.stages:
+    stages[name] = stages.get(name, 0.0) + duration
+print(json.dumps({"first_frame": engine.startup.marks["first frame"], "stages": stages}))
+sys.stdout.flush()
+os._exit(0)
+"""
+
+
+@benchmark("startup")
+def bench_startup(runs: int = 5) -> Dict[str, Any]:
+    """
+    Time to the first menu frame in fresh processes, measured from the
+    first line of the process, with per-stage startup timings.
+    """
+    import json
+    import subprocess
+    from ..engine.generics import get_project_root
+
+    root = get_project_root()
+    env = dict(os.environ, PYTHONPATH=root)
+    first_frames, process_ms = [], []
+    stages: Dict[str, List[float]] = {}
+    for _ in range(runs):
+        start = time.perf_counter()
+        output = subprocess.run([sys.executable, "-c", _STARTUP_CHILD], cwd=root, env=env,
+                                capture_output=True, text=True, check=True).stdout
+        process_ms.append((time.perf_counter() - start) * 1000)
+        result = json.loads(output.strip().splitlines()[-1])
+        first_frames.append(result["first_frame"])
+        for name, duration in result["stages"].items():
+            stages.setdefault(name, []).append(duration)
+
+    return {
+        "runs": runs,
+        "first_menu_frame": summarize(first_frames),
+        "process_wall": summarize(process_ms),
+        "stages_p50_ms": {name: sorted(samples)[len(samples) // 2] for name, samples in stages.items()},
+    }
+
+
+def _print_result(name: str, result: Dict[str, Any], indent: int = 0):
+    pad = " " * indent
+    print(f"{pad}{name}:")
+    for key, value in result.items():
+        if isinstance(value, dict):
+            _print_result(key, value, indent + 2)
+        elif isinstance(value, float):
+            print(f"{pad}  {key}: {value:.3f}")
+        else:
+            print(f"{pad}  {key}: {value}")
+
+
+def main(argv: List[str] = None):
+    names = argv if argv else list(BENCHMARKS)
+    unknown = [name for name in names if name not in BENCHMARKS]
+    if unknown:
+        print(f"Unknown benchmarks: {', '.join(unknown)}")
+        print(f"Available: {', '.join(BENCHMARKS)}")
+        return 1
+
+    for name in names:
+        _print_result(name, BENCHMARKS[name]())
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -1,15 +1,25 @@
 import threading
 import numpy as np
 from typing import Dict, Tuple
-from scipy.ndimage import gaussian_filter
 from concurrent.futures import ThreadPoolExecutor
 
 from .world_chunk import WorldChunk
+from .world_overlay import WorldOverlay, TileEdit
 from .terrain_generator import TerrainGenerator
 
 from ..engine.generics import RandomUtils
 from ..config.game_config import GameConfig
 
+def gaussian_filter(array: np.ndarray, sigma: float) -> np.ndarray:
+    # scipy.ndimage takes ~200 ms to import, so it stays off the startup path
+    # until the first chunk is generated (or prewarm_imports runs)
+    from scipy.ndimage import gaussian_filter as _gaussian_filter
+    return _gaussian_filter(array, sigma=sigma)
+
+def prewarm_imports() -> None:
+    """Import chunk generation's heavy dependencies ahead of the first chunk."""
+    import scipy.ndimage  # noqa: F401
+
 class ChunkCache:
     def __init__(self, max_size: int = 100):
         self.max_size = max_size
@@ -26,24 +36,66 @@ class ChunkCache:
                 self.chunks.pop(next(iter(self.chunks)))
             self.chunks[key] = chunk
 
+    def clear(self):
+        with self._lock:
+            self.chunks.clear()
+
+    def evict(self, predicate) -> int:
+        """Drop every cached chunk the predicate matches; returns how many went."""
+        with self._lock:
+            stale = [key for key, chunk in self.chunks.items() if predicate(chunk)]
+            for key in stale:
+                del self.chunks[key]
+        return len(stale)
+
 class World:
     def __init__(self, engine, chunk_size: int = 20):
         self.biomes = {}
-        self._font_cache = {}
         self.game_engine = engine
         self.chunk_size = chunk_size
         self.chunk_cache = ChunkCache()
         self.generator = TerrainGenerator()
+        self.overlay = WorldOverlay(chunk_size)
         self.terrain_executor = ThreadPoolExecutor(max_workers=2)
-        self.chunk_executor = ThreadPoolExecutor(max_workers=4)
-        
-        self._font_lock = threading.Lock()
+
+        # Per-biome glyph tables, rebuilt when the biomes or font coverage change
+        self._tile_tables: Dict[str, tuple] = {}
+        self._tile_tables_source = (None, None)
+
+    def set_seed(self, seed: int):
+        """Regenerate from a saved seed; every cached chunk belongs to the old world."""
+        if seed != self.generator.seed:
+            self.generator.seed = seed
+            self.chunk_cache.clear()
+            self.overlay.load({})
 
     def _load_biomes(self):
         if not self.biomes:
             self.biomes = GameConfig.load_biomes()
         return self.biomes
 
+    def reload_biomes(self, old_biomes, new_biomes) -> int:
+        """
+        Swap in edited biome definitions and evict only the cached chunks they
+        affect. A changed climate range can move biome borders anywhere, so it
+        evicts everything; changed chars or colours only evict chunks that
+        contain an edited biome. Returns the number of chunks evicted.
+        """
+        self.biomes = new_biomes
+        changed = {name for name in old_biomes.keys() | new_biomes.keys()
+                   if old_biomes.get(name) != new_biomes.get(name)}
+        if not changed:
+            return 0
+
+        ranges = ("elevation", "temperature", "humidity")
+        if any(name not in old_biomes or name not in new_biomes or
+               any(old_biomes[name].get(key) != new_biomes[name].get(key) for key in ranges)
+               for name in changed):
+            return self.chunk_cache.evict(lambda chunk: True)
+        return self.chunk_cache.evict(
+            lambda chunk: any(biome in changed for row in chunk.biomes for biome in row)
+        )
+
     def get_chunk(self, chunk_x: int, chunk_y: int) -> WorldChunk:
         chunk_key = (chunk_x, chunk_y)
         chunk = self.chunk_cache.get(chunk_key)
@@ -53,10 +105,37 @@ class World:
         return chunk
 
     def get_tile(self, world_x: int, world_y: int) -> tuple:
+        edit = self.overlay.get(world_x, world_y)
+        if edit is not None:
+            return edit[0]
         chunk_x, local_x = divmod(world_x, self.chunk_size)
         chunk_y, local_y = divmod(world_y, self.chunk_size)
         return self.get_chunk(chunk_x, chunk_y).terrain[local_y][local_x]
 
+    def get_biome(self, world_x: int, world_y: int) -> str:
+        edit = self.overlay.get(world_x, world_y)
+        if edit is not None and edit[2] is not None:
+            return edit[2]
+        chunk_x, local_x = divmod(world_x, self.chunk_size)
+        chunk_y, local_y = divmod(world_y, self.chunk_size)
+        return self.get_chunk(chunk_x, chunk_y).get_biome(local_x, local_y)
+
+    def set_tile(self, world_x: int, world_y: int, char: str, color: tuple,
+                 font_name: str = None, biome: str = None):
+        """
+        Change one tile (dug, built, burned...). The generated chunk is left
+        untouched; only the overlay and that chunk's version change.
+        """
+        if font_name is None:
+            font_name = self._get_font_name(char)
+        self.overlay.set_tile(world_x, world_y, ((char, tuple(color)), font_name, biome))
+
+    def clear_tile(self, world_x: int, world_y: int):
+        self.overlay.clear_tile(world_x, world_y)
+
+    def load_edits(self, edits: Dict[Tuple[int, int], TileEdit]):
+        self.overlay.load(edits)
+
     def _generate_terrain_maps(self, base_pos: tuple) -> Dict[str, np.ndarray]:
         elevation = self.generator.generate_noise_map(
             self.chunk_size, self.chunk_size, 
@@ -115,37 +194,49 @@ class World:
 
         return candidates[0] if candidates else "grassland"
 
-    def _generate_tile(self, biome: str, params: dict) -> tuple:
-        if not self.biomes:
-            self.biomes = self._load_biomes()
-        biome_data = self.biomes[biome]
-        char = self._get_valid_char(biome_data["chars"])
-        color = list(self._get_valid_color(biome_data["colors"]))
-        return (char, tuple(self._adjust_color(color, params))), self._get_font_name(char), biome
-
-    def _get_valid_char(self, chars: list) -> str:
-        with self._font_lock:
-            # Randomly select a character from the list
-            char = RandomUtils.choice(chars)
-        
-            # Ensure the font exists for this character
-            if char not in self._font_cache:
-                self._font_cache[char] = True
-        
-            return char
+    def _tile_table(self, biome: str) -> tuple:
+        """
+        A biome's characters pre-resolved against font coverage, as
+        (glyph/font pairs, fonts per glyph, offset of each glyph's first pair).
+        """
+        font_config = self.game_engine.display_manager.font_config
+        source, version = self._tile_tables_source
+        if source is not self.biomes or version != font_config.version:
+            self._tile_tables = {}
+            self._tile_tables_source = (self.biomes, font_config.version)
+
+        table = self._tile_tables.get(biome)
+        if table is None:
+            glyphs = font_config.resolve_glyphs(self.biomes[biome]["chars"])
+            pairs = [(char, font_name) for char, fonts in glyphs for font_name in fonts]
+            counts = np.array([len(fonts) for _, fonts in glyphs])
+            offsets = np.concatenate(([0], np.cumsum(counts)[:-1]))
+            table = (pairs, counts, offsets)
+            self._tile_tables[biome] = table
+        return table
 
-    def _get_valid_color(self, colors: list) -> tuple:
-        return [max(0, min(255, c + np.random.randint(-10, 11))) for c in colors[0]]
+    @staticmethod
+    def _pick_glyphs(counts: np.ndarray, offsets: np.ndarray, n: int) -> np.ndarray:
+        """Pair indices for n tiles: a uniform glyph, then a uniform font that has it."""
+        glyph = np.random.randint(0, len(counts), n)
+        return offsets[glyph] + (np.random.random(n) * counts[glyph]).astype(int)
 
-    def _adjust_color(self, color: list, params: dict) -> list:
-        brightness = 1.0 + (params["elevation"] - 0.5) * 0.4
-        color = [int(c * brightness) for c in color]
-        color[2] = min(255, color[2] + int(params["humidity"] * 20))
-        color[0] = min(255, color[0] + int(params["temperature"] * 20))
-        return [min(255, max(0, c)) for c in color]
+    @staticmethod
+    def _tile_colors(base: tuple, elevation: np.ndarray, temperature: np.ndarray,
+                     humidity: np.ndarray) -> np.ndarray:
+        """Jittered biome colour shaded by elevation and tinted by climate, one row per tile."""
+        color = np.clip(np.asarray(base) + np.random.randint(-10, 11, (len(elevation), 3)), 0, 255)
+        brightness = 1.0 + (elevation - 0.5) * 0.4
+        color = np.trunc(color * brightness[:, None]).astype(int)
+        color[:, 2] = np.minimum(255, color[:, 2] + np.trunc(humidity * 20).astype(int))
+        color[:, 0] = np.minimum(255, color[:, 0] + np.trunc(temperature * 20).astype(int))
+        return np.clip(color, 0, 255)
 
     def _get_font_name(self, char: str) -> str:
-        return RandomUtils.choice(list(self.game_engine.fonts.keys()))
+        """A random loaded font that has a glyph for char."""
+        font_config = self.game_engine.display_manager.font_config
+        fonts = font_config.fonts_in(font_config.char_masks.get(char, 0))
+        return RandomUtils.choice(fonts) if fonts else font_config.font_names[0]
 
     def _generate_chunk(self, chunk_x: int, chunk_y: int) -> WorldChunk:
         chunk = WorldChunk(self.chunk_size)
@@ -154,24 +245,32 @@ class World:
         elevation = self._generate_terrain_maps(base_pos)
         climate = self._generate_climate_maps(base_pos)
         rivers = self.generator.generate_rivers(elevation["base"], self.chunk_size, self.chunk_size)
+        if not self.biomes:
+            self.biomes = self._load_biomes()
 
-        futures = []
+        tiles_by_biome: Dict[str, Tuple[list, list]] = {}
         for y in range(self.chunk_size):
             for x in range(self.chunk_size):
                 biome = self._determine_biome(climate, elevation, rivers, x, y)
-                params = {
-                    "elevation": elevation["base"][y, x],
-                    "temperature": climate["temperature"][y, x],
-                    "humidity": climate["humidity"][y, x]
-                }
-                futures.append((x, y, self.chunk_executor.submit(self._generate_tile, biome, params)))
+                xs, ys = tiles_by_biome.setdefault(biome, ([], []))
+                xs.append(x)
+                ys.append(y)
 
-        for x, y, future in futures:
-            tile_data = future.result()
-            chunk.set_tile(x, y, *tile_data)
+        # Glyphs, fonts and colours are picked for all of a biome's tiles at once
+        for biome, (xs, ys) in tiles_by_biome.items():
+            pairs, counts, offsets = self._tile_table(biome)
+            picks = self._pick_glyphs(counts, offsets, len(xs))
+            colors = self._tile_colors(
+                self.biomes[biome]["colors"][0],
+                elevation["base"][ys, xs],
+                climate["temperature"][ys, xs],
+                climate["humidity"][ys, xs],
+            ).tolist()
+            for x, y, pick, color in zip(xs, ys, picks.tolist(), colors):
+                char, font_name = pairs[pick]
+                chunk.set_tile(x, y, (char, tuple(color)), font_name, biome)
 
         return chunk
 
     def __del__(self):
-        self.terrain_executor.shutdown()
-        self.chunk_executor.shutdown()
\ No newline at end of file
+        self.terrain_executor.shutdown()
\ No newline at end of file
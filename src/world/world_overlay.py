@@ -0,0 +1,83 @@
+from typing import Dict, List, Optional, Tuple
+
+# ((char, color), font_name, biome) - the same shape WorldChunk.set_tile takes
+TileEdit = Tuple[Tuple[str, Tuple[int, int, int]], Optional[str], Optional[str]]
+
+class WorldOverlay:
+    """
+    Sparse store of player-made tile changes on top of the generated world.
+
+    Edits are grouped by chunk so readers fetch one small dict per chunk, and
+    generated chunks are never copied or modified. Memory grows only with the
+    number of edited tiles.
+    """
+
+    def __init__(self, chunk_size: int):
+        self.chunk_size = chunk_size
+        self.chunks: Dict[Tuple[int, int], Dict[Tuple[int, int], TileEdit]] = {}
+        self.chunk_versions: Dict[Tuple[int, int], int] = {}
+        self.version = 0  # Bumped on every edit anywhere
+        self.change_log: Optional[List[Tuple[int, int]]] = None  # Touched world tiles, drained by the save journal
+
+    def __len__(self) -> int:
+        return sum(len(edits) for edits in self.chunks.values())
+
+    def _locate(self, world_x: int, world_y: int):
+        chunk_x, local_x = divmod(world_x, self.chunk_size)
+        chunk_y, local_y = divmod(world_y, self.chunk_size)
+        return (chunk_x, chunk_y), (local_x, local_y)
+
+    def _touch(self, chunk_key: Tuple[int, int], world_x: int, world_y: int) -> None:
+        self.chunk_versions[chunk_key] = self.chunk_versions.get(chunk_key, 0) + 1
+        self.version += 1
+        if self.change_log is not None:
+            self.change_log.append((world_x, world_y))
+
+    def set_tile(self, world_x: int, world_y: int, edit: TileEdit) -> Tuple[int, int]:
+        """Record an edit and return the key of the chunk it touched."""
+        chunk_key, local = self._locate(world_x, world_y)
+        self.chunks.setdefault(chunk_key, {})[local] = edit
+        self._touch(chunk_key, world_x, world_y)
+        return chunk_key
+
+    def clear_tile(self, world_x: int, world_y: int) -> Optional[Tuple[int, int]]:
+        """Revert a tile to its generated state."""
+        chunk_key, local = self._locate(world_x, world_y)
+        edits = self.chunks.get(chunk_key)
+        if not edits or local not in edits:
+            return None
+        del edits[local]
+        if not edits:
+            del self.chunks[chunk_key]
+        self._touch(chunk_key, world_x, world_y)
+        return chunk_key
+
+    def chunk_edits(self, chunk_key: Tuple[int, int]) -> Optional[Dict[Tuple[int, int], TileEdit]]:
+        """Edits in one chunk keyed by local (x, y), or None if it is untouched."""
+        return self.chunks.get(chunk_key)
+
+    def get(self, world_x: int, world_y: int) -> Optional[TileEdit]:
+        chunk_key, local = self._locate(world_x, world_y)
+        edits = self.chunks.get(chunk_key)
+        return edits.get(local) if edits else None
+
+    def chunk_version(self, chunk_key: Tuple[int, int]) -> int:
+        """Bumped on every edit in the chunk; per-chunk caches key on it."""
+        return self.chunk_versions.get(chunk_key, 0)
+
+    def items(self):
+        """((world_x, world_y), edit) for every edited tile."""
+        for (chunk_x, chunk_y), edits in self.chunks.items():
+            for (local_x, local_y), edit in edits.items():
+                yield (chunk_x * self.chunk_size + local_x, chunk_y * self.chunk_size + local_y), edit
+
+    def load(self, edits: Dict[Tuple[int, int], TileEdit]) -> None:
+        """Replace every edit, e.g. from a save. Not recorded in the change log."""
+        for chunk_key in self.chunks:
+            self.chunk_versions[chunk_key] = self.chunk_versions.get(chunk_key, 0) + 1
+        self.chunks = {}
+        self.version += 1
+        for (world_x, world_y), edit in edits.items():
+            chunk_key, local = self._locate(world_x, world_y)
+            self.chunks.setdefault(chunk_key, {})[local] = edit
+            self.chunk_versions[chunk_key] = self.chunk_versions.get(chunk_key, 0) + 1
\ No newline at end of file